@@ -21,9 +21,13 @@ class BaseTextArtifact(BaseArtifact):
     def embedding(self) -> Optional[list[float]]:
         return None if len(self._embedding) == 0 else self._embedding
 
-    def generate_embedding(self, driver: BaseEmbeddingDriver) -> Optional[list[float]]:
+    @embedding.setter
+    def embedding(self, value: Optional[list[float]]) -> None:
         self._embedding.clear()
-        self._embedding.extend(driver.embed_string(str(self.value)))
+        self._embedding.extend(value or [])
+
+    def generate_embedding(self, driver: BaseEmbeddingDriver) -> Optional[list[float]]:
+        self.embedding = driver.embed_string(str(self.value))
 
         return self.embedding
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Optional
+from bisect import bisect_left
+from itertools import accumulate
+from typing import TYPE_CHECKING, Optional
 
 from attrs import Attribute, Factory, define, field
 
@@ -9,10 +11,17 @@ from griptape.artifacts import TextArtifact
 from griptape.chunkers import ChunkSeparator
 from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
 
 @define
 class BaseChunker(ABC):
     DEFAULT_SEPARATORS = [ChunkSeparator(" ")]
+    # Spans whose estimated token count is within this many tokens of `max_tokens` are counted exactly, since
+    # tokenizing a span on its own can give a few more or fewer tokens at its edges.
+    TOKEN_OFFSETS_MARGIN = 16
 
     separators: list[ChunkSeparator] = field(
         default=Factory(lambda self: self.DEFAULT_SEPARATORS, takes_self=True),
@@ -26,16 +35,295 @@ class BaseChunker(ABC):
         default=Factory(lambda self: self.tokenizer.max_input_tokens, takes_self=True),
         kw_only=True,
     )
+    window_size: int = field(default=1_000_000, kw_only=True)
 
     @max_tokens.validator  # pyright: ignore[reportAttributeAccessIssue]
     def validate_max_tokens(self, _: Attribute, max_tokens: int) -> None:
         if max_tokens < 0:
             raise ValueError("max_tokens must be 0 or greater.")
 
+    @window_size.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_window_size(self, _: Attribute, window_size: int) -> None:
+        if window_size < 1:
+            raise ValueError("window_size must be 1 or greater.")
+
     def chunk(self, text: TextArtifact | str) -> list[TextArtifact]:
         text = text.value if isinstance(text, TextArtifact) else text
+        token_offsets = self.tokenizer.token_offsets(text)
+
+        if token_offsets is None:
+            chunks = self._chunk_recursively(text)
+        else:
+            chunks = self._chunk_by_token_offsets(text, token_offsets)
+
+        return [TextArtifact(c) for c in chunks]
+
+    def iter_chunks(self, source: Iterable[str] | TextIO) -> Iterator[TextArtifact]:
+        """Chunks text as it is read, keeping at most about `window_size` characters of it in memory.
+
+        Whenever `window_size` characters are buffered, the buffer is cut at the last occurrence of the first separator
+        found in its first `window_size` characters, and the text before the cut is chunked with `chunk()`. Chunks can
+        therefore differ from chunking the whole text at once around those cuts.
+
+        Args:
+            source: Pieces of the text, or a file opened in text mode.
+
+        Returns:
+            The chunks, in order, yielded as soon as their window has been chunked.
+        """
+        if isinstance(source, str):
+            pieces = iter([source])
+        elif hasattr(source, "read"):
+            pieces = iter(lambda: source.read(self.window_size), "")  # pyright: ignore[reportAttributeAccessIssue]
+        else:
+            pieces = iter(source)
+
+        buffered_pieces = []
+        buffered_size = 0
+
+        for piece in pieces:
+            buffered_pieces.append(piece)
+            buffered_size += len(piece)
+
+            if buffered_size >= self.window_size:
+                buffer = "".join(buffered_pieces)
+
+                while len(buffer) >= self.window_size:
+                    window_end = self.__find_window_end(buffer)
+                    window = buffer[:window_end].rstrip()
+                    buffer = buffer[window_end:].lstrip()
+
+                    if window:
+                        yield from self.chunk(window)
+
+                buffered_pieces = [buffer]
+                buffered_size = len(buffer)
+
+        buffer = "".join(buffered_pieces)
+
+        if buffer.strip():
+            yield from self.chunk(buffer)
+
+    def __find_window_end(self, buffer: str) -> int:
+        for separator in self.separators:
+            separator_start = buffer.rfind(separator.value, 1, self.window_size)
+
+            if separator_start != -1:
+                # A prefix separator starts the next window, and any other separator ends this one.
+                return separator_start if separator.is_prefix else separator_start + len(separator.value)
+
+        # If none of the separators occur in the window, cut it at `window_size`.
+        return self.window_size
+
+    def _chunk_by_token_offsets(self, text: str, token_offsets: list[int]) -> list[str]:
+        """Splits `text` like `_chunk_recursively()`, tokenizing it once instead of at every level.
+
+        The token count of a span is estimated from `token_offsets`, and the token count of each subchunk is counted
+        once per separator and reused at every level. Spans are only tokenized again when their estimated count is close
+        to `max_tokens`, so every chunk is still checked against the exact count.
+
+        `_chunk_recursively()` rebuilds both halves of a split from their subchunks, which collapses repeated
+        separators. Halves that aren't slices of the text they were split from are rebuilt the same way and tokenized
+        on their own.
+
+        Args:
+            text: The text to chunk.
+            token_offsets: The offset of the first character of each token of `text`.
+
+        Returns:
+            The chunks, in order.
+        """
+        chunks = []
+        # Spans left to chunk, as (text, its token offsets and subchunk token counts, start, end, index of the first
+        # separator to try, whether to strip the span).
+        spans = [(text, token_offsets, {}, 0, len(text), 0, False)]
+
+        while spans:
+            text, token_offsets, subchunk_token_counts, start, end, separator_index, strip = spans.pop()
+
+            if strip:
+                while start < end and text[start].isspace():
+                    start += 1
+                while end > start and text[end - 1].isspace():
+                    end -= 1
+
+            token_count = bisect_left(token_offsets, end) - bisect_left(token_offsets, start)
+            is_exact = False
+
+            if token_count <= self.max_tokens + self.TOKEN_OFFSETS_MARGIN:
+                token_count = self.tokenizer.count_tokens(text[start:end])
+                is_exact = True
+
+                if token_count <= self.max_tokens:
+                    chunks.append(text[start:end])
+
+                    continue
+
+            split = self.__find_balanced_split(
+                text,
+                start,
+                end,
+                separator_index,
+                token_count,
+                is_exact=is_exact,
+                subchunk_token_counts=subchunk_token_counts,
+            )
+
+            if split is None and end - start < 2:
+                # A single character that is longer than `max_tokens` can't be split any further.
+                chunks.append(text[start:end])
+            elif split is None:
+                # If none of the separators result in a balanced split, split the span in half.
+                midpoint = start + (end - start) // 2
+
+                spans.extend(
+                    [
+                        (text, token_offsets, subchunk_token_counts, midpoint, end, 0, False),
+                        (text, token_offsets, subchunk_token_counts, start, midpoint, 0, False),
+                    ]
+                )
+            else:
+                separator_index, subchunks, balance_index = split
+                separator = self.separators[separator_index]
+                halves = [
+                    (subchunks[balance_index][2], end, subchunks[balance_index + 1 :]),
+                    (start, subchunks[balance_index][2], subchunks[: balance_index + 1]),
+                ]
+
+                for half_start, half_end, half_subchunks in halves:
+                    half = self.__join_subchunks(text, separator, half_subchunks, is_first=half_start == start)
+
+                    if half == text[half_start:half_end]:
+                        spans.append(
+                            (text, token_offsets, subchunk_token_counts, half_start, half_end, separator_index, True)
+                        )
+                    else:
+                        half_token_offsets = self.tokenizer.token_offsets(half) or []
+
+                        spans.append((half, half_token_offsets, {}, 0, len(half), separator_index, True))
+
+        return chunks
+
+    def __join_subchunks(
+        self, text: str, separator: ChunkSeparator, subchunks: list[tuple[int, int, int]], *, is_first: bool
+    ) -> str:
+        """Joins subchunks back into one half of a split, the way `_chunk_recursively()` does."""
+        joined = separator.value.join(
+            text[subchunk_start:subchunk_end] for subchunk_start, subchunk_end, _ in subchunks
+        )
+
+        if separator.is_prefix:
+            return separator.value + joined
+        else:
+            return joined + separator.value if is_first else joined
+
+    def __find_balanced_split(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        separator_index: int,
+        token_count: int,
+        *,
+        is_exact: bool,
+        subchunk_token_counts: dict[tuple[int, int, int], int],
+    ) -> Optional[tuple[int, list[tuple[int, int, int]], int]]:
+        """Finds where to split a span so the token counts of its two halves are as close as possible.
+
+        If `token_count` is an estimate and the split would change anywhere within `TOKEN_OFFSETS_MARGIN` of it, the
+        span is counted exactly so the split is the one `_chunk_recursively()` would make.
+
+        Returns:
+            The index of the separator to split on, the subchunks it splits the span into, and the index of the last
+            subchunk of the first half, or `None` if no separator splits the span.
+        """
+        for index in range(separator_index, len(self.separators)):
+            separator = self.separators[index]
+            subchunks = self.__find_subchunks(text, start, end, separator)
+
+            if len(subchunks) > 1:
+                # Subchunks are counted with their separator, the way `_chunk_recursively()` counts them.
+                missing_subchunks = [
+                    (subchunk_start, subchunk_end)
+                    for subchunk_start, subchunk_end, _ in subchunks
+                    if (index, subchunk_start, subchunk_end) not in subchunk_token_counts
+                ]
+                missing_counts = self.tokenizer.count_tokens_batch(
+                    [
+                        separator.value + text[subchunk_start:subchunk_end]
+                        if separator.is_prefix
+                        else text[subchunk_start:subchunk_end] + separator.value
+                        for subchunk_start, subchunk_end in missing_subchunks
+                    ]
+                )
+
+                for (subchunk_start, subchunk_end), count in zip(missing_subchunks, missing_counts):
+                    subchunk_token_counts[(index, subchunk_start, subchunk_end)] = count
+
+                prefix_token_counts = list(
+                    accumulate(
+                        subchunk_token_counts[(index, subchunk_start, subchunk_end)]
+                        for subchunk_start, subchunk_end, _ in subchunks
+                    )
+                )
+
+                if not is_exact and self.__find_balance_index(
+                    prefix_token_counts, (token_count - self.TOKEN_OFFSETS_MARGIN) // 2
+                ) != self.__find_balance_index(prefix_token_counts, (token_count + self.TOKEN_OFFSETS_MARGIN) // 2):
+                    token_count = self.tokenizer.count_tokens(text[start:end])
+
+                balance_index = self.__find_balance_index(prefix_token_counts, token_count // 2)
+
+                return index, subchunks, balance_index
+
+        return None
+
+    def __find_balance_index(self, prefix_token_counts: list[int], half_token_count: int) -> int:
+        """Returns the index of the first subchunk whose cumulative token count is closest to `half_token_count`.
+
+        The index never decreases as `half_token_count` grows, since `prefix_token_counts` is strictly increasing.
+        """
+        index = bisect_left(prefix_token_counts, half_token_count)
+
+        if index == len(prefix_token_counts) or (
+            index > 0
+            and half_token_count - prefix_token_counts[index - 1] <= prefix_token_counts[index] - half_token_count
+        ):
+            return index - 1
+        else:
+            return index
+
+    def __find_subchunks(
+        self, text: str, start: int, end: int, separator: ChunkSeparator
+    ) -> list[tuple[int, int, int]]:
+        """Splits a span on a separator, skipping empty subchunks like `str.split()` followed by `filter(None, ...)`.
+
+        Returns:
+            The start and end of each subchunk without its separator, and the index where the span can be split after
+            the subchunk.
+        """
+        subchunks = []
+        subchunk_start = start
+
+        while subchunk_start <= end:
+            separator_start = text.find(separator.value, subchunk_start, end)
+            subchunk_end = end if separator_start == -1 else separator_start
+
+            if subchunk_end > subchunk_start:
+                # A prefix separator belongs to the next subchunk, and any other separator to this one.
+                if separator.is_prefix or separator_start == -1:
+                    split_index = subchunk_end
+                else:
+                    split_index = subchunk_end + len(separator.value)
+
+                subchunks.append((subchunk_start, subchunk_end, split_index))
+
+            if separator_start == -1:
+                break
+
+            subchunk_start = separator_start + len(separator.value)
 
-        return [TextArtifact(c) for c in self._chunk_recursively(text)]
+        return subchunks
 
     def _chunk_recursively(self, chunk: str, current_separator: Optional[ChunkSeparator] = None) -> list[str]:
         token_count = self.tokenizer.count_tokens(chunk)
@@ -60,12 +348,17 @@ class BaseChunker(ABC):
 
                 # Check if the split resulted in more than one subchunk.
                 if len(subchunks) > 1:
-                    # Iterate through the subchunks and calculate token counts.
-                    for index, subchunk in enumerate(subchunks):
-                        if index < len(subchunks):
-                            subchunk = separator.value + subchunk if separator.is_prefix else subchunk + separator.value
+                    # Calculate the token counts of all the subchunks in one batch.
+                    subchunk_token_counts = self.tokenizer.count_tokens_batch(
+                        [
+                            separator.value + subchunk if separator.is_prefix else subchunk + separator.value
+                            for subchunk in subchunks
+                        ]
+                    )
 
-                        tokens_count += self.tokenizer.count_tokens(subchunk)
+                    # Iterate through the subchunks and accumulate their token counts.
+                    for index, subchunk_token_count in enumerate(subchunk_token_counts):
+                        tokens_count += subchunk_token_count
 
                         # Update the best split if the current one is more balanced.
                         if abs(tokens_count - half_token_count) < balance_diff:
@@ -11,6 +11,10 @@ from .prompt.google_prompt_driver import GooglePromptDriver
 from .prompt.dummy_prompt_driver import DummyPromptDriver
 from .prompt.ollama_prompt_driver import OllamaPromptDriver
 
+from .prompt_cache.base_prompt_cache_driver import BasePromptCacheDriver
+from .prompt_cache.local_prompt_cache_driver import LocalPromptCacheDriver
+from .prompt_cache.redis_prompt_cache_driver import RedisPromptCacheDriver
+
 from .memory.conversation.base_conversation_memory_driver import BaseConversationMemoryDriver
 from .memory.conversation.local_conversation_memory_driver import LocalConversationMemoryDriver
 from .memory.conversation.amazon_dynamodb_conversation_memory_driver import AmazonDynamoDbConversationMemoryDriver
@@ -28,6 +32,7 @@ from .embedding.google_embedding_driver import GoogleEmbeddingDriver
 from .embedding.dummy_embedding_driver import DummyEmbeddingDriver
 from .embedding.cohere_embedding_driver import CohereEmbeddingDriver
 from .embedding.ollama_embedding_driver import OllamaEmbeddingDriver
+from .embedding.cached_embedding_driver import CachedEmbeddingDriver
 
 from .vector.base_vector_store_driver import BaseVectorStoreDriver
 from .vector.local_vector_store_driver import LocalVectorStoreDriver
@@ -144,6 +149,9 @@ __all__ = [
     "GooglePromptDriver",
     "DummyPromptDriver",
     "OllamaPromptDriver",
+    "BasePromptCacheDriver",
+    "LocalPromptCacheDriver",
+    "RedisPromptCacheDriver",
     "BaseConversationMemoryDriver",
     "LocalConversationMemoryDriver",
     "AmazonDynamoDbConversationMemoryDriver",
@@ -160,6 +168,7 @@ __all__ = [
     "DummyEmbeddingDriver",
     "CohereEmbeddingDriver",
     "OllamaEmbeddingDriver",
+    "CachedEmbeddingDriver",
     "BaseVectorStoreDriver",
     "LocalVectorStoreDriver",
     "PineconeVectorStoreDriver",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
@@ -27,6 +27,7 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         session: Optionally provide custom `boto3.Session`.
         tokenizer: Optionally provide custom `BedrockCohereTokenizer`.
         bedrock_client: Optionally provide custom `bedrock-runtime` client.
+        max_batch_size: Maximum number of texts in a single request. Defaults to 96.
     """
 
     DEFAULT_MODEL = "cohere.embed-english-v3"
@@ -43,8 +44,13 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         kw_only=True,
     )
 
+    max_batch_size: Optional[int] = field(default=96, kw_only=True)
+
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        payload = {"input_type": self.input_type, "texts": [chunk]}
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        payload = {"input_type": self.input_type, "texts": chunks}
 
         response = self.bedrock_client.invoke_model(
             body=json.dumps(payload),
@@ -54,4 +60,4 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         )
         response_body = json.loads(response.get("body").read())
 
-        return response_body.get("embeddings")[0]
+        return response_body.get("embeddings")
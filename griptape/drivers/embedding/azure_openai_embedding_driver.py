@@ -21,6 +21,8 @@ class AzureOpenAiEmbeddingDriver(OpenAiEmbeddingDriver):
         api_version: An Azure OpenAi API version.
         tokenizer: An `OpenAiTokenizer`.
         client: An `openai.AzureOpenAI` client.
+        max_batch_size: Maximum number of inputs in a single embeddings request. Defaults to 16, the limit of older
+            Azure OpenAi API versions.
     """
 
     azure_deployment: str = field(
@@ -36,6 +38,7 @@ class AzureOpenAiEmbeddingDriver(OpenAiEmbeddingDriver):
         metadata={"serializable": False},
     )
     api_version: str = field(default="2023-05-15", kw_only=True, metadata={"serializable": True})
+    max_batch_size: Optional[int] = field(default=16, kw_only=True)
     tokenizer: OpenAiTokenizer = field(
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True),
         kw_only=True,
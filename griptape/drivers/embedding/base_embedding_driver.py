@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 import numpy as np
-from attrs import define, field
+from attrs import Factory, define, field
 
+from griptape import utils
 from griptape.chunkers import BaseChunker, TextChunker
 from griptape.mixins import EventPublisherMixin, ExponentialBackoffMixin, SerializableMixin
 
 if TYPE_CHECKING:
+    from concurrent import futures
+
     from griptape.artifacts import TextArtifact
     from griptape.tokenizers import BaseTokenizer
+    from griptape.utils import RateLimiter, SingleFlight
 
 
 @define
@@ -21,32 +26,169 @@ class BaseEmbeddingDriver(EventPublisherMixin, SerializableMixin, ExponentialBac
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        max_batch_size: Maximum number of strings sent in a single `try_embed_chunks()` request. `None` if the driver
+            can't embed several strings in one request, in which case `embed_strings()` embeds them concurrently.
+        max_batch_tokens: Maximum number of tokens sent in a single `try_embed_chunks()` request.
+        futures_executor_fn: Creates the executor used to send `embed_strings()` requests concurrently.
+        rate_limiter: Blocks requests until they fit in the requests-per-minute and tokens-per-minute budgets of
+            `rate_limit_key`. Share one Rate Limiter between Drivers to give them a common budget.
+        single_flight: Coalesces concurrent `embed_string()` calls for the same string, so callers wait for the request
+            already in flight instead of sending a duplicate. Share one Single Flight between Drivers to coalesce across
+            them.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: Optional[BaseTokenizer] = field(default=None, kw_only=True)
+    max_batch_size: Optional[int] = field(default=None, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=None, kw_only=True)
+    futures_executor_fn: Callable[[], futures.Executor] = field(
+        default=Factory(lambda: lambda: utils.ExecutionContext.current_executor()),
+        kw_only=True,
+    )
+    rate_limiter: Optional[RateLimiter] = field(default=None, kw_only=True)
+    single_flight: Optional[SingleFlight] = field(default=None, kw_only=True)
     chunker: Optional[BaseChunker] = field(init=False)
 
     def __attrs_post_init__(self) -> None:
         self.chunker = TextChunker(tokenizer=self.tokenizer) if self.tokenizer else None
 
+    @property
+    def rate_limit_key(self) -> str:
+        return f"{self.__class__.__name__}/{self.model}"
+
     def embed_text_artifact(self, artifact: TextArtifact) -> list[float]:
         return self.embed_string(artifact.to_text())
 
     def embed_string(self, string: str) -> list[float]:
+        if self.single_flight is None:
+            return self._embed_string(string)
+
+        return self.single_flight.do(self.request_key(string), lambda: self._embed_string(string))[0]
+
+    def request_key(self, string: str) -> str:
+        """Returns a hash of the request that embedding `string` sends, for coalescing identical requests."""
+        return utils.str_to_hash(
+            "\0".join(
+                str(value)
+                for value in (self.__class__.__name__, self.model, getattr(self, "input_type", None), string)
+                if value is not None
+            )
+        )
+
+    def _embed_string(self, string: str) -> list[float]:
         for attempt in self.retrying():
             with attempt:
                 if self.tokenizer and self.tokenizer.count_tokens(string) > self.tokenizer.max_input_tokens:
                     return self._embed_long_string(string)
                 else:
-                    return self.try_embed_chunk(string)
+                    self._acquire_rate_limit([string])
+
+                    with utils.ExecutionContext.current_limit("embedding"):
+                        return self.try_embed_chunk(string)
 
         else:
             raise RuntimeError("Failed to embed string.")
 
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embeds several strings, packing as many of them into each request as `max_batch_size` and `max_batch_tokens` allow.
+
+        Strings longer than the tokenizer's `max_input_tokens` are embedded on their own with `embed_string()`.
+
+        Returns:
+            The embeddings, in the same order as `strings`.
+        """
+        with self.futures_executor_fn() as executor:
+            if self.max_batch_size is None:
+                return utils.execute_futures_list([executor.submit(self.embed_string, string) for string in strings])
+
+            embeddings: list[Optional[list[float]]] = [None] * len(strings)
+            batches, long_indexes = self._pack_batches(strings)
+
+            batch_futures = [
+                executor.submit(self._embed_batch, [strings[index] for index in batch]) for batch in batches
+            ]
+            long_futures = [executor.submit(self.embed_string, strings[index]) for index in long_indexes]
+
+            for batch, batch_embeddings in zip(batches, utils.execute_futures_list(batch_futures)):
+                if len(batch_embeddings) != len(batch):
+                    raise ValueError(f"Expected {len(batch)} embeddings, got {len(batch_embeddings)}.")
+
+                for index, embedding in zip(batch, batch_embeddings):
+                    embeddings[index] = embedding
+
+            for index, embedding in zip(long_indexes, utils.execute_futures_list(long_futures)):
+                embeddings[index] = embedding
+
+        return embeddings  # pyright: ignore[reportReturnType]
+
+    async def aembed_string(self, string: str) -> list[float]:
+        """Async counterpart of `embed_string`, run in a worker thread."""
+        return await asyncio.to_thread(self.embed_string, string)
+
+    async def aembed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Async counterpart of `embed_strings`, run in a worker thread."""
+        return await asyncio.to_thread(self.embed_strings, strings)
+
     @abstractmethod
     def try_embed_chunk(self, chunk: str) -> list[float]: ...
 
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        """Embeds several chunks in a single request.
+
+        Drivers that set `max_batch_size` should override this with their multi-input request.
+        """
+        return [self.try_embed_chunk(chunk) for chunk in chunks]
+
+    def _embed_batch(self, chunks: list[str]) -> list[list[float]]:
+        for attempt in self.retrying():
+            with attempt:
+                self._acquire_rate_limit(chunks)
+
+                with utils.ExecutionContext.current_limit("embedding"):
+                    return self.try_embed_chunks(chunks)
+        else:
+            raise RuntimeError("Failed to embed strings.")
+
+    def _acquire_rate_limit(self, chunks: list[str]) -> None:
+        if self.rate_limiter is not None:
+            tokens = sum(self.tokenizer.count_tokens_batch(chunks)) if self.tokenizer else 0
+
+            self.rate_limiter.acquire(self.rate_limit_key, tokens)
+
+    def _pack_batches(self, strings: list[str]) -> tuple[list[list[int]], list[int]]:
+        """Packs the indexes of `strings` into batches that fit the driver's request limits.
+
+        Returns:
+            The batches, and the indexes of the strings that have to be embedded on their own.
+        """
+        batches = []
+        long_indexes = []
+        batch = []
+        batch_tokens = 0
+
+        token_counts = self.tokenizer.count_tokens_batch(strings) if self.tokenizer else [0] * len(strings)
+
+        for index, tokens in enumerate(token_counts):
+            if self.tokenizer and tokens > self.tokenizer.max_input_tokens:
+                long_indexes.append(index)
+                continue
+
+            if batch and (
+                len(batch) >= self.max_batch_size  # pyright: ignore[reportOperatorIssue]
+                or (self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens)
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+
+            batch.append(index)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches, long_indexes
+
     def _embed_long_string(self, string: str) -> list[float]:
         """Embeds a string that is too long to embed in one go.
 
@@ -57,7 +199,10 @@ class BaseEmbeddingDriver(EventPublisherMixin, SerializableMixin, ExponentialBac
         embedding_chunks = []
         length_chunks = []
         for chunk in chunks:
-            embedding_chunks.append(self.try_embed_chunk(chunk.value))
+            self._acquire_rate_limit([chunk.value])
+
+            with utils.ExecutionContext.current_limit("embedding"):
+                embedding_chunks.append(self.try_embed_chunk(chunk.value))
             length_chunks.append(len(chunk))
 
         # generate weighted averages
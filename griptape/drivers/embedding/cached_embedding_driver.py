@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from attrs import Factory, define, field
+
+from griptape.drivers import BaseEmbeddingDriver
+
+if TYPE_CHECKING:
+    from griptape.tokenizers import BaseTokenizer
+
+
+@define
+class CachedEmbeddingDriver(BaseEmbeddingDriver):
+    """Embedding Driver that caches the embeddings of another Embedding Driver.
+
+    Embeddings are keyed by a hash of `cache_namespace` and the embedded text, so repeated strings are only embedded
+    once. Cached embeddings are stored as float32 in an in-memory LRU tier, and optionally in a SQLite file that is
+    shared between runs.
+
+    Attributes:
+        embedding_driver: Embedding Driver used to embed strings that aren't cached.
+        model: Model of `embedding_driver`.
+        tokenizer: Tokenizer of `embedding_driver`.
+        cache_namespace: Included in every cache key. Defaults to the model of `embedding_driver`, along with its
+            `input_type` if it has one.
+        max_cache_bytes: Maximum size of the embeddings kept in memory. Least recently used embeddings are evicted first.
+        persist_file: Optional path of a SQLite file used as a second cache tier.
+        memory_hits: Number of embeddings found in memory.
+        disk_hits: Number of embeddings found in `persist_file`.
+        misses: Number of embeddings generated by `embedding_driver`.
+    """
+
+    # Keeps a single SQLite statement under the default limit of bound parameters.
+    SQLITE_BATCH_SIZE = 500
+
+    embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    model: str = field(
+        default=Factory(lambda self: self.embedding_driver.model, takes_self=True),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+    tokenizer: Optional[BaseTokenizer] = field(
+        default=Factory(lambda self: self.embedding_driver.tokenizer, takes_self=True),
+        kw_only=True,
+    )
+    cache_namespace: str = field(
+        default=Factory(
+            lambda self: ":".join(
+                str(value)
+                for value in (self.embedding_driver.model, getattr(self.embedding_driver, "input_type", None))
+                if value is not None
+            ),
+            takes_self=True,
+        ),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+    max_cache_bytes: int = field(default=64 * 1024 * 1024, kw_only=True, metadata={"serializable": True})
+    persist_file: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
+    memory_hits: int = field(default=0, init=False)
+    disk_hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _memory_cache: OrderedDict[str, np.ndarray] = field(factory=OrderedDict, init=False)
+    _memory_cache_bytes: int = field(default=0, init=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _thread_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def embed_string(self, string: str) -> list[float]:
+        return self.embed_strings([string])[0]
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        keys = [self._cache_key(string) for string in strings]
+        embeddings = self._load_embeddings(list(dict.fromkeys(keys)))
+        missing_strings = {key: string for key, string in zip(keys, strings) if key not in embeddings}
+
+        if missing_strings:
+            new_embeddings = {
+                key: np.asarray(embedding, dtype=np.float32)
+                for key, embedding in zip(
+                    missing_strings.keys(), self.embedding_driver.embed_strings(list(missing_strings.values()))
+                )
+            }
+
+            self._store_embeddings(new_embeddings)
+            embeddings.update(new_embeddings)
+
+        return [embeddings[key].tolist() for key in keys]
+
+    def try_embed_chunk(self, chunk: str) -> list[float]:
+        return self.embedding_driver.try_embed_chunk(chunk)
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.embedding_driver.try_embed_chunks(chunks)
+
+    def clear_cache(self) -> None:
+        """Removes every cached embedding, from memory and from `persist_file`."""
+        with self._thread_lock:
+            self._memory_cache.clear()
+            self._memory_cache_bytes = 0
+
+            if self.persist_file is not None:
+                connection = self._get_connection()
+                connection.execute("DELETE FROM embeddings")
+                connection.commit()
+
+    def _cache_key(self, string: str) -> str:
+        return hashlib.sha256(f"{self.cache_namespace}\0{string}".encode()).hexdigest()
+
+    def _load_embeddings(self, keys: list[str]) -> dict[str, np.ndarray]:
+        embeddings = {}
+
+        with self._thread_lock:
+            for key in keys:
+                embedding = self._memory_cache.get(key)
+
+                if embedding is not None:
+                    self._memory_cache.move_to_end(key)
+                    embeddings[key] = embedding
+
+            self.memory_hits += len(embeddings)
+
+            if self.persist_file is not None:
+                disk_keys = [key for key in keys if key not in embeddings]
+                connection = self._get_connection()
+
+                for i in range(0, len(disk_keys), self.SQLITE_BATCH_SIZE):
+                    batch = disk_keys[i : i + self.SQLITE_BATCH_SIZE]
+                    rows = connection.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({', '.join('?' * len(batch))})",  # noqa: S608
+                        batch,
+                    ).fetchall()
+
+                    for key, vector in rows:
+                        embedding = np.frombuffer(vector, dtype=np.float32)
+                        embeddings[key] = embedding
+                        self._remember(key, embedding)
+                        self.disk_hits += 1
+
+            self.misses += len(keys) - len(embeddings)
+
+        return embeddings
+
+    def _store_embeddings(self, embeddings: dict[str, np.ndarray]) -> None:
+        with self._thread_lock:
+            for key, embedding in embeddings.items():
+                self._remember(key, embedding)
+
+            if self.persist_file is not None:
+                connection = self._get_connection()
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, embedding.tobytes()) for key, embedding in embeddings.items()],
+                )
+                connection.commit()
+
+    def _remember(self, key: str, embedding: np.ndarray) -> None:
+        previous_embedding = self._memory_cache.pop(key, None)
+
+        if previous_embedding is not None:
+            self._memory_cache_bytes -= previous_embedding.nbytes
+
+        if embedding.nbytes > self.max_cache_bytes:
+            return
+
+        self._memory_cache[key] = embedding
+        self._memory_cache_bytes += embedding.nbytes
+
+        while self._memory_cache_bytes > self.max_cache_bytes:
+            _, evicted_embedding = self._memory_cache.popitem(last=False)
+            self._memory_cache_bytes -= evicted_embedding.nbytes
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.persist_file)  # pyright: ignore[reportArgumentType, reportCallIssue]
+
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # Access is serialized by `_thread_lock`, so the connection can be shared between threads.
+            self._connection = sqlite3.connect(self.persist_file, check_same_thread=False)  # pyright: ignore[reportArgumentType]
+            self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)")
+            self._connection.commit()
+
+        return self._connection
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from attrs import Factory, define, field
 
@@ -22,6 +22,7 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
         client: Custom `cohere.Client`.
         tokenizer: Custom `CohereTokenizer`.
         input_type: Cohere embedding input type.
+        max_batch_size: Maximum number of texts in a single embed request. Defaults to 96.
     """
 
     DEFAULT_MODEL = "models/embedding-001"
@@ -37,11 +38,15 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
     )
 
     input_type: str = field(kw_only=True, metadata={"serializable": True})
+    max_batch_size: Optional[int] = field(default=96, kw_only=True)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        result = self.client.embed(texts=[chunk], model=self.model, input_type=self.input_type)
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        result = self.client.embed(texts=chunks, model=self.model, input_type=self.input_type)
 
         if isinstance(result.embeddings, list):
-            return result.embeddings[0]
+            return result.embeddings
         else:
             raise ValueError("Non-float embeddings are not supported.")
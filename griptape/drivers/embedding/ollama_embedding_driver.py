@@ -19,6 +19,7 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
         model: Ollama embedding model name.
         host: Optional Ollama host.
         client: Ollama `Client`.
+        max_batch_size: Maximum number of inputs in a single embed request. Defaults to 512.
     """
 
     model: str = field(kw_only=True, metadata={"serializable": True})
@@ -28,5 +29,10 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
         kw_only=True,
     )
 
+    max_batch_size: Optional[int] = field(default=512, kw_only=True)
+
     def try_embed_chunk(self, chunk: str) -> list[float]:
         return list(self.client.embeddings(model=self.model, prompt=chunk)["embedding"])
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return [list(embedding) for embedding in self.client.embed(model=self.model, input=chunks)["embeddings"]]
@@ -25,6 +25,8 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         azure_ad_token: An optional Azure Active Directory token.
         azure_ad_token_provider: An optional Azure Active Directory token provider.
         api_version: An Azure OpenAi API version.
+        max_batch_size: Maximum number of inputs in a single embeddings request. Defaults to 2048.
+        max_batch_tokens: Maximum number of tokens in a single embeddings request. Defaults to 300,000.
     """
 
     DEFAULT_MODEL = "text-embedding-3-small"
@@ -43,13 +45,23 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True),
         kw_only=True,
     )
+    max_batch_size: Optional[int] = field(default=2048, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=300_000, kw_only=True)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
+        return self.client.embeddings.create(**self._params(self._clean_chunk(chunk))).data[0].embedding
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        response = self.client.embeddings.create(**self._params([self._clean_chunk(chunk) for chunk in chunks]))
+
+        return [data.embedding for data in response.data]
+
+    def _clean_chunk(self, chunk: str) -> str:
         # Address a performance issue in older ada models
         # https://github.com/openai/openai-python/issues/418#issuecomment-1525939500
         if self.model.endswith("001"):
             chunk = chunk.replace("\n", " ")
-        return self.client.embeddings.create(**self._params(chunk)).data[0].embedding
+        return chunk
 
-    def _params(self, chunk: str) -> dict:
+    def _params(self, chunk: str | list[str]) -> dict:
         return {"input": chunk, "model": self.model}
@@ -19,6 +19,8 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         tokenizer: Optionally provide custom `VoyageAiTokenizer`.
         client: Optionally provide custom VoyageAI `Client`.
         input_type: VoyageAI input type. Defaults to `document`.
+        max_batch_size: Maximum number of texts in a single embed request. Defaults to 128.
+        max_batch_tokens: Maximum number of tokens in a single embed request. Defaults to 120,000.
     """
 
     DEFAULT_MODEL = "voyage-large-2"
@@ -36,6 +38,11 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
         kw_only=True,
     )
     input_type: str = field(default="document", kw_only=True, metadata={"serializable": True})
+    max_batch_size: Optional[int] = field(default=128, kw_only=True)
+    max_batch_tokens: Optional[int] = field(default=120_000, kw_only=True)
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        return self.client.embed([chunk], model=self.model, input_type=self.input_type).embeddings[0]
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.client.embed(chunks, model=self.model, input_type=self.input_type).embeddings
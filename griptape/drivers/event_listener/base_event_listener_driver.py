@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from concurrent import futures
 from typing import TYPE_CHECKING, Callable
 
 from attrs import Factory, define, field
 
+from griptape import utils
+
 if TYPE_CHECKING:
+    from concurrent import futures
+
     from griptape.events import BaseEvent
 
 logger = logging.getLogger(__name__)
@@ -16,7 +19,7 @@ logger = logging.getLogger(__name__)
 @define
 class BaseEventListenerDriver(ABC):
     futures_executor_fn: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
+        default=Factory(lambda: lambda: utils.ExecutionContext.current_executor("events")),
         kw_only=True,
     )
     batched: bool = field(default=True, kw_only=True)
@@ -22,6 +22,7 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
         azure_ad_token_provider: An optional Azure Active Directory token provider.
         api_version: An Azure OpenAi API version.
         client: An `openai.AzureOpenAI` client.
+        async_client: An `openai.AsyncAzureOpenAI` client, used by `arun`.
     """
 
     azure_deployment: str = field(
@@ -51,6 +52,21 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
             takes_self=True,
         ),
     )
+    async_client: openai.AsyncAzureOpenAI = field(
+        default=Factory(
+            lambda self: openai.AsyncAzureOpenAI(
+                organization=self.organization,
+                api_key=self.api_key,
+                api_version=self.api_version,
+                azure_endpoint=self.azure_endpoint,
+                azure_deployment=self.azure_deployment,
+                azure_ad_token=self.azure_ad_token,
+                azure_ad_token_provider=self.azure_ad_token_provider,
+            ),
+            takes_self=True,
+        ),
+        kw_only=True,
+    )
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = super()._base_params(prompt_stack)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from concurrent import futures
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
 
+from griptape import utils
 from griptape.common import (
     ActionCallDeltaMessageContent,
     ActionCallMessageContent,
@@ -14,15 +20,24 @@ from griptape.common import (
     PromptStack,
     TextDeltaMessageContent,
     TextMessageContent,
+    ToolAction,
     observable,
 )
-from griptape.events import CompletionChunkEvent, FinishPromptEvent, StartPromptEvent
+from griptape.events import (
+    CompletionChunkEvent,
+    FinishPromptEvent,
+    PromptCacheHitEvent,
+    PromptCacheMissEvent,
+    StartPromptEvent,
+)
 from griptape.mixins import EventPublisherMixin, ExponentialBackoffMixin, SerializableMixin
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
+    from griptape.drivers import BasePromptCacheDriver
     from griptape.tokenizers import BaseTokenizer
+    from griptape.utils import RateLimiter, SingleFlight
 
 
 @define(kw_only=True)
@@ -38,6 +53,12 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, EventPublishe
         tokenizer: An instance of `BaseTokenizer` to when calculating tokens.
         stream: Whether to stream the completion or not. `CompletionChunkEvent`s will be published to the `Structure` if one is provided.
         use_native_tools: Whether to use LLM's native function calling capabilities. Must be supported by the model.
+        rate_limiter: Blocks requests until they fit in the requests-per-minute and tokens-per-minute budgets of
+            `rate_limit_key`. Share one Rate Limiter between Drivers to give them a common budget.
+        prompt_cache_driver: Caches the Messages generated for each `cache_key()`, so identical requests are only
+            sent once. Cached Messages are replayed as `CompletionChunkEvent`s when streaming.
+        single_flight: Coalesces concurrent runs with the same `cache_key()`, so callers wait for the request already in
+            flight instead of sending a duplicate. Share one Single Flight between Drivers to coalesce across them.
     """
 
     temperature: float = field(default=0.1, metadata={"serializable": True})
@@ -47,6 +68,13 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, EventPublishe
     tokenizer: BaseTokenizer
     stream: bool = field(default=False, kw_only=True, metadata={"serializable": True})
     use_native_tools: bool = field(default=False, kw_only=True, metadata={"serializable": True})
+    rate_limiter: Optional[RateLimiter] = field(default=None, kw_only=True)
+    prompt_cache_driver: Optional[BasePromptCacheDriver] = field(default=None, kw_only=True)
+    single_flight: Optional[SingleFlight] = field(default=None, kw_only=True)
+
+    @property
+    def rate_limit_key(self) -> str:
+        return f"{self.__class__.__name__}/{self.model}"
 
     def before_run(self, prompt_stack: PromptStack) -> None:
         self.publish_event(StartPromptEvent(model=self.model, prompt_stack=prompt_stack))
@@ -62,18 +90,142 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, EventPublishe
         )
 
     @observable(tags=["PromptDriver.run()"])
-    def run(self, prompt_stack: PromptStack) -> Message:
-        for attempt in self.retrying():
-            with attempt:
-                self.before_run(prompt_stack)
+    def run(
+        self, prompt_stack: PromptStack, *, on_action_call: Optional[Callable[[ToolAction], None]] = None
+    ) -> Message:
+        """Runs the Prompt Stack through the LLM.
 
-                result = self.__process_stream(prompt_stack) if self.stream else self.__process_run(prompt_stack)
+        Args:
+            prompt_stack: The Prompt Stack to run.
+            on_action_call: Called with each Tool Action as soon as its call has been fully streamed, while the rest of
+                the response is still being generated. Only called when `stream` is enabled and the response is not
+                served from the cache or another in-flight request.
 
-                self.after_run(result)
+        Returns:
+            The Message generated by the LLM.
+        """
+        cache_key = self.__request_key(prompt_stack)
 
-                return result
-        else:
-            raise Exception("prompt driver failed after all retry attempts")
+        if cache_key is not None and (cached_result := self.__load_from_cache(prompt_stack, cache_key)) is not None:
+            return cached_result
+
+        if cache_key is None or self.single_flight is None:
+            return self.__run(prompt_stack, cache_key, on_action_call)
+
+        result, shared = self.single_flight.do(cache_key, lambda: self.__run(prompt_stack, cache_key, on_action_call))
+
+        if shared:
+            self.__replay(prompt_stack, result)
+
+        return result
+
+    async def arun(
+        self, prompt_stack: PromptStack, *, on_action_call: Optional[Callable[[ToolAction], None]] = None
+    ) -> Message:
+        """Async counterpart of `run`, for driving many prompts from a single event loop.
+
+        Args:
+            prompt_stack: The Prompt Stack to run.
+            on_action_call: Called with each Tool Action as soon as its call has been fully streamed. See `run`.
+
+        Returns:
+            The Message generated by the LLM.
+        """
+        cache_key = self.__request_key(prompt_stack)
+
+        if cache_key is not None and (cached_result := self.__load_from_cache(prompt_stack, cache_key)) is not None:
+            return cached_result
+
+        if cache_key is None or self.single_flight is None:
+            return await self.__arun(prompt_stack, cache_key, on_action_call)
+
+        result, shared = await self.single_flight.ado(
+            cache_key, lambda: self.__arun(prompt_stack, cache_key, on_action_call)
+        )
+
+        if shared:
+            self.__replay(prompt_stack, result)
+
+        return result
+
+    def run_many(self, prompt_stacks: list[PromptStack], *, max_concurrency: Optional[int] = None) -> list[Message]:
+        """Runs several Prompt Stacks concurrently.
+
+        Each Prompt Stack goes through `run`, so every item gets its own retries and events, and the batch shares the
+        Driver's rate limiter, cache and single flight. Drivers that can generate several responses in one request
+        should override this.
+
+        Args:
+            prompt_stacks: The Prompt Stacks to run.
+            max_concurrency: Maximum number of Prompt Stacks running at once. `None` leaves it to the executor.
+
+        Returns:
+            The Messages generated by the LLM, in the same order as `prompt_stacks`.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        execution_context = utils.ExecutionContext.current()
+        executor = (
+            futures.ThreadPoolExecutor(max_workers=max_concurrency)
+            if execution_context is None
+            else execution_context.executor()
+        )
+        semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency is not None else nullcontext()
+
+        def run(prompt_stack: PromptStack) -> Message:
+            with semaphore:
+                return self.run(prompt_stack)
+
+        with executor:
+            return utils.execute_futures_list([executor.submit(run, prompt_stack) for prompt_stack in prompt_stacks])
+
+    async def arun_many(
+        self, prompt_stacks: list[PromptStack], *, max_concurrency: Optional[int] = None
+    ) -> list[Message]:
+        """Async counterpart of `run_many`, running the Prompt Stacks with `arun` on the running event loop."""
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+
+        async def arun(prompt_stack: PromptStack) -> Message:
+            if semaphore is None:
+                return await self.arun(prompt_stack)
+
+            async with semaphore:
+                return await self.arun(prompt_stack)
+
+        return list(await asyncio.gather(*(arun(prompt_stack) for prompt_stack in prompt_stacks)))
+
+    def cache_key(self, prompt_stack: PromptStack) -> str:
+        """Returns a stable hash of the request that running `prompt_stack` sends to the LLM.
+
+        The hash covers the serialized messages, the tools, the model, the sampling parameters and the stop sequences.
+        Artifact ids and token usage are left out, so identical Prompt Stacks built by different runs share a key.
+
+        Args:
+            prompt_stack: The Prompt Stack to hash.
+
+        Returns:
+            The hash of the request.
+        """
+        return utils.str_to_hash(
+            json.dumps(
+                {
+                    "driver": self.__class__.__name__,
+                    "model": self.model,
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens,
+                    "use_native_tools": self.use_native_tools,
+                    "stop_sequences": self.tokenizer.stop_sequences,
+                    "messages": [self.__strip_volatile_fields(message.to_dict()) for message in prompt_stack.messages],
+                    "tools": [tool.schema() for tool in prompt_stack.tools],
+                },
+                sort_keys=True,
+                default=str,
+            )
+        )
 
     def prompt_stack_to_string(self, prompt_stack: PromptStack) -> str:
         """Converts a Prompt Stack to a string for token counting or model input.
@@ -107,39 +259,255 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, EventPublishe
     @abstractmethod
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]: ...
 
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        """Async counterpart of `try_run`.
+
+        Runs `try_run` in a worker thread. Drivers with an async client should override this.
+        """
+        return await asyncio.to_thread(self.try_run, prompt_stack)
+
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        """Async counterpart of `try_stream`.
+
+        Pulls each Delta Message from `try_stream` in a worker thread. Drivers with an async client should override this.
+        """
+        message_deltas = iter(await asyncio.to_thread(self.try_stream, prompt_stack))
+        sentinel = object()
+
+        while (message_delta := await asyncio.to_thread(next, message_deltas, sentinel)) is not sentinel:
+            yield message_delta  # pyright: ignore[reportReturnType]
+
+    def _acquire_rate_limit(self, prompt_stack: PromptStack) -> int:
+        """Blocks until the request fits in the rate limits, returning the tokens charged for it.
+
+        The request is estimated at the prompt's token count plus `max_tokens`, and corrected with the actual usage by
+        `_reconcile_rate_limit()`.
+        """
+        if self.rate_limiter is None:
+            return 0
+
+        tokens = self.tokenizer.count_tokens(self.prompt_stack_to_string(prompt_stack)) + (self.max_tokens or 0)
+
+        return self.rate_limiter.acquire(self.rate_limit_key, tokens)
+
+    def _reconcile_rate_limit(self, charged_tokens: int, result: Message) -> None:
+        if self.rate_limiter is not None:
+            used_tokens = (result.usage.input_tokens or 0) + (result.usage.output_tokens or 0)
+
+            self.rate_limiter.reconcile(self.rate_limit_key, charged_tokens, int(used_tokens))
+
+    def __run(
+        self,
+        prompt_stack: PromptStack,
+        cache_key: Optional[str],
+        on_action_call: Optional[Callable[[ToolAction], None]] = None,
+    ) -> Message:
+        for attempt in self.retrying():
+            with attempt:
+                self.before_run(prompt_stack)
+
+                charged_tokens = self._acquire_rate_limit(prompt_stack)
+
+                with utils.ExecutionContext.current_limit("prompt"):
+                    if self.stream:
+                        result = self.__process_stream(prompt_stack, on_action_call)
+                    else:
+                        result = self.__process_run(prompt_stack)
+
+                self._reconcile_rate_limit(charged_tokens, result)
+                self.after_run(result)
+                self.__store_in_cache(cache_key, result)
+
+                return result
+        else:
+            raise Exception("prompt driver failed after all retry attempts")
+
+    async def __arun(
+        self,
+        prompt_stack: PromptStack,
+        cache_key: Optional[str],
+        on_action_call: Optional[Callable[[ToolAction], None]] = None,
+    ) -> Message:
+        async for attempt in self.aretrying():
+            with attempt:
+                self.before_run(prompt_stack)
+
+                charged_tokens = await asyncio.to_thread(self._acquire_rate_limit, prompt_stack)
+
+                if self.stream:
+                    result = await self.__aprocess_stream(prompt_stack, on_action_call)
+                else:
+                    result = await self.atry_run(prompt_stack)
+
+                self._reconcile_rate_limit(charged_tokens, result)
+                self.after_run(result)
+                self.__store_in_cache(cache_key, result)
+
+                return result
+        else:
+            raise Exception("prompt driver failed after all retry attempts")
+
+    def __request_key(self, prompt_stack: PromptStack) -> Optional[str]:
+        if self.prompt_cache_driver is None and self.single_flight is None:
+            return None
+
+        return self.cache_key(prompt_stack)
+
+    def __load_from_cache(self, prompt_stack: PromptStack, cache_key: str) -> Optional[Message]:
+        if self.prompt_cache_driver is None:
+            return None
+
+        result = self.prompt_cache_driver.load(cache_key)
+
+        if result is None:
+            self.publish_event(PromptCacheMissEvent(model=self.model, cache_key=cache_key))
+
+            return None
+
+        self.publish_event(PromptCacheHitEvent(model=self.model, cache_key=cache_key))
+        self.__replay(prompt_stack, result)
+
+        return result
+
+    def __replay(self, prompt_stack: PromptStack, result: Message) -> None:
+        """Publishes the events of a run that generated `result`, without sending a request."""
+        self.before_run(prompt_stack)
+
+        if self.stream:
+            for content in result.content:
+                if isinstance(content, TextMessageContent):
+                    self.publish_event(CompletionChunkEvent(token=content.artifact.to_text()))
+                elif isinstance(content, ActionCallMessageContent):
+                    action = content.artifact.value
+                    self.publish_event(
+                        CompletionChunkEvent(
+                            token=str(ActionCallDeltaMessageContent(tag=action.tag, name=action.name, path=action.path))
+                        )
+                    )
+                    self.publish_event(CompletionChunkEvent(token=json.dumps(action.input)))
+
+        self.after_run(result)
+
+    def __store_in_cache(self, cache_key: Optional[str], result: Message) -> None:
+        if self.prompt_cache_driver is not None and cache_key is not None:
+            self.prompt_cache_driver.store(cache_key, result)
+
+    def __strip_volatile_fields(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: self.__strip_volatile_fields(item)
+                for key, item in value.items()
+                # Artifact names default to their random ids.
+                if key not in ("id", "usage") and not (key == "name" and item == value.get("id"))
+            }
+        elif isinstance(value, list):
+            return [self.__strip_volatile_fields(item) for item in value]
+        else:
+            return value
+
     def __process_run(self, prompt_stack: PromptStack) -> Message:
         result = self.try_run(prompt_stack)
 
         return result
 
-    def __process_stream(self, prompt_stack: PromptStack) -> Message:
+    def __process_stream(
+        self, prompt_stack: PromptStack, on_action_call: Optional[Callable[[ToolAction], None]] = None
+    ) -> Message:
         delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
+        dispatched_indexes: set[int] = set()
         usage = DeltaMessage.Usage()
 
         # Aggregate all content deltas from the stream
         message_deltas = self.try_stream(prompt_stack)
         for message_delta in message_deltas:
             usage += message_delta.usage
-            content = message_delta.content
 
-            if content is not None:
-                if content.index in delta_contents:
-                    delta_contents[content.index].append(content)
-                else:
-                    delta_contents[content.index] = [content]
-                if isinstance(content, TextDeltaMessageContent):
-                    self.publish_event(CompletionChunkEvent(token=content.text))
-                elif isinstance(content, ActionCallDeltaMessageContent):
-                    if content.tag is not None and content.name is not None and content.path is not None:
-                        self.publish_event(CompletionChunkEvent(token=str(content)))
-                    elif content.partial_input is not None:
-                        self.publish_event(CompletionChunkEvent(token=content.partial_input))
+            self.__add_delta_content(message_delta, delta_contents)
+
+            if on_action_call is not None:
+                self.__dispatch_action_calls(message_delta, delta_contents, dispatched_indexes, on_action_call)
 
         # Build a complete content from the content deltas
         result = self.__build_message(list(delta_contents.values()), usage)
 
         return result
 
+    async def __aprocess_stream(
+        self, prompt_stack: PromptStack, on_action_call: Optional[Callable[[ToolAction], None]] = None
+    ) -> Message:
+        delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
+        dispatched_indexes: set[int] = set()
+        usage = DeltaMessage.Usage()
+
+        async for message_delta in self.atry_stream(prompt_stack):
+            usage += message_delta.usage
+
+            self.__add_delta_content(message_delta, delta_contents)
+
+            if on_action_call is not None:
+                self.__dispatch_action_calls(message_delta, delta_contents, dispatched_indexes, on_action_call)
+
+        return self.__build_message(list(delta_contents.values()), usage)
+
+    def __add_delta_content(
+        self, message_delta: DeltaMessage, delta_contents: dict[int, list[BaseDeltaMessageContent]]
+    ) -> None:
+        content = message_delta.content
+
+        if content is not None:
+            if content.index in delta_contents:
+                delta_contents[content.index].append(content)
+            else:
+                delta_contents[content.index] = [content]
+            if isinstance(content, TextDeltaMessageContent):
+                self.publish_event(CompletionChunkEvent(token=content.text))
+            elif isinstance(content, ActionCallDeltaMessageContent):
+                if content.tag is not None and content.name is not None and content.path is not None:
+                    self.publish_event(CompletionChunkEvent(token=str(content)))
+                elif content.partial_input is not None:
+                    self.publish_event(CompletionChunkEvent(token=content.partial_input))
+
+    def __dispatch_action_calls(
+        self,
+        message_delta: DeltaMessage,
+        delta_contents: dict[int, list[BaseDeltaMessageContent]],
+        dispatched_indexes: set[int],
+        on_action_call: Callable[[ToolAction], None],
+    ) -> None:
+        """Passes the action calls that finished streaming with `message_delta` to `on_action_call`.
+
+        An action call is finished once its input JSON closes, or once the stream moves on to another content index.
+        """
+        content = message_delta.content
+
+        if content is None:
+            return
+
+        for index, index_deltas in delta_contents.items():
+            if index in dispatched_indexes or not isinstance(index_deltas[0], ActionCallDeltaMessageContent):
+                continue
+
+            if index == content.index:
+                # Input JSON can only close on a "}", so skip the parse attempt for every other chunk.
+                if not (
+                    isinstance(content, ActionCallDeltaMessageContent)
+                    and content.partial_input is not None
+                    and content.partial_input.rstrip().endswith("}")
+                ):
+                    continue
+
+            try:
+                action_call = ActionCallMessageContent.from_deltas(index_deltas)
+            except ValueError:
+                if index != content.index:
+                    # The call gets no more deltas, so leave its error to building the final Message.
+                    dispatched_indexes.add(index)
+
+                continue
+
+            dispatched_indexes.add(index)
+            on_action_call(action_call.artifact.value)
+
     def __build_message(
         self, delta_contents: list[list[BaseDeltaMessageContent]], usage: DeltaMessage.Usage
     ) -> Message:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from attrs import Factory, define, field
 
@@ -8,7 +8,7 @@ from griptape.artifacts import TextArtifact
 from griptape.common import DeltaMessage, Message, PromptStack, TextMessageContent, observable
 from griptape.drivers import BasePromptDriver
 from griptape.tokenizers import HuggingFaceTokenizer
-from griptape.utils import import_optional_dependency
+from griptape.utils import ExecutionContext, MicroBatcher, import_optional_dependency
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -23,6 +23,9 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
     Attributes:
         params: Custom model run parameters.
         model: Hugging Face Hub model name.
+        max_batch_size: Maximum number of concurrent `try_run()` calls generated together. Above 1, calls are queued to
+            a background worker that runs them through `try_run_many()` in batches.
+        max_batch_wait: Maximum number of seconds a queued call waits for its batch to fill up.
     """
 
     max_tokens: int = field(default=250, kw_only=True, metadata={"serializable": True})
@@ -46,9 +49,44 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
             takes_self=True,
         ),
     )
+    max_batch_size: int = field(default=1, kw_only=True, metadata={"serializable": True})
+    max_batch_wait: float = field(default=0.01, kw_only=True, metadata={"serializable": True})
+    _batcher: MicroBatcher[PromptStack, Message] = field(
+        default=Factory(
+            lambda self: MicroBatcher(
+                process_batch_fn=self.try_run_many, max_batch_size=self.max_batch_size, max_wait=self.max_batch_wait
+            ),
+            takes_self=True,
+        ),
+        init=False,
+    )
+
+    def run_many(self, prompt_stacks: list[PromptStack], *, max_concurrency: Optional[int] = None) -> list[Message]:
+        """Runs the Prompt Stacks in batches, with one padded generation per batch.
+
+        Args:
+            prompt_stacks: The Prompt Stacks to run.
+            max_concurrency: Maximum number of Prompt Stacks in a batch. `None` runs them all in a single batch.
+
+        Returns:
+            The Messages generated by the model, in the same order as `prompt_stacks`.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        batch_size = max_concurrency or max(len(prompt_stacks), 1)
+        results = []
+
+        for i in range(0, len(prompt_stacks), batch_size):
+            results.extend(self.__run_batch(prompt_stacks[i : i + batch_size]))
+
+        return results
 
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
+        if self.max_batch_size > 1:
+            return self._batcher.submit(prompt_stack).result()
+
         messages = self._prompt_stack_to_messages(prompt_stack)
 
         result = self.pipe(
@@ -59,22 +97,53 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
             **self.params,
         )
 
-        if isinstance(result, list):
-            if len(result) == 1:
-                generated_text = result[0]["generated_text"][-1]["content"]
+        return self.__to_message(prompt_stack, result)
 
-                input_tokens = len(self.__prompt_stack_to_tokens(prompt_stack))
-                output_tokens = len(self.tokenizer.tokenizer.encode(generated_text))
+    @observable
+    def try_run_many(self, prompt_stacks: list[PromptStack]) -> list[Message]:
+        """Generates the responses to several Prompt Stacks in one padded batch.
+
+        Each Prompt Stack is encoded with the chat template once, and its token count is taken from that encoding.
+        """
+        tokenizer = self.tokenizer.tokenizer
+        prompt_tokens = [self.__prompt_stack_to_tokens(prompt_stack) for prompt_stack in prompt_stacks]
+
+        # Batches are padded to their longest prompt. Decoder-only models continue from the end of the prompt, so the
+        # padding goes on the left.
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
+        tokenizer.padding_side = "left"
+
+        inputs = tokenizer.pad({"input_ids": prompt_tokens}, padding=True, return_tensors="pt")
+        outputs = self.pipe.model.generate(
+            **inputs,
+            max_new_tokens=self.max_tokens,
+            temperature=self.temperature,
+            do_sample=True,
+            pad_token_id=tokenizer.pad_token_id,
+            **self.params,
+        )
+        input_length = len(inputs["input_ids"][0])
+        messages = []
 
-                return Message(
-                    content=[TextMessageContent(TextArtifact(generated_text))],
+        for tokens, output in zip(prompt_tokens, outputs):
+            generated_tokens = [int(token) for token in output[input_length:]]
+
+            # Sequences that finish early are padded up to the longest one.
+            while generated_tokens and generated_tokens[-1] == tokenizer.pad_token_id:
+                generated_tokens.pop()
+
+            messages.append(
+                Message(
+                    content=[
+                        TextMessageContent(TextArtifact(tokenizer.decode(generated_tokens, skip_special_tokens=True)))
+                    ],
                     role=Message.ASSISTANT_ROLE,
-                    usage=Message.Usage(input_tokens=input_tokens, output_tokens=output_tokens),
+                    usage=Message.Usage(input_tokens=len(tokens), output_tokens=len(generated_tokens)),
                 )
-            else:
-                raise Exception("completion with more than one choice is not supported yet")
-        else:
-            raise Exception("invalid output format")
+            )
+
+        return messages
 
     @observable
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
@@ -91,6 +160,40 @@ class HuggingFacePipelinePromptDriver(BasePromptDriver):
 
         return messages
 
+    def __run_batch(self, prompt_stacks: list[PromptStack]) -> list[Message]:
+        for attempt in self.retrying():
+            with attempt:
+                for prompt_stack in prompt_stacks:
+                    self.before_run(prompt_stack)
+
+                with ExecutionContext.current_limit("prompt"):
+                    results = self.try_run_many(prompt_stacks)
+
+                for result in results:
+                    self.after_run(result)
+
+                return results
+        else:
+            raise Exception("prompt driver failed after all retry attempts")
+
+    def __to_message(self, prompt_stack: PromptStack, result: object) -> Message:
+        if isinstance(result, list):
+            if len(result) == 1:
+                generated_text = result[0]["generated_text"][-1]["content"]
+
+                input_tokens = len(self.__prompt_stack_to_tokens(prompt_stack))
+                output_tokens = len(self.tokenizer.tokenizer.encode(generated_text))
+
+                return Message(
+                    content=[TextMessageContent(TextArtifact(generated_text))],
+                    role=Message.ASSISTANT_ROLE,
+                    usage=Message.Usage(input_tokens=input_tokens, output_tokens=output_tokens),
+                )
+            else:
+                raise Exception("completion with more than one choice is not supported yet")
+        else:
+            raise Exception("invalid output format")
+
     def __prompt_stack_to_tokens(self, prompt_stack: PromptStack) -> list[int]:
         messages = self._prompt_stack_to_messages(prompt_stack)
         tokens = self.tokenizer.tokenizer.apply_chat_template(messages, add_generation_prompt=True, tokenize=True)
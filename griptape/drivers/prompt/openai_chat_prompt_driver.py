@@ -27,9 +27,10 @@ from griptape.drivers import BasePromptDriver
 from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from openai.types.chat.chat_completion_chunk import ChoiceDelta
+    from openai.types.chat.chat_completion import ChatCompletion
+    from openai.types.chat.chat_completion_chunk import ChatCompletionChunk, ChoiceDelta
     from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
     from griptape.tools import BaseTool
@@ -44,6 +45,7 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         api_key: An optional OpenAi API key. If not provided, the `OPENAI_API_KEY` environment variable will be used.
         organization: An optional OpenAI organization. If not provided, the `OPENAI_ORG_ID` environment variable will be used.
         client: An `openai.OpenAI` client.
+        async_client: An `openai.AsyncOpenAI` client, used by `arun`.
         model: An OpenAI model name.
         tokenizer: An `OpenAiTokenizer`.
         user: A user id. Can be used to track requests by user.
@@ -61,6 +63,15 @@ class OpenAiChatPromptDriver(BasePromptDriver):
             takes_self=True,
         ),
     )
+    async_client: openai.AsyncOpenAI = field(
+        default=Factory(
+            lambda self: openai.AsyncOpenAI(
+                api_key=self.api_key, base_url=self.base_url, organization=self.organization
+            ),
+            takes_self=True,
+        ),
+        kw_only=True,
+    )
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: BaseTokenizer = field(
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True),
@@ -93,40 +104,31 @@ class OpenAiChatPromptDriver(BasePromptDriver):
     def try_run(self, prompt_stack: PromptStack) -> Message:
         result = self.client.chat.completions.create(**self._base_params(prompt_stack))
 
-        if len(result.choices) == 1:
-            message = result.choices[0].message
-
-            return Message(
-                content=self.__to_prompt_stack_message_content(message),
-                role=Message.ASSISTANT_ROLE,
-                usage=Message.Usage(
-                    input_tokens=result.usage.prompt_tokens,
-                    output_tokens=result.usage.completion_tokens,
-                ),
-            )
-        else:
-            raise Exception("Completion with more than one choice is not supported yet.")
+        return self.__to_message(result)
 
     @observable
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
         result = self.client.chat.completions.create(**self._base_params(prompt_stack), stream=True)
 
         for chunk in result:
-            if chunk.usage is not None:
-                yield DeltaMessage(
-                    usage=DeltaMessage.Usage(
-                        input_tokens=chunk.usage.prompt_tokens,
-                        output_tokens=chunk.usage.completion_tokens,
-                    ),
-                )
-            elif chunk.choices is not None:
-                if len(chunk.choices) == 1:
-                    choice = chunk.choices[0]
-                    delta = choice.delta
+            message_delta = self.__to_delta_message(chunk)
 
-                    yield DeltaMessage(content=self.__to_prompt_stack_delta_message_content(delta))
-                else:
-                    raise Exception("Completion with more than one choice is not supported yet.")
+            if message_delta is not None:
+                yield message_delta
+
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        result = await self.async_client.chat.completions.create(**self._base_params(prompt_stack))
+
+        return self.__to_message(result)
+
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        result = await self.async_client.chat.completions.create(**self._base_params(prompt_stack), stream=True)
+
+        async for chunk in result:
+            message_delta = self.__to_delta_message(chunk)
+
+            if message_delta is not None:
+                yield message_delta
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = {
@@ -155,6 +157,40 @@ class OpenAiChatPromptDriver(BasePromptDriver):
 
         return params
 
+    def __to_message(self, result: ChatCompletion) -> Message:
+        if len(result.choices) == 1:
+            message = result.choices[0].message
+
+            return Message(
+                content=self.__to_prompt_stack_message_content(message),
+                role=Message.ASSISTANT_ROLE,
+                usage=Message.Usage(
+                    input_tokens=result.usage.prompt_tokens,
+                    output_tokens=result.usage.completion_tokens,
+                ),
+            )
+        else:
+            raise Exception("Completion with more than one choice is not supported yet.")
+
+    def __to_delta_message(self, chunk: ChatCompletionChunk) -> Optional[DeltaMessage]:
+        if chunk.usage is not None:
+            return DeltaMessage(
+                usage=DeltaMessage.Usage(
+                    input_tokens=chunk.usage.prompt_tokens,
+                    output_tokens=chunk.usage.completion_tokens,
+                ),
+            )
+        elif chunk.choices is not None:
+            if len(chunk.choices) == 1:
+                choice = chunk.choices[0]
+                delta = choice.delta
+
+                return DeltaMessage(content=self.__to_prompt_stack_delta_message_content(delta))
+            else:
+                raise Exception("Completion with more than one choice is not supported yet.")
+        else:
+            return None
+
     def __to_openai_messages(self, messages: list[Message]) -> list[dict]:
         openai_messages = []
 
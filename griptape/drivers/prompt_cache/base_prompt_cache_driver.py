@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+
+from attrs import define, field
+
+from griptape.mixins import SerializableMixin
+
+if TYPE_CHECKING:
+    from griptape.common import Message
+
+
+@define
+class BasePromptCacheDriver(SerializableMixin, ABC):
+    """Base class for the Prompt Cache Drivers, which store the Messages generated by a Prompt Driver.
+
+    Attributes:
+        ttl: Number of seconds a cached Message is kept for. `None` keeps Messages until they are evicted or cleared.
+    """
+
+    ttl: Optional[float] = field(default=None, kw_only=True, metadata={"serializable": True})
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Message]: ...
+
+    @abstractmethod
+    def store(self, key: str, message: Message) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from attrs import define, field
+
+from griptape.common import Message
+from griptape.drivers import BasePromptCacheDriver
+
+
+@define
+class LocalPromptCacheDriver(BasePromptCacheDriver):
+    """Prompt Cache Driver that keeps Messages in an in-memory LRU tier, and optionally in a SQLite file.
+
+    Attributes:
+        max_entries: Maximum number of Messages kept in memory. Least recently used Messages are evicted first.
+        persist_file: Optional path of a SQLite file used as a second cache tier, shared between runs.
+    """
+
+    max_entries: int = field(default=1024, kw_only=True, metadata={"serializable": True})
+    persist_file: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
+    _memory_cache: OrderedDict[str, tuple[Optional[float], Message]] = field(factory=OrderedDict, init=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _thread_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def load(self, key: str) -> Optional[Message]:
+        with self._thread_lock:
+            entry = self._memory_cache.get(key)
+
+            if entry is None and self.persist_file is not None:
+                row = (
+                    self._get_connection()
+                    .execute("SELECT expires_at, message FROM messages WHERE key = ?", (key,))
+                    .fetchone()
+                )
+
+                if row is not None:
+                    entry = (row[0], Message.from_json(row[1]))
+                    self._remember(key, entry)
+
+            if entry is None:
+                return None
+
+            expires_at, message = entry
+
+            if expires_at is not None and expires_at <= time.time():
+                self._forget(key)
+
+                return None
+
+            self._memory_cache.move_to_end(key)
+
+            return message
+
+    def store(self, key: str, message: Message) -> None:
+        entry = (None if self.ttl is None else time.time() + self.ttl, message)
+
+        with self._thread_lock:
+            self._remember(key, entry)
+
+            if self.persist_file is not None:
+                connection = self._get_connection()
+                connection.execute(
+                    "INSERT OR REPLACE INTO messages (key, expires_at, message) VALUES (?, ?, ?)",
+                    (key, entry[0], message.to_json()),
+                )
+                connection.commit()
+
+    def clear(self) -> None:
+        """Removes every cached Message, from memory and from `persist_file`."""
+        with self._thread_lock:
+            self._memory_cache.clear()
+
+            if self.persist_file is not None:
+                connection = self._get_connection()
+                connection.execute("DELETE FROM messages")
+                connection.commit()
+
+    def _remember(self, key: str, entry: tuple[Optional[float], Message]) -> None:
+        self._memory_cache[key] = entry
+        self._memory_cache.move_to_end(key)
+
+        while len(self._memory_cache) > self.max_entries:
+            self._memory_cache.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        self._memory_cache.pop(key, None)
+
+        if self.persist_file is not None:
+            connection = self._get_connection()
+            connection.execute("DELETE FROM messages WHERE key = ?", (key,))
+            connection.commit()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.persist_file)  # pyright: ignore[reportArgumentType, reportCallIssue]
+
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            # Access is serialized by `_thread_lock`, so the connection can be shared between threads.
+            self._connection = sqlite3.connect(self.persist_file, check_same_thread=False)  # pyright: ignore[reportArgumentType]
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS messages (key TEXT PRIMARY KEY, expires_at REAL, message TEXT)"
+            )
+            self._connection.commit()
+
+        return self._connection
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from attrs import Factory, define, field
+
+from griptape.common import Message
+from griptape.drivers import BasePromptCacheDriver
+from griptape.utils.import_utils import import_optional_dependency
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+@define
+class RedisPromptCacheDriver(BasePromptCacheDriver):
+    """Prompt Cache Driver for Redis.
+
+    Messages are stored as JSON strings under `namespace`, and expire with Redis' own key expiration when `ttl` is set.
+
+    Attributes:
+        host: The host of the Redis instance.
+        port: The port of the Redis instance.
+        db: The database of the Redis instance.
+        password: The password of the Redis instance.
+        namespace: Prefix of the keys of the cached Messages.
+    """
+
+    host: str = field(kw_only=True, metadata={"serializable": True})
+    port: int = field(kw_only=True, metadata={"serializable": True})
+    db: int = field(kw_only=True, default=0, metadata={"serializable": True})
+    password: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": False})
+    namespace: str = field(default="griptape_prompt_cache", kw_only=True, metadata={"serializable": True})
+
+    client: Redis = field(
+        default=Factory(
+            lambda self: import_optional_dependency("redis").Redis(
+                host=self.host,
+                port=self.port,
+                db=self.db,
+                password=self.password,
+                decode_responses=False,
+            ),
+            takes_self=True,
+        ),
+        kw_only=True,
+    )
+
+    def load(self, key: str) -> Optional[Message]:
+        message_json = self.client.get(self._redis_key(key))
+
+        return None if message_json is None else Message.from_json(message_json)  # pyright: ignore[reportArgumentType]
+
+    def store(self, key: str, message: Message) -> None:
+        self.client.set(
+            self._redis_key(key), message.to_json(), px=None if self.ttl is None else max(int(self.ttl * 1000), 1)
+        )
+
+    def clear(self) -> None:
+        """Removes every cached Message in `namespace`."""
+        keys = list(self.client.scan_iter(match=f"{self.namespace}:*"))
+
+        if keys:
+            self.client.delete(*keys)
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
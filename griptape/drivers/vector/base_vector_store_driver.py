@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
-from concurrent import futures
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
@@ -13,6 +13,8 @@ from griptape.artifacts import BaseArtifact, ListArtifact, TextArtifact
 from griptape.mixins import EventPublisherMixin, SerializableMixin
 
 if TYPE_CHECKING:
+    from concurrent import futures
+
     from griptape.drivers import BaseEmbeddingDriver
 
 
@@ -37,7 +39,7 @@ class BaseVectorStoreDriver(EventPublisherMixin, SerializableMixin, ABC):
 
     embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
     futures_executor_fn: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
+        default=Factory(lambda: lambda: utils.ExecutionContext.current_executor("vector_store")),
         kw_only=True,
     )
 
@@ -67,6 +69,29 @@ class BaseVectorStoreDriver(EventPublisherMixin, SerializableMixin, ABC):
                     },
                 )
 
+    def upsert_text_artifacts_batch(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str] | dict[str, list[str]]:
+        """Upserts Text Artifacts in bulk.
+
+        For each namespace, existing entries are looked up with a single `find_existing_vector_ids()` call, the
+        remaining artifacts are embedded together, and their vectors are written with a single `upsert_vectors()` call.
+
+        Returns:
+            The vector ids of the artifacts, in the same shape as `artifacts`.
+        """
+        if isinstance(artifacts, list):
+            return self._upsert_text_artifacts_batch(artifacts, namespace=None, meta=meta, **kwargs)
+        else:
+            return {
+                namespace: self._upsert_text_artifacts_batch(artifact_list, namespace=namespace, meta=meta, **kwargs)
+                for namespace, artifact_list in artifacts.items()
+            }
+
     def upsert_text_artifact(
         self,
         artifact: TextArtifact,
@@ -77,10 +102,7 @@ class BaseVectorStoreDriver(EventPublisherMixin, SerializableMixin, ABC):
         **kwargs,
     ) -> str:
         meta = {} if meta is None else meta
-
-        if vector_id is None:
-            value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
-            vector_id = self._get_default_vector_id(value)
+        vector_id = self._get_artifact_vector_id(artifact) if vector_id is None else vector_id
 
         if self.does_entry_exist(vector_id, namespace=namespace):
             return vector_id
@@ -122,6 +144,42 @@ class BaseVectorStoreDriver(EventPublisherMixin, SerializableMixin, ABC):
         except Exception:
             return False
 
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        """Returns the subset of `vector_ids` that already have entries in `namespace`.
+
+        Drivers that can check several ids in one request should override this, by default each id is checked with
+        `does_entry_exist()`.
+        """
+        return {vector_id for vector_id in vector_ids if self.does_entry_exist(vector_id, namespace=namespace)}
+
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Inserts or updates several vectors in the same namespace.
+
+        Drivers with a native bulk write should override this, by default each vector is written with `upsert_vector()`.
+
+        Args:
+            vectors: The vectors to upsert.
+            vector_ids: Optional ids of the vectors, in the same order as `vectors`.
+            namespace: Optional namespace of the vectors.
+            metas: Optional metadata of the vectors, in the same order as `vectors`.
+            kwargs: Additional keyword arguments passed to the driver.
+
+        Returns:
+            The ids of the upserted vectors.
+        """
+        return [
+            self.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
+            for vector, vector_id, meta in self._vector_rows(vectors, vector_ids, metas)
+        ]
+
     def load_artifacts(self, *, namespace: Optional[str] = None) -> ListArtifact:
         result = self.load_entries(namespace=namespace)
         artifacts = [r.to_artifact() for r in result]
@@ -159,5 +217,130 @@ class BaseVectorStoreDriver(EventPublisherMixin, SerializableMixin, ABC):
         **kwargs,
     ) -> list[Entry]: ...
 
+    def query_many(
+        self,
+        queries: list[str],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[Entry]]:
+        """Runs several queries against the same namespace.
+
+        Drivers that can embed the queries in one request and search for them in one round trip should override this,
+        by default each query is run concurrently with `query()`.
+
+        Returns:
+            The entries of each query, in the same order as `queries`.
+        """
+        with self.futures_executor_fn() as executor:
+            return utils.execute_futures_list(
+                [
+                    executor.submit(
+                        self.query, query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+                    )
+                    for query in queries
+                ],
+            )
+
+    async def aupsert_text_artifacts_batch(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> list[str] | dict[str, list[str]]:
+        """Async counterpart of `upsert_text_artifacts_batch`, run in a worker thread."""
+        return await asyncio.to_thread(self.upsert_text_artifacts_batch, artifacts, meta=meta, **kwargs)
+
+    async def aquery(
+        self,
+        query: str,
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[Entry]:
+        """Async counterpart of `query`, run in a worker thread."""
+        return await asyncio.to_thread(
+            self.query, query, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+        )
+
+    async def aquery_many(
+        self,
+        queries: list[str],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        **kwargs,
+    ) -> list[list[Entry]]:
+        """Async counterpart of `query_many`, run in a worker thread."""
+        return await asyncio.to_thread(
+            self.query_many, queries, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs
+        )
+
     def _get_default_vector_id(self, value: str) -> str:
         return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
+
+    def _get_artifact_vector_id(self, artifact: TextArtifact) -> str:
+        value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
+
+        return self._get_default_vector_id(value)
+
+    def _upsert_text_artifacts_batch(
+        self,
+        artifacts: list[TextArtifact],
+        *,
+        namespace: Optional[str],
+        meta: Optional[dict],
+        **kwargs,
+    ) -> list[str]:
+        vector_ids = [self._get_artifact_vector_id(artifact) for artifact in artifacts]
+        existing_vector_ids = self.find_existing_vector_ids(list(dict.fromkeys(vector_ids)), namespace=namespace)
+        new_artifacts = {
+            vector_id: artifact
+            for vector_id, artifact in zip(vector_ids, artifacts)
+            if vector_id not in existing_vector_ids
+        }
+
+        if new_artifacts:
+            self.upsert_vectors(
+                self._embed_text_artifacts(list(new_artifacts.values())),
+                vector_ids=list(new_artifacts.keys()),
+                namespace=namespace,
+                metas=[{**(meta or {}), "artifact": artifact.to_json()} for artifact in new_artifacts.values()],
+                **kwargs,
+            )
+
+        return vector_ids
+
+    def _embed_text_artifacts(self, artifacts: list[TextArtifact]) -> list[list[float]]:
+        unembedded_artifacts = [artifact for artifact in artifacts if artifact.embedding is None]
+        embeddings = self.embedding_driver.embed_strings([str(artifact.value) for artifact in unembedded_artifacts])
+
+        for artifact, embedding in zip(unembedded_artifacts, embeddings):
+            artifact.embedding = embedding
+
+        vectors = [artifact.embedding for artifact in artifacts]
+
+        if all(isinstance(vector, list) for vector in vectors):
+            return vectors  # pyright: ignore[reportReturnType]
+        else:
+            raise ValueError("Vector must be an instance of 'list'.")
+
+    def _vector_rows(
+        self,
+        vectors: list[list[float]],
+        vector_ids: Optional[list[Optional[str]]],
+        metas: Optional[list[Optional[dict]]],
+    ) -> list[tuple[list[float], Optional[str], Optional[dict]]]:
+        vector_ids = [None] * len(vectors) if vector_ids is None else vector_ids
+        metas = [None] * len(vectors) if metas is None else metas
+
+        if len(vector_ids) != len(vectors) or len(metas) != len(vectors):
+            raise ValueError("vector_ids and metas must have the same length as vectors.")
+
+        return list(zip(vectors, vector_ids, metas))
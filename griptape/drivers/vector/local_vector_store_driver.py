@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import contextlib
 import json
-import operator
 import os
+import tempfile
 import threading
-from dataclasses import asdict
-from typing import Callable, NoReturn, Optional, TextIO
+from dataclasses import fields
+from typing import Any, BinaryIO, Callable, Literal, NoReturn, Optional, TextIO
 
+import numpy as np
 from attrs import Factory, define, field
-from numpy import dot
-from numpy.linalg import norm
 
 from griptape import utils
 from griptape.drivers import BaseVectorStoreDriver
@@ -17,38 +17,180 @@ from griptape.drivers import BaseVectorStoreDriver
 
 @define(kw_only=True)
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
+    """Vector Store Driver that keeps entries in memory, optionally persisted to an append-only log file.
+
+    Vectors are mirrored into a contiguous float32 matrix with precomputed norms so that a query is scored with a
+    single matrix-vector product.
+
+    The persist file is a JSON Lines log: every upsert appends one record and startup replays the log, with later
+    records overriding earlier ones. `compact()` rewrites the log as a snapshot holding one record per entry.
+
+    With the `binary` snapshot format, `compact()` instead writes the vectors to a float32 `.npy` file, with ids,
+    namespaces and meta offsets in a sidecar index, and truncates the log. On startup the vectors are memory-mapped
+    rather than parsed, so processes opening the same store share pages through the OS cache, and meta is only
+    decoded when an entry is accessed.
+
+    Setting `ivf_lists` enables an approximate inverted file (IVF) index for large stores. Vectors are clustered
+    around `ivf_lists` k-means centroids and a query only scores the rows in its `ivf_probes` closest clusters.
+    Raising `ivf_probes` trades speed for recall, which `measure_ivf_recall()` reports against exact search.
+
+    Rows are indexed by namespace and by the scalar fields of their `meta`, so queries and `load_entries()` calls
+    restricted to a namespace or a metadata `filter` only touch the matching rows.
+
+    Setting `quantization` scores queries against compact int8 or float16 codes instead of the float32 matrix, using
+    asymmetric distance computation with a full-precision query. The best candidates are then re-ranked with the
+    float32 vectors. Combined with binary snapshots, only the codes need to stay in memory while the float32 matrix is
+    paged in from disk for re-ranking.
+
+    Attributes:
+        entries: Entries keyed by their namespaced vector id.
+        persist_file: Optional path to a file that entries are persisted to.
+        snapshot_format: Format `compact()` writes snapshots in, either `json` or `binary`.
+        compaction_threshold: Automatically compact the persist file once it holds more than this many records per
+            entry. Set to `None` to only compact when `compact()` is called.
+        relatedness_fn: Optional custom relatedness function. When not set, cosine similarity is computed over the
+            whole vector matrix at once.
+        initial_capacity: Number of rows to allocate for the vector matrix before it needs to grow.
+        ivf_lists: Number of IVF clusters. Set to `None` to always use exact search.
+        ivf_probes: Number of closest IVF clusters scored for each query.
+        ivf_min_rows: Exact search is used until the store, or the namespace being queried, holds this many rows.
+            The IVF index is trained the first time it is needed and retrained whenever the store doubles in size.
+        quantization: Optional quantization of the vectors scored for queries, either `int8` or `float16`. int8
+            quantization uses a per-dimension scale and offset fitted on the stored vectors.
+        quantization_rerank_factor: Number of quantized candidates per requested result that are re-ranked with
+            full-precision vectors. Set to `None` to return approximate scores without re-ranking.
+    """
+
+    LOG_OPERATION_UPSERT = "upsert"
+    ROW_BATCH_SIZE = 65536
+    QUERY_SCORE_BLOCK_SIZE = 1 << 24
+
     entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict)
     persist_file: Optional[str] = field(default=None)
-    relatedness_fn: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)))
+    snapshot_format: Literal["json", "binary"] = field(default="json")
+    compaction_threshold: Optional[float] = field(default=2.0)
+    relatedness_fn: Optional[Callable] = field(default=None)
+    initial_capacity: int = field(default=1024)
+    ivf_lists: Optional[int] = field(default=None)
+    ivf_probes: int = field(default=8)
+    ivf_min_rows: int = field(default=10_000)
+    quantization: Optional[Literal["int8", "float16"]] = field(default=None)
+    quantization_rerank_factor: Optional[int] = field(default=4)
     thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _snapshot_vectors: Optional[np.ndarray] = field(default=None, init=False)
+    _snapshot_norms: Optional[np.ndarray] = field(default=None, init=False)
+    _vectors: Optional[np.ndarray] = field(default=None, init=False)
+    _norms: Optional[np.ndarray] = field(default=None, init=False)
+    _row_keys: list[str] = field(factory=list, init=False)
+    _key_rows: dict[str, int] = field(factory=dict, init=False)
+    _log_record_count: int = field(default=0, init=False)
+    _persist_file_needs_rewrite: bool = field(default=False, init=False)
+    _ivf_index: Optional[_IvfIndex] = field(default=None, init=False)
+    _quantizer: Optional[_VectorQuantizer] = field(default=None, init=False)
+    _namespace_rows: dict[Optional[str], list[int]] = field(factory=dict, init=False)
+    _meta_index: Optional[dict[tuple, set[int]]] = field(default=None, init=False)
 
     def __attrs_post_init__(self) -> None:
-        if self.persist_file is not None:
+        if self.persist_file is None:
+            with self.thread_lock:
+                self._rebuild_matrix()
+        else:
             directory = os.path.dirname(self.persist_file)
 
             if directory and not os.path.exists(directory):
                 os.makedirs(directory)
 
-            if not os.path.isfile(self.persist_file):
-                with open(self.persist_file, "w") as file:
-                    self.save_entries_to_file(file)
+            if os.path.isfile(self._snapshot_index_file()):
+                self._load_binary_snapshot()
+            else:
+                if not os.path.isfile(self.persist_file) or os.path.getsize(self.persist_file) == 0:
+                    with open(self.persist_file, "w") as file:
+                        self.save_entries_to_file(file)
 
-            with open(self.persist_file, "r+") as file:
-                if os.path.getsize(self.persist_file) > 0:
-                    self.entries = self.load_entries_from_file(file)
-                else:
-                    self.save_entries_to_file(file)
+                with self.thread_lock:
+                    self.entries = {}
+                    self._rebuild_matrix()
+
+            if os.path.isfile(self.persist_file):
+                with open(self.persist_file) as file:
+                    log_entries = self.load_entries_from_file(file)
+
+                with self.thread_lock:
+                    for key, entry in log_entries.items():
+                        self._put_entry(key, entry)
+
+            with self.thread_lock:
+                self._load_ivf_index()
+                self._load_quantizer()
+
+            if self._persist_file_needs_rewrite or self._needs_compaction():
+                self.compact()
 
     def save_entries_to_file(self, json_file: TextIO) -> None:
         with self.thread_lock:
-            serialized_data = {k: asdict(v) for k, v in self.entries.items()}
-
-            json.dump(serialized_data, json_file)
+            self._write_snapshot(json_file)
 
     def load_entries_from_file(self, json_file: TextIO) -> dict[str, BaseVectorStoreDriver.Entry]:
-        data = json.load(json_file)
+        """Replays a persist file, tolerating a torn final record left behind by an interrupted append.
+
+        Files written by older versions, which hold a single JSON object of all entries, are loaded as well.
+        """
+        entries = {}
+        lines = [line for line in json_file.read().splitlines() if line.strip()]
+        record_count = 0
+        needs_rewrite = False
+
+        for i, line in enumerate(lines):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                if i == len(lines) - 1:
+                    needs_rewrite = True
+                    break
+                raise
 
-        return {k: BaseVectorStoreDriver.Entry.from_dict(v) for k, v in data.items()}
+            if "op" in record:
+                if record["op"] == self.LOG_OPERATION_UPSERT:
+                    entries[record["key"]] = BaseVectorStoreDriver.Entry.from_dict(record["entry"])
+                else:
+                    raise ValueError(f"Unsupported log operation: {record['op']}")
+
+                record_count += 1
+            else:
+                entries.update({k: BaseVectorStoreDriver.Entry.from_dict(v) for k, v in record.items()})
+                record_count += len(record)
+                needs_rewrite = True
+
+        self._log_record_count = record_count
+        self._persist_file_needs_rewrite = needs_rewrite
+
+        return entries
+
+    def compact(self) -> None:
+        """Rewrites the persist file as a snapshot of the current entries in the configured `snapshot_format`."""
+        if self.persist_file is None:
+            return
+
+        with self.thread_lock:
+            self._sync_matrix()
+
+            if self.snapshot_format == "binary":
+                self._write_binary_snapshot()
+                self._replace_file(self.persist_file, lambda file: None)
+
+                self._log_record_count = 0
+            elif self.snapshot_format == "json":
+                self._replace_file(self.persist_file, self._write_snapshot)
+                self._remove_binary_snapshot()
+            else:
+                raise ValueError(f"Unsupported snapshot format: {self.snapshot_format}")
+
+            if self._ivf_index is not None:
+                self._replace_file(self._ivf_index_file(), self._ivf_index.save, mode="wb")
+            if self._quantizer is not None:
+                self._replace_file(self._quantizer_file(), self._quantizer.save, mode="wb")
+
+            self._persist_file_needs_rewrite = False
 
     def upsert_vector(
         self,
@@ -60,28 +202,81 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         **kwargs,
     ) -> str:
         vector_id = vector_id or utils.str_to_hash(str(vector))
+        key = self._namespaced_vector_id(vector_id, namespace=namespace)
 
         with self.thread_lock:
-            self.entries[self._namespaced_vector_id(vector_id, namespace=namespace)] = self.Entry(
-                id=vector_id,
-                vector=vector,
-                meta=meta,
-                namespace=namespace,
-            )
+            self._sync_matrix()
+            self._put_entry(key, self.Entry(id=vector_id, vector=vector, meta=meta, namespace=namespace))
+
+            if self.persist_file is not None:
+                with open(self.persist_file, "a") as file:
+                    file.write(self._log_record(key, self.entries[key]))
+
+                self._log_record_count += 1
 
-        if self.persist_file is not None:
-            # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
-            #  every time a new vector is inserted
-            with open(self.persist_file, "w") as file:
-                self.save_entries_to_file(file)
+        if self.persist_file is not None and self._needs_compaction():
+            self.compact()
 
         return vector_id
 
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Inserts or updates several vectors with a single lock acquisition and a single write to the persist file."""
+        rows = self._vector_rows(vectors, vector_ids, metas)
+        upserted_vector_ids = []
+        records = []
+
+        with self.thread_lock:
+            self._sync_matrix()
+
+            try:
+                for vector, vector_id, meta in rows:
+                    vector_id = vector_id or utils.str_to_hash(str(vector))
+                    key = self._namespaced_vector_id(vector_id, namespace=namespace)
+
+                    self._put_entry(key, self.Entry(id=vector_id, vector=vector, meta=meta, namespace=namespace))
+                    upserted_vector_ids.append(vector_id)
+
+                    if self.persist_file is not None:
+                        records.append(self._log_record(key, self.entries[key]))
+            finally:
+                # Log the rows that made it into the store, even if a later one failed validation.
+                if records and self.persist_file is not None:
+                    with open(self.persist_file, "a") as file:
+                        file.write("".join(records))
+
+                    self._log_record_count += len(records)
+
+        if self.persist_file is not None and self._needs_compaction():
+            self.compact()
+
+        return upserted_vector_ids
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        return {
+            vector_id
+            for vector_id in vector_ids
+            if self._namespaced_vector_id(vector_id, namespace=namespace) in self.entries
+        }
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         return self.entries.get(self._namespaced_vector_id(vector_id, namespace=namespace), None)
 
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+        with self.thread_lock:
+            self._sync_matrix()
+
+            if namespace is None:
+                return list(self.entries.values())
+            else:
+                return [self.entries[self._row_keys[row]] for row in self._namespace_rows.get(namespace, [])]
 
     def query(
         self,
@@ -90,35 +285,867 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         count: Optional[int] = None,
         namespace: Optional[str] = None,
         include_vectors: bool = False,
+        # LocalVectorStoreDriver-specific params:
+        filter: Optional[dict] = None,  # noqa: A002
         **kwargs,
     ) -> list[BaseVectorStoreDriver.Entry]:
+        """Queries the store, optionally restricted to a namespace and to entries whose `meta` matches `filter`.
+
+        `filter` maps top-level `meta` fields to the values they must equal.
+        """
         query_embedding = self.embedding_driver.embed_string(query)
 
-        if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
-        else:
-            entries = self.entries
+        with self.thread_lock:
+            self._sync_matrix()
 
-        entries_and_relatednesses = [
-            (entry, self.relatedness_fn(query_embedding, entry.vector)) for entry in entries.values()
-        ]
-        entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+            winners = self._query_winners(query_embedding, self._query_rows(namespace, filter), count)
 
-        result = [
-            BaseVectorStoreDriver.Entry(id=er[0].id, vector=er[0].vector, score=er[1], meta=er[0].meta)
-            for er in entries_and_relatednesses
-        ][:count]
+        return self._query_result(winners, include_vectors=include_vectors)
 
-        if include_vectors:
-            return result
-        else:
-            return [
-                BaseVectorStoreDriver.Entry(id=r.id, vector=[], score=r.score, meta=r.meta, namespace=r.namespace)
-                for r in result
-            ]
+    def query_many(
+        self,
+        queries: list[str],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        # LocalVectorStoreDriver-specific params:
+        filter: Optional[dict] = None,  # noqa: A002
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Queries the store with several queries at once.
+
+        Queries are embedded with a single `embed_strings()` call. For exact search, every query is then scored with
+        one matrix-matrix product instead of a matrix-vector product per query.
+        """
+        if not queries:
+            return []
+
+        query_embeddings = self.embedding_driver.embed_strings(queries)
+
+        with self.thread_lock:
+            self._sync_matrix()
+
+            rows = self._query_rows(namespace, filter)
+
+            if self.relatedness_fn is None and not (
+                self._should_use_ivf(len(rows)) or self._should_use_quantization(len(rows))
+            ):
+                query_matrix = np.asarray(query_embeddings, dtype=np.float32)
+                # Bound the size of the score matrix of each block of queries.
+                block_size = max(1, self.QUERY_SCORE_BLOCK_SIZE // max(len(rows), 1))
+                winners = [
+                    self._winners(rows, scores, count)
+                    for i in range(0, len(query_matrix), block_size)
+                    for scores in self._score_rows(query_matrix[i : i + block_size], rows)
+                ]
+            else:
+                winners = [self._query_winners(embedding, rows, count) for embedding in query_embeddings]
+
+        return [self._query_result(query_winners, include_vectors=include_vectors) for query_winners in winners]
+
+    def measure_ivf_recall(self, *, count: int = 10, sample_size: int = 100) -> float:
+        """Measures the recall of the IVF index against exact search.
+
+        A sample of the stored vectors is used as queries, so no embeddings are generated.
+
+        Args:
+            count: Number of results compared for each query.
+            sample_size: Maximum number of stored vectors to use as queries.
+
+        Returns:
+            Fraction of the exact top `count` results that the IVF index also returns.
+        """
+        with self.thread_lock:
+            self._sync_matrix()
+
+            size = len(self._row_keys)
+
+            if size == 0 or self.ivf_lists is None or size < self.ivf_lists:
+                return 1.0
+
+            self._ensure_ivf_index()
+
+            all_rows = np.arange(size, dtype=np.int64)
+            sample_rows = np.sort(np.random.default_rng(0).choice(size, size=min(size, sample_size), replace=False))
+            queries = np.concatenate(self._row_blocks(sample_rows)[0])
+            hits = 0
+            expected = 0
+
+            for query_array in queries:
+                exact = set(self._top_k(self._score_rows(query_array, all_rows), count).tolist())
+                candidates = self._ivf_candidates(query_array, all_rows)
+                approximate = set(candidates[self._top_k(self._score_rows(query_array, candidates), count)].tolist())
+
+                hits += len(exact & approximate)
+                expected += len(exact)
+
+            return hits / expected
 
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
 
     def _namespaced_vector_id(self, vector_id: str, *, namespace: Optional[str]) -> str:
         return vector_id if namespace is None else f"{namespace}-{vector_id}"
+
+    def _log_record(self, key: str, entry: BaseVectorStoreDriver.Entry) -> str:
+        # Read the fields directly rather than through `asdict`, which deep copies every vector.
+        entry_dict = {f.name: getattr(entry, f.name) for f in fields(entry)}
+
+        return json.dumps({"op": self.LOG_OPERATION_UPSERT, "key": key, "entry": entry_dict}) + "\n"
+
+    def _write_snapshot(self, file: TextIO) -> None:
+        for key, entry in self.entries.items():
+            file.write(self._log_record(key, entry))
+
+        self._log_record_count = len(self.entries)
+
+    def _replace_file(self, path: str, write_fn: Callable[[Any], Any], *, mode: str = "w") -> None:
+        with tempfile.NamedTemporaryFile(mode, dir=os.path.dirname(path) or ".", delete=False, suffix=".tmp") as file:
+            write_fn(file)
+
+        os.replace(file.name, path)
+
+    def _snapshot_index_file(self) -> str:
+        return f"{self.persist_file}.snapshot.json"
+
+    def _read_snapshot_index(self) -> Optional[dict]:
+        if not os.path.isfile(self._snapshot_index_file()):
+            return None
+
+        with open(self._snapshot_index_file()) as file:
+            return json.load(file)
+
+    def _snapshot_file_path(self, name: str) -> str:
+        return os.path.join(os.path.dirname(self._snapshot_index_file()), name)
+
+    def _write_binary_snapshot(self) -> None:
+        """Writes the current entries as a new snapshot generation, then points the index at it.
+
+        The index is replaced atomically and last, so a crash leaves either the previous or the new snapshot in place.
+        Replaying the log on top of either yields the same entries.
+        """
+        previous_index = self._read_snapshot_index()
+        generation = previous_index["generation"] + 1 if previous_index else 0
+        prefix = f"{os.path.basename(self._snapshot_index_file()).removesuffix('.json')}-{generation}"
+        files = {
+            "vectors": f"{prefix}.vectors.npy",
+            "norms": f"{prefix}.norms.npy",
+            "meta": f"{prefix}.meta.jsonl",
+            "meta_offsets": f"{prefix}.meta_offsets.npy",
+        }
+        keys = list(self._row_keys)
+        entries = [self.entries[key] for key in keys]
+        meta_offsets = [0]
+
+        if keys:
+            vectors, norms = self._row_blocks(np.arange(len(keys)))
+
+            np.save(self._snapshot_file_path(files["vectors"]), np.concatenate(vectors))
+            np.save(self._snapshot_file_path(files["norms"]), np.concatenate(norms))
+
+        with open(self._snapshot_file_path(files["meta"]), "wb") as file:
+            for entry in entries:
+                meta = (json.dumps(entry.meta) + "\n").encode()
+
+                file.write(meta)
+                meta_offsets.append(meta_offsets[-1] + len(meta))
+
+        np.save(self._snapshot_file_path(files["meta_offsets"]), np.array(meta_offsets, dtype=np.int64))
+
+        index = {
+            "generation": generation,
+            "count": len(keys),
+            "files": files,
+            "keys": keys,
+            "ids": [entry.id for entry in entries],
+            "namespaces": [entry.namespace for entry in entries],
+        }
+
+        self._replace_file(self._snapshot_index_file(), lambda file: json.dump(index, file))
+
+        if previous_index is not None:
+            self._remove_snapshot_files(previous_index)
+
+    def _load_binary_snapshot(self) -> None:
+        index = self._read_snapshot_index()
+
+        if index is None:
+            return
+
+        snapshot = _BinarySnapshot.open(self._snapshot_file_path, index)
+
+        with self.thread_lock:
+            self._rebuild_matrix(entries={})
+
+            self._snapshot_vectors = snapshot.vectors
+            self._snapshot_norms = snapshot.norms
+            self._row_keys = list(index["keys"])
+            self._key_rows = {key: row for row, key in enumerate(self._row_keys)}
+
+            for row, namespace in enumerate(index["namespaces"]):
+                self._namespace_rows.setdefault(namespace, []).append(row)
+
+            self.entries = {
+                key: _SnapshotEntry(id=vector_id, namespace=namespace, row=row, snapshot=snapshot)
+                for row, (key, vector_id, namespace) in enumerate(zip(index["keys"], index["ids"], index["namespaces"]))
+            }
+
+    def _remove_binary_snapshot(self) -> None:
+        index = self._read_snapshot_index()
+
+        if index is not None:
+            os.remove(self._snapshot_index_file())
+
+            self._remove_snapshot_files(index)
+
+    def _remove_snapshot_files(self, index: dict) -> None:
+        for name in index["files"].values():
+            # Files that are still mapped can't be removed on some platforms, they're replaced on the next compaction.
+            with contextlib.suppress(OSError):
+                os.remove(self._snapshot_file_path(name))
+
+    def _needs_compaction(self) -> bool:
+        return self.compaction_threshold is not None and self._log_record_count > self.compaction_threshold * max(
+            len(self.entries), 1
+        )
+
+    def _query_rows(self, namespace: Optional[str], meta_filter: Optional[dict]) -> np.ndarray:
+        """Returns the sorted rows that a query restricted to `namespace` and `meta_filter` should score."""
+        if namespace:
+            rows = np.array(self._namespace_rows.get(namespace, []), dtype=np.int64)
+        else:
+            rows = np.arange(len(self._row_keys), dtype=np.int64)
+
+        if meta_filter:
+            rows = np.intersect1d(rows, self._filter_rows(meta_filter), assume_unique=True)
+
+        return rows
+
+    def _query_winners(
+        self, query_embedding: list[float], rows: np.ndarray, count: Optional[int]
+    ) -> list[tuple[BaseVectorStoreDriver.Entry, float]]:
+        query_array = np.asarray(query_embedding, dtype=np.float32)
+
+        if self._should_use_ivf(len(rows)):
+            rows = self._ivf_candidates(query_array, rows)
+
+        if self._should_use_quantization(len(rows)):
+            if self.quantization_rerank_factor is None:
+                scores = self._quantized_scores(query_array, rows)
+            else:
+                if count is not None:
+                    candidates = self._top_k(
+                        self._quantized_scores(query_array, rows), count * self.quantization_rerank_factor
+                    )
+                    rows = rows[np.sort(candidates)]
+
+                scores = self._score_rows(query_embedding, rows)
+        else:
+            scores = self._score_rows(query_embedding, rows)
+
+        return self._winners(rows, scores, count)
+
+    def _winners(
+        self, rows: np.ndarray, scores: np.ndarray, count: Optional[int]
+    ) -> list[tuple[BaseVectorStoreDriver.Entry, float]]:
+        return [(self.entries[self._row_keys[rows[i]]], float(scores[i])) for i in self._top_k(scores, count)]
+
+    def _query_result(
+        self, winners: list[tuple[BaseVectorStoreDriver.Entry, float]], *, include_vectors: bool
+    ) -> list[BaseVectorStoreDriver.Entry]:
+        return [
+            BaseVectorStoreDriver.Entry(
+                id=entry.id,
+                vector=entry.vector if include_vectors else [],
+                score=score,
+                meta=entry.meta,
+                namespace=entry.namespace,
+            )
+            for entry, score in winners
+        ]
+
+    def _put_entry(self, key: str, entry: BaseVectorStoreDriver.Entry) -> None:
+        self._set_row(key, entry.vector, namespace=entry.namespace)  # pyright: ignore[reportArgumentType]
+
+        if self._meta_index is not None:
+            row = self._key_rows[key]
+            previous_entry = self.entries.get(key)
+
+            if previous_entry is not None:
+                self._index_meta(row, previous_entry.meta, remove=True)
+            self._index_meta(row, entry.meta)
+
+        self.entries[key] = entry
+
+    def _meta_index_key(self, field_name: str, value: Any) -> Optional[tuple]:
+        """Returns the index key of a `meta` field, or `None` if it isn't indexed.
+
+        Only scalar fields are indexed. The serialized artifact is skipped since it's unique to every entry.
+        """
+        if field_name == "artifact" or (value is not None and not isinstance(value, (str, int, float, bool))):
+            return None
+
+        # Keep `True` and `1` apart, they're equal and hash the same.
+        return field_name, isinstance(value, bool), value
+
+    def _index_meta(self, row: int, meta: Optional[dict], *, remove: bool = False) -> None:
+        for field_name, value in (meta or {}).items():
+            index_key = self._meta_index_key(field_name, value)
+
+            if index_key is not None:
+                if remove:
+                    self._meta_index[index_key].discard(row)  # pyright: ignore[reportOptionalSubscript]
+                else:
+                    self._meta_index.setdefault(index_key, set()).add(row)  # pyright: ignore[reportOptionalMemberAccess]
+
+    def _filter_rows(self, meta_filter: dict) -> np.ndarray:
+        """Returns the sorted rows whose `meta` matches every field of `meta_filter`.
+
+        The metadata index is built on first use, which avoids decoding the meta of snapshot entries up front.
+        """
+        if self._meta_index is None:
+            self._meta_index = {}
+
+            for row, key in enumerate(self._row_keys):
+                self._index_meta(row, self.entries[key].meta)
+
+        postings = []
+        unindexed_filter = {}
+
+        for field_name, value in meta_filter.items():
+            index_key = self._meta_index_key(field_name, value)
+
+            if index_key is None:
+                unindexed_filter[field_name] = value
+            else:
+                postings.append(self._meta_index.get(index_key, set()))
+
+        rows = set.intersection(*sorted(postings, key=len)) if postings else range(len(self._row_keys))
+
+        return np.array(
+            sorted(
+                row
+                for row in rows
+                if all(
+                    (self.entries[self._row_keys[row]].meta or {}).get(field_name) == value
+                    for field_name, value in unindexed_filter.items()
+                )
+            ),
+            dtype=np.int64,
+        )
+
+    def _ivf_index_file(self) -> str:
+        return f"{self.persist_file}.ivf.npz"
+
+    def _should_use_ivf(self, row_count: int) -> bool:
+        return (
+            self.ivf_lists is not None
+            and self.relatedness_fn is None
+            and row_count >= max(self.ivf_min_rows, self.ivf_lists)
+        )
+
+    def _ensure_ivf_index(self) -> None:
+        size = len(self._row_keys)
+
+        if self._ivf_index is None or size >= 2 * self._ivf_index.trained_rows:
+            list_count = self.ivf_lists or 1
+            sample_size = min(size, list_count * _IvfIndex.TRAINING_SAMPLES_PER_LIST)
+            sample_rows = np.sort(np.random.default_rng(0).choice(size, size=sample_size, replace=False))
+
+            self._ivf_index = _IvfIndex.train(
+                self._normalized_rows(sample_rows), list_count=list_count, trained_rows=size
+            )
+
+            for start in range(0, size, self.ROW_BATCH_SIZE):
+                rows = np.arange(start, min(start + self.ROW_BATCH_SIZE, size), dtype=np.int64)
+
+                self._ivf_index.assign(rows, self._normalized_rows(rows))
+
+    def _ivf_candidates(self, query_array: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        self._ensure_ivf_index()
+
+        return self._ivf_index.candidates(query_array, rows, probe_count=self.ivf_probes)  # pyright: ignore[reportOptionalMemberAccess]
+
+    def _load_ivf_index(self) -> None:
+        if self.ivf_lists is None or not os.path.isfile(self._ivf_index_file()):
+            return
+
+        index = _IvfIndex.load(self._ivf_index_file())
+        size = len(self._row_keys)
+
+        if index.centroids.shape != (self.ivf_lists, self._dimensions()) or index.assigned_rows > size:
+            return
+
+        unassigned_rows = np.arange(index.assigned_rows, size, dtype=np.int64)
+
+        if len(unassigned_rows):
+            index.assign(unassigned_rows, self._normalized_rows(unassigned_rows))
+
+        self._ivf_index = index
+
+    def _quantizer_file(self) -> str:
+        return f"{self.persist_file}.quantized.npz"
+
+    def _should_use_quantization(self, row_count: int) -> bool:
+        return self.quantization is not None and self.relatedness_fn is None and row_count > 0
+
+    def _ensure_quantizer(self) -> None:
+        size = len(self._row_keys)
+
+        if (
+            self._quantizer is None
+            or self._quantizer.quantization != self.quantization
+            or size >= 2 * self._quantizer.fitted_rows
+        ):
+            sample_size = min(size, _VectorQuantizer.FITTING_SAMPLE_SIZE)
+            sample_rows = np.sort(np.random.default_rng(0).choice(size, size=sample_size, replace=False))
+
+            self._quantizer = _VectorQuantizer.fit(
+                np.concatenate(self._row_blocks(sample_rows)[0]),
+                quantization=self.quantization,  # pyright: ignore[reportArgumentType]
+                fitted_rows=size,
+            )
+
+            for start in range(0, size, self.ROW_BATCH_SIZE):
+                rows = np.arange(start, min(start + self.ROW_BATCH_SIZE, size), dtype=np.int64)
+
+                self._quantizer.encode(rows, np.concatenate(self._row_blocks(rows)[0]))
+
+    def _quantized_scores(self, query_array: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        self._ensure_quantizer()
+
+        dots = self._quantizer.dot(query_array, rows)  # pyright: ignore[reportOptionalMemberAccess]
+        denominators = self._row_norms(rows) * np.linalg.norm(query_array)
+
+        return np.divide(dots, denominators, out=np.zeros_like(dots), where=denominators != 0)
+
+    def _load_quantizer(self) -> None:
+        if self.quantization is None or not os.path.isfile(self._quantizer_file()):
+            return
+
+        quantizer = _VectorQuantizer.load(self._quantizer_file())
+        size = len(self._row_keys)
+
+        if (
+            quantizer.quantization != self.quantization
+            or quantizer.codes.shape[1] != self._dimensions()
+            or quantizer.encoded_rows > size
+        ):
+            return
+
+        for start in range(quantizer.encoded_rows, size, self.ROW_BATCH_SIZE):
+            rows = np.arange(start, min(start + self.ROW_BATCH_SIZE, size), dtype=np.int64)
+
+            quantizer.encode(rows, np.concatenate(self._row_blocks(rows)[0]))
+
+        self._quantizer = quantizer
+
+    def _normalized_rows(self, rows: np.ndarray) -> np.ndarray:
+        vector_blocks, norm_blocks = self._row_blocks(rows)
+        vectors = np.concatenate(vector_blocks)
+        norms = np.concatenate(norm_blocks)[:, None]
+
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms != 0)
+
+    def _score_rows(self, query_vector: list[float] | np.ndarray, rows: np.ndarray) -> np.ndarray:
+        if len(rows) == 0:
+            return np.empty((*np.shape(query_vector)[:-1], 0), dtype=np.float32)
+
+        if self.relatedness_fn is not None:
+            return np.array(
+                [self.relatedness_fn(query_vector, self.entries[self._row_keys[row]].vector) for row in rows],
+                dtype=np.float32,
+            )
+
+        query_array = np.asarray(query_vector, dtype=np.float32)
+
+        if query_array.shape[-1] != self._dimensions():
+            raise ValueError("Query vector dimensions do not match the dimensions of the stored vectors.")
+
+        # A matrix of queries is scored with a single matrix-matrix product per block, one row of scores per query.
+        vector_blocks, norm_blocks = self._row_blocks(rows)
+        dots = np.concatenate([query_array @ vectors.T for vectors in vector_blocks], axis=-1)
+        denominators = np.concatenate(norm_blocks) * np.linalg.norm(query_array, axis=-1, keepdims=True)
+
+        return np.divide(dots, denominators, out=np.zeros_like(dots), where=denominators != 0)
+
+    def _row_blocks(self, rows: np.ndarray) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """Returns the vectors and norms of the sorted `rows`, split between the snapshot and in-memory matrices.
+
+        When every row is selected the blocks are views rather than fancy-indexed copies.
+        """
+        snapshot_size = self._snapshot_size()
+        size = len(self._row_keys)
+        vector_blocks = []
+        norm_blocks = []
+
+        if len(rows) == size:
+            if snapshot_size:
+                vector_blocks.append(self._snapshot_vectors)  # pyright: ignore[reportArgumentType]
+                norm_blocks.append(self._snapshot_norms)
+            if size > snapshot_size:
+                vector_blocks.append(self._vectors[: size - snapshot_size])  # pyright: ignore[reportOptionalSubscript]
+                norm_blocks.append(self._norms[: size - snapshot_size])  # pyright: ignore[reportOptionalSubscript]
+        else:
+            split = int(np.searchsorted(rows, snapshot_size))
+
+            if split:
+                vector_blocks.append(self._snapshot_vectors[rows[:split]])  # pyright: ignore[reportOptionalSubscript]
+                norm_blocks.append(self._snapshot_norms[rows[:split]])  # pyright: ignore[reportOptionalSubscript]
+            if split < len(rows):
+                vector_blocks.append(self._vectors[rows[split:] - snapshot_size])  # pyright: ignore[reportOptionalSubscript]
+                norm_blocks.append(self._norms[rows[split:] - snapshot_size])  # pyright: ignore[reportOptionalSubscript]
+
+        return vector_blocks, norm_blocks  # pyright: ignore[reportReturnType]
+
+    def _row_norms(self, rows: np.ndarray) -> np.ndarray:
+        """Returns the norms of the sorted `rows` without reading their vectors."""
+        snapshot_size = self._snapshot_size()
+        split = int(np.searchsorted(rows, snapshot_size))
+        norm_blocks = [np.empty(0, dtype=np.float32)]
+
+        if split:
+            norm_blocks.append(self._snapshot_norms[rows[:split]])  # pyright: ignore[reportOptionalSubscript]
+        if split < len(rows):
+            norm_blocks.append(self._norms[rows[split:] - snapshot_size])  # pyright: ignore[reportOptionalSubscript]
+
+        return np.concatenate(norm_blocks)
+
+    def _snapshot_size(self) -> int:
+        return 0 if self._snapshot_vectors is None else self._snapshot_vectors.shape[0]
+
+    def _dimensions(self) -> Optional[int]:
+        if self._snapshot_vectors is not None:
+            return self._snapshot_vectors.shape[1]
+        elif self._vectors is not None:
+            return self._vectors.shape[1]
+        else:
+            return None
+
+    def _top_k(self, scores: np.ndarray, count: Optional[int]) -> np.ndarray:
+        """Returns the positions of the `count` highest scores, best first.
+
+        Only the winners are sorted; ties keep their insertion order.
+        """
+        if count is not None and count < len(scores):
+            if count <= 0:
+                return np.empty(0, dtype=np.int64)
+
+            candidates = np.sort(np.argpartition(-scores, count - 1)[:count])
+        else:
+            candidates = np.arange(len(scores))
+
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    def _set_row(self, key: str, vector: list[float], *, namespace: Optional[str]) -> None:
+        vector_array = np.asarray(vector, dtype=np.float32)
+        dimensions = self._dimensions()
+
+        if dimensions is not None and vector_array.shape[0] != dimensions:
+            raise ValueError(f"Vector has {vector_array.shape[0]} dimensions but the store holds {dimensions}.")
+
+        row = self._key_rows.get(key)
+        snapshot_size = self._snapshot_size()
+
+        if row is not None and row < snapshot_size:
+            # Snapshot matrices are mapped copy-on-write, so this only touches this process' copy of the page.
+            self._snapshot_vectors[row] = vector_array  # pyright: ignore[reportOptionalSubscript]
+            self._snapshot_norms[row] = np.linalg.norm(vector_array)  # pyright: ignore[reportOptionalSubscript]
+            self._update_indexes(row)
+
+            return
+
+        if self._vectors is None:
+            self._vectors = np.zeros((max(self.initial_capacity, 1), vector_array.shape[0]), dtype=np.float32)
+            self._norms = np.zeros(self._vectors.shape[0], dtype=np.float32)
+
+        if row is None:
+            row = len(self._row_keys)
+
+            if row - snapshot_size == self._vectors.shape[0]:
+                self._grow_matrix(self._vectors.shape[0] * 2)
+
+            self._row_keys.append(key)
+            self._key_rows[key] = row
+            self._namespace_rows.setdefault(namespace, []).append(row)
+
+        self._vectors[row - snapshot_size] = vector_array
+        self._norms[row - snapshot_size] = np.linalg.norm(vector_array)  # pyright: ignore[reportOptionalSubscript]
+
+        self._update_indexes(row)
+
+    def _update_indexes(self, row: int) -> None:
+        rows = np.array([row], dtype=np.int64)
+
+        if self._ivf_index is not None and row <= self._ivf_index.assigned_rows:
+            self._ivf_index.assign(rows, self._normalized_rows(rows))
+        if self._quantizer is not None and row <= self._quantizer.encoded_rows:
+            self._quantizer.encode(rows, np.concatenate(self._row_blocks(rows)[0]))
+
+    def _grow_matrix(self, capacity: int) -> None:
+        vectors = np.zeros((capacity, self._vectors.shape[1]), dtype=np.float32)  # pyright: ignore[reportOptionalMemberAccess]
+        norms = np.zeros(capacity, dtype=np.float32)
+        size = len(self._row_keys) - self._snapshot_size()
+
+        vectors[:size] = self._vectors[:size]  # pyright: ignore[reportOptionalSubscript]
+        norms[:size] = self._norms[:size]  # pyright: ignore[reportOptionalSubscript]
+
+        self._vectors = vectors
+        self._norms = norms
+
+    def _rebuild_matrix(self, *, entries: Optional[dict[str, BaseVectorStoreDriver.Entry]] = None) -> None:
+        self._snapshot_vectors = None
+        self._snapshot_norms = None
+        self._vectors = None
+        self._norms = None
+        self._row_keys = []
+        self._key_rows = {}
+        self._ivf_index = None
+        self._quantizer = None
+        self._namespace_rows = {}
+        self._meta_index = None
+
+        for key, entry in (self.entries if entries is None else entries).items():
+            if entry.vector is not None:
+                self._set_row(key, entry.vector, namespace=entry.namespace)
+
+    def _sync_matrix(self) -> None:
+        """Rebuilds the vector matrix if `entries` was modified directly instead of through `upsert_vector`."""
+        if len(self._row_keys) != len(self.entries):
+            self._rebuild_matrix()
+
+
+def _grow_rows(array: np.ndarray, size: int, used_rows: int) -> np.ndarray:
+    """Returns `array`, or a copy with its first `used_rows` rows and capacity doubled, so that it holds `size` rows."""
+    if size <= len(array):
+        return array
+
+    grown = np.zeros((max(size, 2 * len(array)), *array.shape[1:]), dtype=array.dtype)
+    grown[:used_rows] = array[:used_rows]
+
+    return grown
+
+
+@define
+class _IvfIndex:
+    """Inverted file index that clusters normalized vectors around spherical k-means centroids."""
+
+    TRAINING_ITERATIONS = 10
+    TRAINING_SAMPLES_PER_LIST = 64
+
+    centroids: np.ndarray = field()
+    trained_rows: int = field()
+    assignments: np.ndarray = field(factory=lambda: np.empty(0, dtype=np.int32))
+    assigned_rows: int = field(default=0)
+
+    @classmethod
+    def train(cls, sample: np.ndarray, *, list_count: int, trained_rows: int) -> _IvfIndex:
+        rng = np.random.default_rng(0)
+        centroids = sample[rng.choice(len(sample), size=list_count, replace=False)]
+
+        for _ in range(cls.TRAINING_ITERATIONS):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            counts = np.bincount(assignments, minlength=list_count)
+            order = np.argsort(assignments, kind="stable")
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            sums = np.zeros_like(centroids)
+            non_empty = counts > 0
+
+            sums[non_empty] = np.add.reduceat(sample[order], starts[non_empty], axis=0)
+            # Reseed empty clusters with random samples so every list stays in use.
+            sums[~non_empty] = sample[rng.choice(len(sample), size=int((~non_empty).sum()))]
+
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = np.divide(sums, norms, out=np.zeros_like(sums), where=norms != 0)
+
+        return cls(centroids=centroids, trained_rows=trained_rows)
+
+    @classmethod
+    def load(cls, path: str) -> _IvfIndex:
+        with np.load(path) as data:
+            assignments = data["assignments"]
+
+            return cls(
+                centroids=data["centroids"],
+                trained_rows=int(data["trained_rows"]),
+                assignments=assignments,
+                assigned_rows=len(assignments),
+            )
+
+    def save(self, file: BinaryIO) -> None:
+        np.savez(
+            file,
+            centroids=self.centroids,
+            trained_rows=self.trained_rows,
+            assignments=self.assignments[: self.assigned_rows],
+        )
+
+    def assign(self, rows: np.ndarray, normalized_vectors: np.ndarray) -> None:
+        """Assigns `rows` to their closest centroids. Rows must either be assigned already or directly follow them."""
+        self.assignments = _grow_rows(self.assignments, int(rows.max()) + 1, self.assigned_rows)
+        self.assignments[rows] = np.argmax(normalized_vectors @ self.centroids.T, axis=1)
+        self.assigned_rows = max(self.assigned_rows, int(rows.max()) + 1)
+
+    def candidates(self, query_array: np.ndarray, rows: np.ndarray, *, probe_count: int) -> np.ndarray:
+        """Returns the subset of the sorted `rows` that belong to the `probe_count` clusters closest to the query."""
+        centroid_scores = self.centroids @ query_array
+        probe_mask = np.zeros(len(self.centroids), dtype=bool)
+
+        if probe_count < len(self.centroids):
+            probe_mask[np.argpartition(-centroid_scores, probe_count - 1)[:probe_count]] = True
+        else:
+            probe_mask[:] = True
+
+        return rows[probe_mask[self.assignments[rows]]]
+
+
+@define
+class _VectorQuantizer:
+    """Encodes vectors as int8 codes with a per-dimension scale and offset, or as float16 codes.
+
+    Queries stay in full precision and are scored against the codes (asymmetric distance computation). For int8,
+    `x = (code + 128) * scale + offset`, so `q . x = code . (q * scale) + q . (128 * scale + offset)`.
+    """
+
+    FITTING_SAMPLE_SIZE = 65536
+    BLOCK_SIZE = 4096
+
+    quantization: str = field()
+    fitted_rows: int = field()
+    codes: np.ndarray = field()
+    scale: Optional[np.ndarray] = field(default=None)
+    offset: Optional[np.ndarray] = field(default=None)
+    encoded_rows: int = field(default=0)
+
+    @classmethod
+    def fit(cls, sample: np.ndarray, *, quantization: str, fitted_rows: int) -> _VectorQuantizer:
+        dimensions = sample.shape[1]
+
+        if quantization == "int8":
+            minimum = sample.min(axis=0)
+
+            return cls(
+                quantization=quantization,
+                fitted_rows=fitted_rows,
+                codes=np.empty((0, dimensions), dtype=np.int8),
+                scale=((sample.max(axis=0) - minimum) / 255).astype(np.float32),
+                offset=minimum.astype(np.float32),
+            )
+        elif quantization == "float16":
+            return cls(
+                quantization=quantization,
+                fitted_rows=fitted_rows,
+                codes=np.empty((0, dimensions), dtype=np.float16),
+            )
+        else:
+            raise ValueError(f"Unsupported quantization: {quantization}")
+
+    @classmethod
+    def load(cls, path: str) -> _VectorQuantizer:
+        with np.load(path) as data:
+            codes = data["codes"]
+
+            return cls(
+                quantization=str(data["quantization"]),
+                fitted_rows=int(data["fitted_rows"]),
+                codes=codes,
+                scale=data.get("scale"),
+                offset=data.get("offset"),
+                encoded_rows=len(codes),
+            )
+
+    def save(self, file: BinaryIO) -> None:
+        arrays = {"scale": self.scale, "offset": self.offset}
+
+        np.savez(
+            file,
+            quantization=self.quantization,
+            fitted_rows=self.fitted_rows,
+            codes=self.codes[: self.encoded_rows],
+            **{name: array for name, array in arrays.items() if array is not None},
+        )
+
+    def encode(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        """Encodes the vectors of `rows`. Rows must either be encoded already or directly follow them."""
+        self.codes = _grow_rows(self.codes, int(rows.max()) + 1, self.encoded_rows)
+
+        if self.scale is not None and self.offset is not None:
+            levels = np.divide(vectors - self.offset, self.scale, out=np.zeros_like(vectors), where=self.scale != 0)
+            self.codes[rows] = (np.clip(np.rint(levels), 0, 255) - 128).astype(np.int8)
+        else:
+            self.codes[rows] = vectors.astype(np.float16)
+
+        self.encoded_rows = max(self.encoded_rows, int(rows.max()) + 1)
+
+    def dot(self, query_array: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Returns approximate dot products of the query with the sorted `rows`, decoding codes block by block."""
+        if self.scale is not None and self.offset is not None:
+            weights = query_array * self.scale
+            bias = float(query_array @ (128 * self.scale + self.offset))
+        else:
+            weights = query_array
+            bias = 0.0
+
+        contiguous = len(rows) > 0 and rows[-1] - rows[0] == len(rows) - 1
+        dots = np.empty(len(rows), dtype=np.float32)
+
+        for start in range(0, len(rows), self.BLOCK_SIZE):
+            block_rows = rows[start : start + self.BLOCK_SIZE]
+            codes = self.codes[block_rows[0] : block_rows[-1] + 1] if contiguous else self.codes[block_rows]
+
+            dots[start : start + len(block_rows)] = codes.astype(np.float32) @ weights + bias
+
+        return dots
+
+
+@define
+class _BinarySnapshot:
+    vectors: Optional[np.ndarray] = field()
+    norms: Optional[np.ndarray] = field()
+    meta: Optional[np.ndarray] = field()
+    meta_offsets: np.ndarray = field()
+
+    @classmethod
+    def open(cls, path_fn: Callable[[str], str], index: dict) -> _BinarySnapshot:
+        files = index["files"]
+        has_rows = index["count"] > 0
+        meta_path = path_fn(files["meta"])
+
+        return cls(
+            vectors=np.load(path_fn(files["vectors"]), mmap_mode="c") if has_rows else None,
+            norms=np.load(path_fn(files["norms"]), mmap_mode="c") if has_rows else None,
+            meta=np.memmap(meta_path, dtype=np.uint8, mode="r") if os.path.getsize(meta_path) > 0 else None,
+            meta_offsets=np.load(path_fn(files["meta_offsets"]), mmap_mode="r"),
+        )
+
+    def read_meta(self, row: int) -> Optional[dict]:
+        if self.meta is None:
+            return None
+
+        return json.loads(bytes(self.meta[self.meta_offsets[row] : self.meta_offsets[row + 1]]))
+
+
+class _SnapshotEntry(BaseVectorStoreDriver.Entry):
+    """Entry backed by a row of a binary snapshot, its vector and meta are read from the snapshot on first access."""
+
+    def __init__(self, *, id: str, namespace: Optional[str], row: int, snapshot: _BinarySnapshot) -> None:  # noqa: A002
+        self.id = id
+        self.namespace = namespace
+        self.score = None
+        self._row = row
+        self._snapshot = snapshot
+        self._meta_loaded = False
+        self._meta = None
+
+    @property
+    def vector(self) -> Optional[list[float]]:  # pyright: ignore[reportIncompatibleVariableOverride]
+        return self._snapshot.vectors[self._row].tolist()  # pyright: ignore[reportOptionalSubscript]
+
+    @property
+    def meta(self) -> Optional[dict]:  # pyright: ignore[reportIncompatibleVariableOverride]
+        if not self._meta_loaded:
+            self._meta = self._snapshot.read_meta(self._row)
+            self._meta_loaded = True
+
+        return self._meta
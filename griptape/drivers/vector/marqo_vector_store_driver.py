@@ -92,15 +92,7 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         Returns:
             str: The ID of the artifact that was added.
         """
-        artifact_json = artifact.to_json()
-        vector_id = utils.str_to_hash(artifact.value) if vector_id is None else vector_id
-
-        doc = {
-            "_id": vector_id,
-            "Description": artifact.value,  # Description will be treated as tensor field
-            "artifact": str(artifact_json),
-            "namespace": namespace,
-        }
+        doc = self._artifact_document(artifact, namespace=namespace, vector_id=vector_id)
 
         response = self.mq.index(self.index).add_documents([doc], tensor_fields=["Description", "artifact"])
         if isinstance(response, dict) and "items" in response and response["items"]:
@@ -254,5 +246,35 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         """
         raise NotImplementedError(f"{self.__class__.__name__} does not support upserting a vector.")
 
+    def _upsert_text_artifacts_batch(
+        self,
+        artifacts: list[TextArtifact],
+        *,
+        namespace: Optional[str],
+        meta: Optional[dict],
+        **kwargs,
+    ) -> list[str]:
+        """Upserts text artifacts with a single `add_documents` call, since Marqo generates the embeddings itself."""
+        docs = [self._artifact_document(artifact, namespace=namespace) for artifact in artifacts]
+
+        if not docs:
+            return []
+
+        response = self.mq.index(self.index).add_documents(docs, tensor_fields=["Description", "artifact"])
+        if isinstance(response, dict) and "items" in response and len(response["items"]) == len(docs):
+            return [item["_id"] for item in response["items"]]
+        else:
+            raise ValueError(f"Failed to upsert text: {response}")
+
+    def _artifact_document(
+        self, artifact: TextArtifact, *, namespace: Optional[str] = None, vector_id: Optional[str] = None
+    ) -> dict:
+        return {
+            "_id": utils.str_to_hash(artifact.value) if vector_id is None else vector_id,
+            "Description": artifact.value,  # Description will be treated as tensor field
+            "artifact": str(artifact.to_json()),
+            "namespace": namespace,
+        }
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
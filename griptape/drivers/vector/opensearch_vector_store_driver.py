@@ -140,6 +140,60 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
         """
         count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
         vector = self.embedding_driver.embed_string(query)
+
+        response = self.client.search(
+            index=self.index_name,
+            body=self._query_body(vector, count=count, namespace=namespace, field_name=field_name),
+        )
+
+        return self._query_result(
+            response, namespace=namespace, include_vectors=include_vectors, include_metadata=include_metadata
+        )
+
+    def query_many(
+        self,
+        queries: list[str],
+        *,
+        count: Optional[int] = None,
+        namespace: Optional[str] = None,
+        include_vectors: bool = False,
+        include_metadata: bool = True,
+        field_name: str = "vector",
+        **kwargs,
+    ) -> list[list[BaseVectorStoreDriver.Entry]]:
+        """Performs several nearest neighbor searches with a single `_msearch` request.
+
+        Returns:
+            A list of BaseVectorStoreDriver.Entry objects for each query, in the same order as `queries`.
+        """
+        if not queries:
+            return []
+
+        count = count or BaseVectorStoreDriver.DEFAULT_QUERY_COUNT
+        body = []
+
+        for vector in self.embedding_driver.embed_strings(queries):
+            body.extend(
+                [
+                    {"index": self.index_name},
+                    self._query_body(vector, count=count, namespace=namespace, field_name=field_name),
+                ]
+            )
+
+        responses = self.client.msearch(body=body)["responses"]
+
+        for response in responses:
+            if "error" in response:
+                raise ValueError(f"OpenSearch query failed: {response['error']}")
+
+        return [
+            self._query_result(
+                response, namespace=namespace, include_vectors=include_vectors, include_metadata=include_metadata
+            )
+            for response in responses
+        ]
+
+    def _query_body(self, vector: list[float], *, count: int, namespace: Optional[str], field_name: str) -> dict:
         # Base k-NN query
         query_body = {"size": count, "query": {"knn": {field_name: {"vector": vector, "k": count}}}}
 
@@ -153,8 +207,11 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
                 },
             }
 
-        response = self.client.search(index=self.index_name, body=query_body)
+        return query_body
 
+    def _query_result(
+        self, response: dict, *, namespace: Optional[str], include_vectors: bool, include_metadata: bool
+    ) -> list[BaseVectorStoreDriver.Entry]:
         return [
             BaseVectorStoreDriver.Entry(
                 id=hit["_id"],
@@ -61,22 +61,46 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         Metadata associated with the vector can also be provided.
         """
         vector_id = vector_id or str_to_hash(str(vector))
-        key = self._generate_key(vector_id, namespace)
-        bytes_vector = json.dumps(vector).encode("utf-8")
 
-        mapping = {}
-        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
-        mapping["vec_string"] = bytes_vector
+        self.client.hset(
+            self._generate_key(vector_id, namespace), mapping=self._vector_mapping(vector, namespace, meta)
+        )
 
-        if namespace:
-            mapping["namespace"] = namespace
+        return vector_id
 
-        if meta:
-            mapping["metadata"] = json.dumps(meta)
+    def upsert_vectors(
+        self,
+        vectors: list[list[float]],
+        *,
+        vector_ids: Optional[list[Optional[str]]] = None,
+        namespace: Optional[str] = None,
+        metas: Optional[list[Optional[dict]]] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Inserts or updates several vectors in Redis with a single pipelined round trip."""
+        pipeline = self.client.pipeline(transaction=False)
+        upserted_vector_ids = []
 
-        self.client.hset(key, mapping=mapping)
+        for vector, vector_id, meta in self._vector_rows(vectors, vector_ids, metas):
+            vector_id = vector_id or str_to_hash(str(vector))
 
-        return vector_id
+            pipeline.hset(
+                self._generate_key(vector_id, namespace), mapping=self._vector_mapping(vector, namespace, meta)
+            )
+            upserted_vector_ids.append(vector_id)
+
+        pipeline.execute()
+
+        return upserted_vector_ids
+
+    def find_existing_vector_ids(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> set[str]:
+        """Checks which vector ids already exist in Redis with a single pipelined round trip."""
+        pipeline = self.client.pipeline(transaction=False)
+
+        for vector_id in vector_ids:
+            pipeline.exists(self._generate_key(vector_id, namespace))
+
+        return {vector_id for vector_id, exists in zip(vector_ids, pipeline.execute()) if exists}
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from Redis based on its identifier and optional namespace.
@@ -162,6 +186,20 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         """Generates a Redis key using the provided vector ID and optionally a namespace."""
         return f"{namespace}:{vector_id}" if namespace else vector_id
 
+    def _vector_mapping(self, vector: list[float], namespace: Optional[str], meta: Optional[dict]) -> dict:
+        """Builds the hash fields stored for a vector."""
+        mapping = {}
+        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
+        mapping["vec_string"] = json.dumps(vector).encode("utf-8")
+
+        if namespace:
+            mapping["namespace"] = namespace
+
+        if meta:
+            mapping["metadata"] = json.dumps(meta)
+
+        return mapping
+
     def _get_doc_prefix(self, namespace: Optional[str] = None) -> str:
         """Get the document prefix based on the provided namespace."""
         return f"{namespace}:" if namespace else ""
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC
-from concurrent import futures
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
 
+from griptape import utils
 from griptape.common import Message, PromptStack
 
 if TYPE_CHECKING:
+    from concurrent import futures
+
     from griptape.engines.rag import RagContext
 
 
@@ -16,7 +18,7 @@ if TYPE_CHECKING:
 class BaseRagModule(ABC):
     name: str = field(default=Factory(lambda self: self.__class__.__name__, takes_self=True), kw_only=True)
     futures_executor_fn: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
+        default=Factory(lambda: lambda: utils.ExecutionContext.current_executor("rag")),
     )
 
     def generate_query_prompt_stack(self, system_prompt: str, query: str) -> PromptStack:
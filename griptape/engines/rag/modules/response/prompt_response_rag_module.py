@@ -23,24 +23,34 @@ class PromptResponseRagModule(BaseResponseRagModule):
 
     def run(self, context: RagContext) -> RagContext:
         query = context.query
-        tokenizer = self.prompt_driver.tokenizer
-        included_chunks = []
-        system_prompt = self.generate_system_template(context, included_chunks)
+        text_chunks = context.text_chunks
+        chunk_token_counts = self.prompt_driver.tokenizer.count_tokens_batch([c.to_text() for c in text_chunks])
 
-        for artifact in context.text_chunks:
-            included_chunks.append(artifact)
+        # Estimate how many chunks fit from their token counts, counted in one batch, then correct the estimate by
+        # counting the whole prompt.
+        included_count = 0
+        estimated_token_count = self.__count_prompt_tokens(context, [])
 
-            system_prompt = self.generate_system_template(context, included_chunks)
-            message_token_count = self.prompt_driver.tokenizer.count_tokens(
-                self.prompt_driver.prompt_stack_to_string(self.generate_query_prompt_stack(system_prompt, query)),
-            )
+        for chunk_token_count in chunk_token_counts:
+            estimated_token_count += chunk_token_count
 
-            if message_token_count + self.answer_token_offset >= tokenizer.max_input_tokens:
-                included_chunks.pop()
+            if not self.__fits(estimated_token_count):
+                break
 
-                system_prompt = self.generate_system_template(context, included_chunks)
+            included_count += 1
 
-                break
+        if self.__fits(self.__count_prompt_tokens(context, text_chunks[:included_count])):
+            while included_count < len(text_chunks) and self.__fits(
+                self.__count_prompt_tokens(context, text_chunks[: included_count + 1])
+            ):
+                included_count += 1
+        else:
+            while included_count > 0 and not self.__fits(
+                self.__count_prompt_tokens(context, text_chunks[:included_count])
+            ):
+                included_count -= 1
+
+        system_prompt = self.generate_system_template(context, text_chunks[:included_count])
 
         output = self.prompt_driver.run(self.generate_query_prompt_stack(system_prompt, query)).to_artifact()
 
@@ -51,6 +61,16 @@ class PromptResponseRagModule(BaseResponseRagModule):
 
         return context
 
+    def __count_prompt_tokens(self, context: RagContext, text_chunks: list[TextArtifact]) -> int:
+        system_prompt = self.generate_system_template(context, text_chunks)
+
+        return self.prompt_driver.tokenizer.count_tokens(
+            self.prompt_driver.prompt_stack_to_string(self.generate_query_prompt_stack(system_prompt, context.query)),
+        )
+
+    def __fits(self, token_count: int) -> bool:
+        return token_count + self.answer_token_offset < self.prompt_driver.tokenizer.max_input_tokens
+
     def default_system_template_generator(self, context: RagContext, artifacts: list[TextArtifact]) -> str:
         return J2("engines/rag/modules/response/prompt/system.j2").render(
             text_chunks=[c.to_text() for c in artifacts],
@@ -5,6 +5,7 @@ from typing import Callable
 
 from attrs import Factory, define, field
 
+from griptape import utils
 from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import BaseRagModule
 
@@ -12,7 +13,7 @@ from griptape.engines.rag.modules import BaseRagModule
 @define(kw_only=True)
 class BaseRagStage(ABC):
     futures_executor_fn: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
+        default=Factory(lambda: lambda: utils.ExecutionContext.current_executor("rag")),
     )
 
     @abstractmethod
@@ -8,6 +8,9 @@ from .finish_actions_subtask_event import FinishActionsSubtaskEvent
 from .base_prompt_event import BasePromptEvent
 from .start_prompt_event import StartPromptEvent
 from .finish_prompt_event import FinishPromptEvent
+from .base_prompt_cache_event import BasePromptCacheEvent
+from .prompt_cache_hit_event import PromptCacheHitEvent
+from .prompt_cache_miss_event import PromptCacheMissEvent
 from .start_structure_run_event import StartStructureRunEvent
 from .finish_structure_run_event import FinishStructureRunEvent
 from .completion_chunk_event import CompletionChunkEvent
@@ -34,6 +37,9 @@ __all__ = [
     "BasePromptEvent",
     "StartPromptEvent",
     "FinishPromptEvent",
+    "BasePromptCacheEvent",
+    "PromptCacheHitEvent",
+    "PromptCacheMissEvent",
     "StartStructureRunEvent",
     "FinishStructureRunEvent",
     "CompletionChunkEvent",
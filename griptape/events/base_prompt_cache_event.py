@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from abc import ABC
+
+from attrs import define, field
+
+from griptape.events.base_prompt_event import BasePromptEvent
+
+
+@define
+class BasePromptCacheEvent(BasePromptEvent, ABC):
+    cache_key: str = field(kw_only=True, metadata={"serializable": True})
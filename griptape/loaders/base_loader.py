@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import os
+import pickle
+import time
 from abc import ABC, abstractmethod
 from concurrent import futures
+from multiprocessing import resource_tracker, shared_memory
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from attrs import Factory, define, field
+from attrs import Factory, define, evolve, field
 
+from griptape.utils.execution_context import ExecutionContext
 from griptape.utils.futures import execute_futures_dict
 from griptape.utils.hash import bytes_to_hash, str_to_hash
 
@@ -14,14 +19,50 @@ if TYPE_CHECKING:
 
     from griptape.artifacts import BaseArtifact
 
+# The Loader used by each process of a process pool, set once by `_init_process_pool_loader()`.
+_process_pool_loader: Optional[BaseLoader] = None
+
 
 @define
 class BaseLoader(ABC):
+    """Base class for the Loaders.
+
+    Attributes:
+        futures_executor_fn: Creates the executor `load_collection()` runs on when `use_process_pool` is `False`.
+        encoding: The encoding of the loaded data.
+        use_process_pool: Loads collections in a pool of processes instead of threads, so CPU-bound parsing and
+            chunking isn't limited by the GIL. The Loader is pickled and sent to each process once, so it must be
+            picklable apart from `futures_executor_fn` and any Embedding Driver, which stay in the calling process.
+        max_processes: Maximum number of processes in the pool. Defaults to the number of CPUs.
+        max_in_flight: Maximum number of sources submitted to the pool at once, which bounds how many sources and
+            results are held in memory. Defaults to twice the number of processes.
+        use_shared_memory: Returns the results of each process through shared memory instead of a pipe.
+        load_timings: How long each source of the last `load_collection()` call took to load, by key.
+    """
+
+    @define(frozen=True)
+    class LoadTiming:
+        """How long a source took to load.
+
+        Attributes:
+            load_time: Seconds spent in `load()`.
+            total_time: Seconds from submitting the source until its result was ready, including time spent waiting
+                for a worker and, in a process pool, transferring the result.
+        """
+
+        load_time: float = field(kw_only=True)
+        total_time: float = field(kw_only=True)
+
     futures_executor_fn: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
+        default=Factory(lambda: lambda: ExecutionContext.current_executor("loaders")),
         kw_only=True,
     )
     encoding: Optional[str] = field(default=None, kw_only=True)
+    use_process_pool: bool = field(default=False, kw_only=True)
+    max_processes: Optional[int] = field(default=None, kw_only=True)
+    max_in_flight: Optional[int] = field(default=None, kw_only=True)
+    use_shared_memory: bool = field(default=False, kw_only=True)
+    load_timings: dict[str, BaseLoader.LoadTiming] = field(factory=dict, init=False)
 
     @abstractmethod
     def load(self, source: Any, *args, **kwargs) -> BaseArtifact | Sequence[BaseArtifact]: ...
@@ -36,11 +77,22 @@ class BaseLoader(ABC):
         # to avoid duplicate work.
         sources_by_key = {self.to_key(source): source for source in sources}
 
+        if self.use_process_pool:
+            return self.__load_collection_in_process_pool(sources_by_key, *args, **kwargs)
+
         with self.futures_executor_fn() as executor:
-            return execute_futures_dict(
-                {key: executor.submit(self.load, source, *args, **kwargs) for key, source in sources_by_key.items()},
+            submitted_at = time.perf_counter()
+            results = execute_futures_dict(
+                {
+                    key: executor.submit(self.__load_timed, source, submitted_at, *args, **kwargs)
+                    for key, source in sources_by_key.items()
+                },
             )
 
+        self.load_timings = {key: timing for key, (_, timing) in results.items()}
+
+        return {key: result for key, (result, _) in results.items()}
+
     def to_key(self, source: Any, *args, **kwargs) -> str:
         if isinstance(source, bytes):
             return bytes_to_hash(source)
@@ -48,3 +100,132 @@ class BaseLoader(ABC):
             return str_to_hash(source)
         else:
             return str_to_hash(str(source))
+
+    def _to_process_pool_loader(self) -> BaseLoader:
+        """Returns the copy of this Loader that is pickled and sent to each process of the pool.
+
+        Loaders with fields that can't or shouldn't leave the calling process, like Embedding Drivers, should override
+        this to leave them out and finish their results in `_from_process_pool_result()`.
+        """
+        return evolve(self, futures_executor_fn=futures.ThreadPoolExecutor, use_process_pool=False)
+
+    def _from_process_pool_result(
+        self, result: BaseArtifact | Sequence[BaseArtifact]
+    ) -> BaseArtifact | Sequence[BaseArtifact]:
+        """Finishes a result returned by a process of the pool, in the calling process."""
+        return result
+
+    def __load_timed(
+        self, source: Any, submitted_at: float, *args, **kwargs
+    ) -> tuple[BaseArtifact | Sequence[BaseArtifact], BaseLoader.LoadTiming]:
+        start = time.perf_counter()
+        result = self.load(source, *args, **kwargs)
+        end = time.perf_counter()
+
+        return result, BaseLoader.LoadTiming(load_time=end - start, total_time=end - submitted_at)
+
+    def __load_collection_in_process_pool(
+        self, sources_by_key: dict[str, Any], *args, **kwargs
+    ) -> dict[str, BaseArtifact | Sequence[BaseArtifact]]:
+        max_processes = self.max_processes or os.cpu_count() or 1
+        max_in_flight = self.max_in_flight or max_processes * 2
+        pending_sources = iter(sources_by_key.items())
+        in_flight: dict[futures.Future, tuple[str, float]] = {}
+        results = {}
+        load_timings = {}
+
+        if self.use_shared_memory:
+            # Processes share the resource tracker of the calling process if it is already running. Otherwise each
+            # process starts its own and warns about shared memory blocks that the calling process already unlinked.
+            resource_tracker.ensure_running()
+
+        with futures.ProcessPoolExecutor(
+            max_workers=max_processes,
+            initializer=_init_process_pool_loader,
+            initargs=(self._to_process_pool_loader(),),
+        ) as executor:
+            try:
+                while True:
+                    # Only submit more sources when there is room, so sources and results don't pile up.
+                    while len(in_flight) < max_in_flight and (item := next(pending_sources, None)) is not None:
+                        key, source = item
+                        submitted_at = time.perf_counter()
+                        future = executor.submit(
+                            _load_in_process_pool, source, args, kwargs, use_shared_memory=self.use_shared_memory
+                        )
+
+                        in_flight[future] = (key, submitted_at)
+
+                    if not in_flight:
+                        break
+
+                    done, _ = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+
+                    for future in done:
+                        key, submitted_at = in_flight.pop(future)
+                        result, load_time = _read_process_pool_result(*future.result())
+
+                        results[key] = self._from_process_pool_result(result)
+                        load_timings[key] = BaseLoader.LoadTiming(
+                            load_time=load_time, total_time=time.perf_counter() - submitted_at
+                        )
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+
+                raise
+
+        self.load_timings = {key: load_timings[key] for key in sources_by_key}
+
+        return {key: results[key] for key in sources_by_key}
+
+
+def _init_process_pool_loader(loader: BaseLoader) -> None:
+    global _process_pool_loader
+
+    _process_pool_loader = loader
+
+
+def _load_in_process_pool(
+    source: Any, args: tuple, kwargs: dict, *, use_shared_memory: bool
+) -> tuple[Any, Optional[tuple[str, int]], float]:
+    """Loads a source with the Loader of this process.
+
+    Returns:
+        The result, or `None` if it was written to shared memory, the name and size of the shared memory block, and
+        the seconds spent in `load()`.
+    """
+    if _process_pool_loader is None:
+        raise RuntimeError("The process pool Loader hasn't been initialized.")
+
+    start = time.perf_counter()
+    result = _process_pool_loader.load(source, *args, **kwargs)
+    load_time = time.perf_counter() - start
+
+    if use_shared_memory:
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        block = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+
+        try:
+            block.buf[: len(data)] = data
+
+            return None, (block.name, len(data)), load_time
+        finally:
+            # The calling process unlinks the block once it has read it.
+            block.close()
+    else:
+        return result, None, load_time
+
+
+def _read_process_pool_result(result: Any, block: Optional[tuple[str, int]], load_time: float) -> tuple[Any, float]:
+    if block is not None:
+        name, size = block
+        shared_block = shared_memory.SharedMemory(name=name)
+
+        try:
+            result = pickle.loads(bytes(shared_block.buf[:size]))
+        finally:
+            shared_block.close()
+            shared_block.unlink()
+
+    return result, load_time
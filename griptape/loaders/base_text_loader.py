@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
-from attrs import Factory, define, field
+from attrs import Factory, define, evolve, field
 
 from griptape.artifacts import TextArtifact
 from griptape.artifacts.error_artifact import ErrorArtifact
@@ -12,8 +13,11 @@ from griptape.loaders import BaseLoader
 from griptape.tokenizers import OpenAiTokenizer
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
     from griptape.common import Reference
-    from griptape.drivers import BaseEmbeddingDriver
+    from griptape.drivers import BaseEmbeddingDriver, BaseVectorStoreDriver
 
 
 @define
@@ -38,6 +42,7 @@ class BaseTextLoader(BaseLoader, ABC):
     embedding_driver: Optional[BaseEmbeddingDriver] = field(default=None, kw_only=True)
     encoding: str = field(default="utf-8", kw_only=True)
     reference: Optional[Reference] = field(default=None, kw_only=True)
+    stream_batch_size: int = field(default=100, kw_only=True)
 
     @abstractmethod
     def load(self, source: Any, *args, **kwargs) -> ErrorArtifact | list[TextArtifact]: ...
@@ -48,15 +53,80 @@ class BaseTextLoader(BaseLoader, ABC):
             super().load_collection(sources, *args, **kwargs),
         )
 
+    def load_stream(self, source: Iterable[str] | TextIO) -> Iterator[TextArtifact]:
+        """Loads text as it is read, without holding all of it or all of its chunks in memory.
+
+        The text is chunked with `BaseChunker.iter_chunks()`, and chunks are embedded in batches of `stream_batch_size`.
+
+        Args:
+            source: Pieces of the text, or a file opened in text mode.
+
+        Returns:
+            The chunks, in order, yielded a batch at a time.
+        """
+        chunks = self.chunker.iter_chunks(source) if self.chunker else self.__read_whole_text(source)
+
+        while batch := list(islice(chunks, self.stream_batch_size)):
+            yield from self._chunks_to_artifacts(batch)
+
+    def load_stream_into_vector_store(
+        self,
+        source: Iterable[str] | TextIO,
+        vector_store_driver: BaseVectorStoreDriver,
+        *,
+        namespace: Optional[str] = None,
+        meta: Optional[dict] = None,
+    ) -> int:
+        """Loads text as it is read and upserts its chunks into a Vector Store in batches of `stream_batch_size`.
+
+        Args:
+            source: Pieces of the text, or a file opened in text mode.
+            vector_store_driver: The Vector Store Driver to upsert the chunks with.
+            namespace: The namespace to upsert the chunks into.
+            meta: Metadata to upsert with every chunk.
+
+        Returns:
+            The number of chunks upserted.
+        """
+        artifacts = self.load_stream(source)
+        count = 0
+
+        while batch := list(islice(artifacts, self.stream_batch_size)):
+            vector_store_driver.upsert_text_artifacts_batch(
+                batch if namespace is None else {namespace: batch}, meta=meta
+            )
+
+            count += len(batch)
+
+        return count
+
+    def _to_process_pool_loader(self) -> BaseTextLoader:
+        # Chunks are embedded in the calling process, so the Embedding Driver doesn't have to be picklable.
+        return evolve(super()._to_process_pool_loader(), embedding_driver=None)
+
+    def _from_process_pool_result(
+        self, result: ErrorArtifact | list[TextArtifact]
+    ) -> ErrorArtifact | list[TextArtifact]:
+        if isinstance(result, ErrorArtifact):
+            return result
+        else:
+            return self._chunks_to_artifacts(result)
+
     def _text_to_artifacts(self, text: str) -> list[TextArtifact]:
+        chunks = self.chunker.chunk(text) if self.chunker else [TextArtifact(text)]
+
+        return self._chunks_to_artifacts(chunks)
+
+    def _chunks_to_artifacts(self, chunks: list[TextArtifact]) -> list[TextArtifact]:
         artifacts = []
 
-        chunks = self.chunker.chunk(text) if self.chunker else [TextArtifact(text)]
+        if self.embedding_driver:
+            embeddings = self.embedding_driver.embed_strings([str(chunk.value) for chunk in chunks])
 
-        for chunk in chunks:
-            if self.embedding_driver:
-                chunk.generate_embedding(self.embedding_driver)
+            for chunk, embedding in zip(chunks, embeddings):
+                chunk.embedding = embedding
 
+        for chunk in chunks:
             chunk.reference = self.reference
 
             chunk.encoding = self.encoding
@@ -64,3 +134,6 @@ class BaseTextLoader(BaseLoader, ABC):
             artifacts.append(chunk)
 
         return artifacts
+
+    def __read_whole_text(self, source: Iterable[str] | TextIO) -> Iterator[TextArtifact]:
+        yield TextArtifact(source.read() if hasattr(source, "read") else "".join(source))  # pyright: ignore[reportAttributeAccessIssue]
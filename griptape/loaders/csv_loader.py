@@ -4,7 +4,7 @@ import csv
 from io import StringIO
 from typing import TYPE_CHECKING, Optional, Union, cast
 
-from attrs import define, field
+from attrs import define, evolve, field
 
 from griptape.artifacts import CsvRowArtifact, ErrorArtifact
 from griptape.loaders import BaseLoader
@@ -42,6 +42,19 @@ class CsvLoader(BaseLoader):
 
         return artifacts
 
+    def _to_process_pool_loader(self) -> CsvLoader:
+        # Rows are embedded in the calling process, so the Embedding Driver doesn't have to be picklable.
+        return evolve(super()._to_process_pool_loader(), embedding_driver=None)
+
+    def _from_process_pool_result(
+        self, result: ErrorArtifact | list[CsvRowArtifact]
+    ) -> ErrorArtifact | list[CsvRowArtifact]:
+        if self.embedding_driver and not isinstance(result, ErrorArtifact):
+            for chunk in result:
+                chunk.generate_embedding(self.embedding_driver)
+
+        return result
+
     def load_collection(
         self,
         sources: list[bytes | str],
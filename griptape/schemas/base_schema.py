@@ -102,6 +102,7 @@ class BaseSchema(Schema):
             attrs_cls: An attrs class.
         """
         from collections.abc import Sequence
+        from concurrent import futures
         from typing import Any
 
         from griptape.artifacts import BaseArtifact
@@ -119,6 +120,7 @@ class BaseSchema(Schema):
             BaseEmbeddingDriver,
             BaseImageGenerationDriver,
             BaseImageQueryDriver,
+            BasePromptCacheDriver,
             BasePromptDriver,
             BaseTextToSpeechDriver,
             BaseVectorStoreDriver,
@@ -128,13 +130,14 @@ class BaseSchema(Schema):
         from griptape.structures import Structure
         from griptape.tokenizers import BaseTokenizer
         from griptape.tools import BaseTool
-        from griptape.utils import import_optional_dependency, is_dependency_installed
+        from griptape.utils import RateLimiter, SingleFlight, import_optional_dependency, is_dependency_installed
 
         attrs.resolve_types(
             attrs_cls,
             localns={
                 "Any": Any,
                 "BasePromptDriver": BasePromptDriver,
+                "BasePromptCacheDriver": BasePromptCacheDriver,
                 "BaseImageQueryDriver": BaseImageQueryDriver,
                 "BaseEmbeddingDriver": BaseEmbeddingDriver,
                 "BaseVectorStoreDriver": BaseVectorStoreDriver,
@@ -155,6 +158,9 @@ class BaseSchema(Schema):
                 "Reference": Reference,
                 "Run": Run,
                 "Sequence": Sequence,
+                "futures": futures,
+                "RateLimiter": RateLimiter,
+                "SingleFlight": SingleFlight,
                 # Third party modules
                 "Client": import_optional_dependency("cohere").Client if is_dependency_installed("cohere") else Any,
                 "GenerativeModel": import_optional_dependency("google.generativeai").GenerativeModel
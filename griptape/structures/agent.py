@@ -46,10 +46,12 @@ class Agent(Structure):
 
     def add_task(self, task: BaseTask) -> BaseTask:
         self.tasks.clear()
+        self._task_index.clear()
 
         task.preprocess(self)
 
         self.tasks.append(task)
+        self._index_task(task)
 
         return task
 
@@ -68,3 +70,13 @@ class Agent(Structure):
             self.conversation_memory.add_run(run)
 
         return self
+
+    async def atry_run(self, *args) -> Agent:
+        await self.task.aexecute()
+
+        if self.conversation_memory and self.output is not None:
+            run = Run(input=self.input_task.input, output=self.output)
+
+            self.conversation_memory.add_run(run)
+
+        return self
@@ -23,6 +23,7 @@ class Pipeline(Structure):
             task.parent_ids.append(self.output_task.id)
 
         self.tasks.append(task)
+        self._index_task(task)
 
         return task
 
@@ -43,6 +44,7 @@ class Pipeline(Structure):
 
         parent_index = self.tasks.index(parent_task)
         self.tasks.insert(parent_index + 1, task)
+        self._index_task(task)
 
         return task
 
@@ -57,6 +59,22 @@ class Pipeline(Structure):
 
         return self
 
+    async def atry_run(self, *args) -> Pipeline:
+        task = self.input_task
+
+        while task is not None:
+            if isinstance(await task.aexecute(), ErrorArtifact) and self.fail_fast:
+                break
+
+            task = next(iter(task.children), None)
+
+        if self.conversation_memory and self.output is not None:
+            run = Run(input=self.input_task.input, output=self.output)
+
+            self.conversation_memory.add_run(run)
+
+        return self
+
     def context(self, task: BaseTask) -> dict[str, Any]:
         context = super().context(task)
 
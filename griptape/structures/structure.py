@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from logging import Logger
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ContextManager, Optional
 
 from attrs import Attribute, Factory, define, field
 from rich.logging import RichHandler
@@ -35,7 +37,7 @@ from griptape.memory.meta import MetaMemory
 from griptape.memory.structure import ConversationMemory
 from griptape.memory.task.storage import BlobArtifactStorage, TextArtifactStorage
 from griptape.mixins import EventPublisherMixin
-from griptape.utils import deprecation_warn
+from griptape.utils import ExecutionContext, deprecation_warn
 
 if TYPE_CHECKING:
     from griptape.memory.structure import BaseConversationMemory
@@ -74,8 +76,11 @@ class Structure(ABC, EventPublisherMixin):
     )
     meta_memory: MetaMemory = field(default=Factory(lambda: MetaMemory()), kw_only=True)
     fail_fast: bool = field(default=True, kw_only=True)
+    execution_context: Optional[ExecutionContext] = field(default=None, kw_only=True)
     _execution_args: tuple = ()
     _logger: Optional[Logger] = None
+    _task_index: dict[str, BaseTask] = field(factory=dict, init=False, eq=False, repr=False)
+    _task_graph_version: int = field(default=0, init=False, eq=False, repr=False)
 
     @rulesets.validator  # pyright: ignore[reportAttributeAccessIssue]
     def validate_rulesets(self, _: Attribute, rulesets: list[Ruleset]) -> None:
@@ -215,10 +220,24 @@ class Structure(ABC, EventPublisherMixin):
         return any(s for s in self.tasks if s.is_executing())
 
     def find_task(self, task_id: str) -> BaseTask:
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        raise ValueError(f"Task with id {task_id} doesn't exist.")
+        # Tasks appended to `tasks` directly aren't indexed yet, so the index is rebuilt when it falls out of sync.
+        if len(self._task_index) != len(self.tasks):
+            self._task_index = {task.id: task for task in reversed(self.tasks)}
+
+        task = self._task_index.get(task_id)
+
+        if task is None:
+            raise ValueError(f"Task with id {task_id} doesn't exist.")
+
+        return task
+
+    def invalidate_task_graph(self) -> None:
+        """Marks anything cached about the task graph as stale.
+
+        Called whenever tasks are added or their relationships change. Relationships edited through `parent_ids` and
+        `child_ids` directly are picked up once the Structure runs, since `resolve_relationships` invalidates the graph.
+        """
+        self._task_graph_version += 1
 
     def add_tasks(self, *tasks: BaseTask) -> list[BaseTask]:
         return [self.add_task(s) for s in tasks]
@@ -246,6 +265,9 @@ class Structure(ABC, EventPublisherMixin):
                 if task.id not in child.parent_ids:
                     child.parent_ids.append(task.id)
 
+        self._task_index = {task.id: task for task in reversed(self.tasks)}
+        self.invalidate_task_graph()
+
     @observable
     def before_run(self, args: Any) -> None:
         self._execution_args = args
@@ -276,15 +298,41 @@ class Structure(ABC, EventPublisherMixin):
     @abstractmethod
     def add_task(self, task: BaseTask) -> BaseTask: ...
 
+    def _activate_execution_context(self) -> ContextManager:
+        return nullcontext() if self.execution_context is None else self.execution_context.activate()
+
+    def _index_task(self, task: BaseTask) -> None:
+        self._task_index.setdefault(task.id, task)
+        self.invalidate_task_graph()
+
     @observable
     def run(self, *args) -> Structure:
-        self.before_run(args)
+        with self._activate_execution_context():
+            self.before_run(args)
+
+            result = self.try_run(*args)
+
+            self.after_run()
+
+        return result
+
+    async def arun(self, *args) -> Structure:
+        """Async counterpart of `run`, for running many Structures from a single event loop."""
+        with self._activate_execution_context():
+            self.before_run(args)
 
-        result = self.try_run(*args)
+            result = await self.atry_run(*args)
 
-        self.after_run()
+            self.after_run()
 
         return result
 
     @abstractmethod
     def try_run(self, *args) -> Structure: ...
+
+    async def atry_run(self, *args) -> Structure:
+        """Async counterpart of `try_run`.
+
+        Runs `try_run` in a worker thread. Structures that can await their Tasks should override this.
+        """
+        return await asyncio.to_thread(self.try_run, *args)
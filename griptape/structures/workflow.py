@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures as futures
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
 from graphlib import TopologicalSorter
 
+from griptape import utils
 from griptape.artifacts import ErrorArtifact
 from griptape.common import observable
 from griptape.memory.structure import Run
@@ -18,9 +20,11 @@ if TYPE_CHECKING:
 @define
 class Workflow(Structure):
     futures_executor_fn: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
+        default=Factory(lambda: lambda: utils.ExecutionContext.current_executor("tasks")),
         kw_only=True,
     )
+    _ordered_tasks: Optional[list[BaseTask]] = field(default=None, init=False, eq=False, repr=False)
+    _ordered_tasks_key: Optional[tuple[int, int]] = field(default=None, init=False, eq=False, repr=False)
 
     @property
     def output_task(self) -> Optional[BaseTask]:
@@ -30,6 +34,7 @@ class Workflow(Structure):
         task.preprocess(self)
 
         self.tasks.append(task)
+        self._index_task(task)
 
         return task
 
@@ -80,28 +85,38 @@ class Workflow(Structure):
 
         # Insert the new task once, just after the last parent task
         self.tasks.insert(last_parent_index + 1, task)
+        self._index_task(task)
 
         return task
 
     @observable
     def try_run(self, *args) -> Workflow:
-        exit_loop = False
+        """Runs the pending tasks, submitting each one as soon as its last unfinished parent finishes.
 
-        while not self.is_finished() and not exit_loop:
-            futures_list = {}
-            ordered_tasks = self.order_tasks()
+        Every task of the run is submitted to a single executor. If `fail_fast` is set and a task fails, tasks that
+        haven't started yet are cancelled and the run returns without waiting for the tasks still executing.
+        """
+        executor = self.futures_executor_fn()
+        failed = False
 
-            for task in ordered_tasks:
-                if task.can_execute():
-                    future = self.futures_executor_fn().submit(task.execute)
-                    futures_list[future] = task
+        try:
+            failed = self.__execute_tasks(executor)
+        finally:
+            executor.shutdown(wait=not failed, cancel_futures=failed)
 
-            # Wait for all tasks to complete
-            for future in futures.as_completed(futures_list):
-                if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
-                    exit_loop = True
+        if self.conversation_memory and self.output is not None:
+            run = Run(input=self.input_task.input, output=self.output)
+
+            self.conversation_memory.add_run(run)
+
+        return self
+
+    async def atry_run(self, *args) -> Workflow:
+        """Async counterpart of `try_run`, scheduling the tasks on the running event loop instead of an executor.
 
-                    break
+        If `fail_fast` is set and a task fails, the tasks still executing are cancelled.
+        """
+        await self.__aexecute_tasks()
 
         if self.conversation_memory and self.output is not None:
             run = Run(input=self.input_task.input, output=self.output)
@@ -125,19 +140,99 @@ class Workflow(Structure):
         return context
 
     def to_graph(self) -> dict[str, set[str]]:
-        graph: dict[str, set[str]] = {}
-
-        for key_task in self.tasks:
-            graph[key_task.id] = set()
+        graph: dict[str, set[str]] = {task.id: set() for task in self.tasks}
 
-            for value_task in self.tasks:
-                if key_task.id in value_task.child_ids:
-                    graph[key_task.id].add(value_task.id)
+        for task in self.tasks:
+            for child_id in task.child_ids:
+                if child_id in graph:
+                    graph[child_id].add(task.id)
 
         return graph
 
     def order_tasks(self) -> list[BaseTask]:
-        return [self.find_task(task_id) for task_id in TopologicalSorter(self.to_graph()).static_order()]
+        """Returns the tasks in topological order.
+
+        The order is cached until the task graph is invalidated, so repeated calls (e.g. through `output_task`) don't
+        sort the graph again.
+        """
+        key = (self._task_graph_version, len(self.tasks))
+
+        if self._ordered_tasks is None or self._ordered_tasks_key != key:
+            self._ordered_tasks = [
+                self.find_task(task_id) for task_id in TopologicalSorter(self.to_graph()).static_order()
+            ]
+            self._ordered_tasks_key = key
+
+        return list(self._ordered_tasks)
+
+    def __execute_tasks(self, executor: futures.Executor) -> bool:
+        """Executes the pending tasks on `executor`, returning whether the run stopped early on a failed task."""
+        futures_to_tasks: dict[futures.Future, BaseTask] = {}
+        unfinished_parent_counts = self.__unfinished_parent_counts()
+
+        for task in self.order_tasks():
+            if unfinished_parent_counts.get(task.id) == 0:
+                futures_to_tasks[executor.submit(task.execute)] = task
+
+        while futures_to_tasks:
+            done_futures, _ = futures.wait(futures_to_tasks, return_when=futures.FIRST_COMPLETED)
+
+            for future in done_futures:
+                task = futures_to_tasks.pop(future)
+
+                if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
+                    return True
+
+                for child in self.__ready_children(task, unfinished_parent_counts):
+                    futures_to_tasks[executor.submit(child.execute)] = child
+
+        return False
+
+    async def __aexecute_tasks(self) -> None:
+        asyncio_tasks: dict[asyncio.Task, BaseTask] = {}
+        unfinished_parent_counts = self.__unfinished_parent_counts()
+
+        for task in self.order_tasks():
+            if unfinished_parent_counts.get(task.id) == 0:
+                asyncio_tasks[asyncio.create_task(task.aexecute())] = task
+
+        try:
+            while asyncio_tasks:
+                done_tasks, _ = await asyncio.wait(asyncio_tasks, return_when=asyncio.FIRST_COMPLETED)
+
+                for asyncio_task in done_tasks:
+                    task = asyncio_tasks.pop(asyncio_task)
+
+                    if isinstance(asyncio_task.result(), ErrorArtifact) and self.fail_fast:
+                        return
+
+                    for child in self.__ready_children(task, unfinished_parent_counts):
+                        asyncio_tasks[asyncio.create_task(child.aexecute())] = child
+        finally:
+            for asyncio_task in asyncio_tasks:
+                asyncio_task.cancel()
+
+            await asyncio.gather(*asyncio_tasks, return_exceptions=True)
+
+    def __unfinished_parent_counts(self) -> dict[str, int]:
+        return {
+            task.id: sum(1 for parent in task.parents if not parent.is_finished())
+            for task in self.tasks
+            if task.is_pending()
+        }
+
+    def __ready_children(self, task: BaseTask, unfinished_parent_counts: dict[str, int]) -> list[BaseTask]:
+        """Marks `task` as finished in `unfinished_parent_counts`, returning the children it was the last parent of."""
+        ready_children = []
+
+        for child in task.children:
+            if child.id in unfinished_parent_counts:
+                unfinished_parent_counts[child.id] -= 1
+
+                if unfinished_parent_counts[child.id] == 0:
+                    ready_children.append(child)
+
+        return ready_children
 
     def __link_task_to_children(self, task: BaseTask, child_tasks: list[BaseTask]) -> None:
         for child_task in child_tasks:
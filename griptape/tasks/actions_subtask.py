@@ -16,6 +16,8 @@ from griptape.tasks import BaseTask
 from griptape.utils import remove_null_values_in_dict_recursively
 
 if TYPE_CHECKING:
+    from concurrent import futures
+
     from griptape.memory import TaskMemory
 
 
@@ -34,6 +36,8 @@ class ActionsSubtask(BaseTask):
         alias="input",
     )
     _memory: Optional[TaskMemory] = None
+    _submitted_actions: dict[str, futures.Future[tuple[str, BaseArtifact]]] = field(factory=dict, init=False)
+    _submitted_actions_executor: Optional[futures.Executor] = field(default=None, init=False)
 
     @property
     def input(self) -> TextArtifact | ListArtifact:
@@ -99,6 +103,29 @@ class ActionsSubtask(BaseTask):
         ]
         self.structure.logger.info("".join(parts))
 
+    def submit_action(self, action: ToolAction) -> None:
+        """Starts executing a Tool Action in the background, before the Subtask's input is complete.
+
+        Lets a Tool run while the LLM is still streaming the rest of its response. The Subtask must already have its
+        `parent_task_id` and `structure` set. `run()` joins the submitted actions instead of executing them again.
+        Actions that fail validation are not submitted, and are reported by `run()` once the input is parsed.
+
+        Args:
+            action: The Tool Action, as streamed by the Prompt Driver.
+        """
+        try:
+            action = self.__process_action_object(action.to_dict())
+        except Exception as e:
+            self.structure.logger.warning("Subtask %s\nSkipping early execution of action: %s", self.id, e)
+
+            return
+
+        if action.output is None:
+            if self._submitted_actions_executor is None:
+                self._submitted_actions_executor = self.futures_executor_fn()
+
+            self._submitted_actions[action.tag] = self._submitted_actions_executor.submit(self.execute_action, action)
+
     def run(self) -> BaseArtifact:
         try:
             if any(isinstance(a.output, ErrorArtifact) for a in self.actions):
@@ -119,6 +146,9 @@ class ActionsSubtask(BaseTask):
             self.structure.logger.exception("Subtask %s\n%s", self.id, e)
 
             self.output = ErrorArtifact(str(e), exception=e)
+        finally:
+            self.__join_submitted_actions()
+
         if self.output is not None:
             return self.output
         else:
@@ -126,14 +156,24 @@ class ActionsSubtask(BaseTask):
 
     def execute_actions(self, actions: list[ToolAction]) -> list[tuple[str, BaseArtifact]]:
         with self.futures_executor_fn() as executor:
-            results = utils.execute_futures_dict({a.tag: executor.submit(self.execute_action, a) for a in actions})
+            results = utils.execute_futures_dict(
+                {
+                    a.tag: self._submitted_actions.pop(a.tag, None) or executor.submit(self.execute_action, a)
+                    for a in actions
+                }
+            )
+
+        # Submitted actions were executed on their own copies of the Tool Actions.
+        for action in actions:
+            action.output = results[action.tag][1]
 
         return list(results.values())
 
     def execute_action(self, action: ToolAction) -> tuple[str, BaseArtifact]:
         if action.tool is not None:
             if action.path is not None:
-                output = action.tool.execute(getattr(action.tool, action.path), self, action)
+                with utils.ExecutionContext.current_limit("tools"):
+                    output = action.tool.execute(getattr(action.tool, action.path), self, action)
             else:
                 output = ErrorArtifact("action path not found")
         else:
@@ -201,6 +241,13 @@ class ActionsSubtask(BaseTask):
         else:
             raise ValueError(f"Invalid input type: {type(task_input)} ")
 
+    def __join_submitted_actions(self) -> None:
+        if self._submitted_actions_executor is not None:
+            self._submitted_actions_executor.shutdown(wait=True)
+
+            self._submitted_actions_executor = None
+            self._submitted_actions.clear()
+
     def __init_from_prompt(self, value: str) -> None:
         thought_matches = re.findall(self.THOUGHT_PATTERN, value, re.MULTILINE)
         actions_matches = re.findall(self.ACTIONS_PATTERN, value, re.DOTALL)
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
-from concurrent import futures
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
 
+from griptape import utils
 from griptape.artifacts import ErrorArtifact
 from griptape.events import FinishTaskEvent, StartTaskEvent
 
 if TYPE_CHECKING:
+    from concurrent import futures
+
     from griptape.artifacts import BaseArtifact
     from griptape.memory.meta import BaseMetaEntry
     from griptape.structures import Structure
@@ -34,7 +37,7 @@ class BaseTask(ABC):
     structure: Optional[Structure] = field(default=None, init=False)
     context: dict[str, Any] = field(factory=dict, kw_only=True)
     futures_executor_fn: Callable[[], futures.Executor] = field(
-        default=Factory(lambda: lambda: futures.ThreadPoolExecutor()),
+        default=Factory(lambda: lambda: utils.ExecutionContext.current_executor()),
         kw_only=True,
     )
 
@@ -81,6 +84,9 @@ class BaseTask(ABC):
         if parent_id not in self.parent_ids:
             self.parent_ids.append(parent_id)
 
+            if self.structure is not None:
+                self.structure.invalidate_task_graph()
+
     def add_children(self, children: list[str | BaseTask]) -> None:
         for child in children:
             self.add_child(child)
@@ -91,6 +97,9 @@ class BaseTask(ABC):
         if child_id not in self.child_ids:
             self.child_ids.append(child_id)
 
+            if self.structure is not None:
+                self.structure.invalidate_task_graph()
+
     def preprocess(self, structure: Structure) -> BaseTask:
         self.structure = structure
 
@@ -147,6 +156,25 @@ class BaseTask(ABC):
 
         return self.output
 
+    async def aexecute(self) -> Optional[BaseArtifact]:
+        """Async counterpart of `execute`, awaiting `arun` instead of calling `run`."""
+        try:
+            self.state = BaseTask.State.EXECUTING
+
+            self.before_run()
+
+            self.output = await self.arun()
+
+            self.after_run()
+        except Exception as e:
+            self.structure.logger.exception("%s %s\n%s", self.__class__.__name__, self.id, e)
+
+            self.output = ErrorArtifact(str(e), exception=e)
+        finally:
+            self.state = BaseTask.State.FINISHED
+
+        return self.output
+
     def can_execute(self) -> bool:
         return self.state == BaseTask.State.PENDING and all(parent.is_finished() for parent in self.parents)
 
@@ -159,6 +187,13 @@ class BaseTask(ABC):
     @abstractmethod
     def run(self) -> BaseArtifact: ...
 
+    async def arun(self) -> BaseArtifact:
+        """Async counterpart of `run`.
+
+        Runs `run` in a worker thread. Tasks that can await their Drivers should override this.
+        """
+        return await asyncio.to_thread(self.run)
+
     @property
     def full_context(self) -> dict[str, Any]:
         if self.structure:
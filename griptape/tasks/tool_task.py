@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from typing import TYPE_CHECKING, Optional
@@ -15,7 +16,7 @@ from griptape.utils import J2
 if TYPE_CHECKING:
     from schema import Schema
 
-    from griptape.common import PromptStack
+    from griptape.common import Message, PromptStack
     from griptape.memory import TaskMemory
     from griptape.structures import Structure
     from griptape.tools import BaseTool
@@ -62,6 +63,14 @@ class ToolTask(PromptTask, ActionsSubtaskOriginMixin):
     def run(self) -> BaseArtifact:
         result = self.prompt_driver.run(prompt_stack=self.prompt_stack)
 
+        return self.__run_action(result)
+
+    async def arun(self) -> BaseArtifact:
+        result = await self.prompt_driver.arun(prompt_stack=self.prompt_stack)
+
+        return await asyncio.to_thread(self.__run_action, result)
+
+    def __run_action(self, result: Message) -> BaseArtifact:
         if self.prompt_driver.use_native_tools:
             subtask_input = result.to_artifact()
         else:
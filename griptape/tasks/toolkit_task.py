@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import TYPE_CHECKING, Callable, Optional
 
@@ -40,6 +41,7 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
         kw_only=True,
     )
     response_stop_sequence: str = field(default=RESPONSE_STOP_SEQUENCE, kw_only=True)
+    execute_streamed_actions: bool = field(default=False, kw_only=True)
 
     def __attrs_post_init__(self) -> None:
         if self.task_memory:
@@ -167,8 +169,7 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
         if self.response_stop_sequence not in self.prompt_driver.tokenizer.stop_sequences:
             self.prompt_driver.tokenizer.stop_sequences.extend([self.response_stop_sequence])
 
-        result = self.prompt_driver.run(self.prompt_stack)
-        subtask = self.add_subtask(ActionsSubtask(result.to_artifact()))
+        subtask = self.__run_prompt()
 
         while True:
             if subtask.output is None:
@@ -182,8 +183,7 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
                     subtask.run()
                     subtask.after_run()
 
-                    result = self.prompt_driver.run(prompt_stack=self.prompt_stack)
-                    subtask = self.add_subtask(ActionsSubtask(result.to_artifact()))
+                    subtask = self.__run_prompt()
             else:
                 break
 
@@ -191,6 +191,67 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
 
         return self.output
 
+    async def arun(self) -> BaseArtifact:
+        from griptape.tasks import ActionsSubtask
+
+        self.subtasks.clear()
+
+        if self.response_stop_sequence not in self.prompt_driver.tokenizer.stop_sequences:
+            self.prompt_driver.tokenizer.stop_sequences.extend([self.response_stop_sequence])
+
+        subtask = await self.__arun_prompt()
+
+        while True:
+            if subtask.output is None:
+                if len(self.subtasks) >= self.max_subtasks:
+                    subtask.output = ErrorArtifact(f"Exceeded tool limit of {self.max_subtasks} subtasks per task")
+                elif not subtask.actions:
+                    # handle case when the LLM failed to follow the ReAct prompt and didn't return a proper action
+                    subtask.output = subtask.input
+                else:
+                    subtask.before_run()
+                    await asyncio.to_thread(subtask.run)
+                    subtask.after_run()
+
+                    subtask = await self.__arun_prompt()
+            else:
+                break
+
+        self.output = subtask.output
+
+        return self.output
+
+    def __run_prompt(self) -> ActionsSubtask:
+        """Runs the Prompt Stack and adds a Subtask for the response.
+
+        With `execute_streamed_actions`, each action call is submitted to the Subtask as soon as the Prompt Driver has
+        streamed it, so Tools run while the rest of the response is generated.
+        """
+        if not self.execute_streamed_actions:
+            return self.add_subtask(ActionsSubtask(self.prompt_driver.run(self.prompt_stack).to_artifact()))
+
+        subtask = self.__new_streamed_subtask()
+        result = self.prompt_driver.run(self.prompt_stack, on_action_call=subtask.submit_action)
+        subtask.input = result.to_artifact()
+
+        return self.add_subtask(subtask)
+
+    async def __arun_prompt(self) -> ActionsSubtask:
+        if not self.execute_streamed_actions:
+            return self.add_subtask(ActionsSubtask((await self.prompt_driver.arun(self.prompt_stack)).to_artifact()))
+
+        subtask = self.__new_streamed_subtask()
+        result = await self.prompt_driver.arun(self.prompt_stack, on_action_call=subtask.submit_action)
+        subtask.input = result.to_artifact()
+
+        return self.add_subtask(subtask)
+
+    def __new_streamed_subtask(self) -> ActionsSubtask:
+        subtask = ActionsSubtask(parent_task_id=self.id)
+        subtask.structure = self.structure
+
+        return subtask
+
     def find_subtask(self, subtask_id: str) -> ActionsSubtask:
         for subtask in self.subtasks:
             if subtask.id == subtask_id:
@@ -21,5 +21,5 @@ class AnthropicTokenizer(BaseTokenizer):
         kw_only=True,
     )
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return self.client.count_tokens(text)
@@ -2,12 +2,29 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, cast
 
 from attrs import Factory, define, field
 
+from griptape.utils import str_to_hash
+
+if TYPE_CHECKING:
+    from griptape.utils import TokenCountCache
+
 
 @define()
 class BaseTokenizer(ABC):
+    """Base class for the Tokenizers.
+
+    Attributes:
+        model: The model name.
+        stop_sequences: Sequences that stop the generation.
+        max_input_tokens: Maximum number of input tokens of the model.
+        max_output_tokens: Maximum number of output tokens of the model.
+        token_count_cache: Caches the token counts of `count_tokens()`, so repeated strings are only counted once.
+            Share one Token Count Cache between Tokenizers to give them a common cache.
+    """
+
     DEFAULT_MAX_INPUT_TOKENS = 4096
     DEFAULT_MAX_OUTPUT_TOKENS = 1000
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {}
@@ -17,6 +34,7 @@ class BaseTokenizer(ABC):
     stop_sequences: list[str] = field(default=Factory(list), kw_only=True)
     max_input_tokens: int = field(kw_only=True, default=None)
     max_output_tokens: int = field(kw_only=True, default=None)
+    token_count_cache: Optional[TokenCountCache] = field(default=None, kw_only=True)
 
     def __attrs_post_init__(self) -> None:
         if hasattr(self, "model"):
@@ -42,8 +60,65 @@ class BaseTokenizer(ABC):
         else:
             return 0
 
+    def count_tokens(self, text: str) -> int:
+        if self.token_count_cache is None:
+            return self.try_count_tokens(text)
+
+        return self.token_count_cache.get_or_count(
+            self._token_count_cache_key(text), lambda: self.try_count_tokens(text)
+        )
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of several strings.
+
+        Cached counts are looked up first, and the rest are counted together with `try_count_tokens_batch()`.
+
+        Args:
+            texts: The strings to count.
+
+        Returns:
+            The token count of each string, in the same order as `texts`.
+        """
+        if self.token_count_cache is None:
+            return self.try_count_tokens_batch(texts)
+
+        keys = [self._token_count_cache_key(text) for text in texts]
+        counts = [self.token_count_cache.get(key) for key in keys]
+        missing_indexes = [index for index, count in enumerate(counts) if count is None]
+
+        if missing_indexes:
+            missing_counts = self.try_count_tokens_batch([texts[index] for index in missing_indexes])
+
+            for index, count in zip(missing_indexes, missing_counts):
+                counts[index] = count
+                self.token_count_cache.set(keys[index], count)
+
+        return cast(list[int], counts)
+
+    def token_offsets(self, text: str) -> Optional[list[int]]:
+        """Returns the offset of the first character of each token of `text`, or `None` if the Tokenizer can't tell.
+
+        Lets callers estimate the token count of any span of `text` without tokenizing it again.
+        """
+        return None
+
     @abstractmethod
-    def count_tokens(self, text: str) -> int: ...
+    def try_count_tokens(self, text: str) -> int: ...
+
+    def try_count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of several strings without the cache.
+
+        Counts the strings one by one. Tokenizers that can count several strings at once should override this.
+        """
+        return [self.try_count_tokens(text) for text in texts]
+
+    def _token_count_cache_key(self, text: str) -> str:
+        # Stop sequences can be counted as special tokens, so they are part of the key.
+        return str_to_hash(
+            "\x00".join(
+                [self.__class__.__name__, str(getattr(self, "model", None)), *self.stop_sequences, str_to_hash(text)]
+            )
+        )
 
     def _default_max_input_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_INPUT_TOKENS.items() if self.model.startswith(k)), None)
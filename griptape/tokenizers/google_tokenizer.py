@@ -22,7 +22,7 @@ class GoogleTokenizer(BaseTokenizer):
         kw_only=True,
     )
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return self.model_client.count_tokens(text).total_tokens
 
     def _default_model_client(self) -> GenerativeModel:
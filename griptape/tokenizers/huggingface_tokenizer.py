@@ -26,5 +26,5 @@ class HuggingFaceTokenizer(BaseTokenizer):
     )
     max_output_tokens: int = field(default=4096, kw_only=True)
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         return len(self.tokenizer.encode(text))
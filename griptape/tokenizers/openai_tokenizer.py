@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from itertools import accumulate
 from typing import Optional
 
 import tiktoken
@@ -18,6 +19,8 @@ class OpenAiTokenizer(BaseTokenizer):
     DEFAULT_MAX_TOKENS = 2049
     DEFAULT_MAX_OUTPUT_TOKENS = 4096
     TOKEN_OFFSET = 8
+    # tiktoken starts a thread pool for every batch, which costs more than it saves on small batches.
+    MIN_THREADED_BATCH_SIZE = 64
 
     # https://platform.openai.com/docs/models/gpt-4-and-gpt-4-turbo
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {
@@ -52,13 +55,12 @@ class OpenAiTokenizer(BaseTokenizer):
         kw_only=True,
         default=Factory(lambda self: self._default_max_output_tokens(), takes_self=True),
     )
+    batch_num_threads: int = field(default=8, kw_only=True)
+    _encodings: dict[str, tiktoken.Encoding] = field(factory=dict, init=False)
 
     @property
     def encoding(self) -> tiktoken.Encoding:
-        try:
-            return tiktoken.encoding_for_model(self.model)
-        except KeyError:
-            return tiktoken.get_encoding(self.DEFAULT_ENCODING)
+        return self._get_encoding(self.model)
 
     def _default_max_input_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_INPUT_TOKENS.items() if self.model.startswith(k)), None)
@@ -85,13 +87,7 @@ class OpenAiTokenizer(BaseTokenizer):
         """
         if isinstance(text, list):
             model = model or self.model
-
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
-                logging.warning("model not found. Using cl100k_base encoding.")
-
-                encoding = tiktoken.get_encoding("cl100k_base")
+            encoding = self._get_encoding(model)
 
             if model in {
                 "gpt-3.5-turbo-0613",
@@ -126,17 +122,65 @@ class OpenAiTokenizer(BaseTokenizer):
                 )
 
             num_tokens = 0
+            values = []
 
             for message in text:
                 num_tokens += tokens_per_message
                 for key, value in message.items():
-                    num_tokens += len(encoding.encode(value))
+                    values.append(value)
                     if key == "name":
                         num_tokens += tokens_per_name
 
+            num_tokens += sum(len(tokens) for tokens in encoding.encode_batch(values))
+
             # every reply is primed with <|start|>assistant<|message|>
             num_tokens += 3
 
             return num_tokens
         else:
-            return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+            return super().count_tokens(text)
+
+    def try_count_tokens(self, text: str) -> int:
+        return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+
+    def try_count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of several strings with tiktoken's multi-threaded batch encoding."""
+        if len(texts) < self.MIN_THREADED_BATCH_SIZE:
+            return [self.try_count_tokens(text) for text in texts]
+
+        return [
+            len(tokens)
+            for tokens in self.encoding.encode_batch(
+                texts, num_threads=self.batch_num_threads, allowed_special=set(self.stop_sequences)
+            )
+        ]
+
+    def token_offsets(self, text: str) -> list[int]:
+        encoding = self.encoding
+        tokens = encoding.encode(text, allowed_special=set(self.stop_sequences))
+
+        if not tokens:
+            return []
+        elif text.isascii():
+            # Every character is a single byte, so the byte offsets of the tokens are also their character offsets.
+            return [0, *accumulate(len(token_bytes) for token_bytes in encoding.decode_tokens_bytes(tokens[:-1]))]
+        else:
+            _, offsets = encoding.decode_with_offsets(tokens)
+
+            return offsets
+
+    def _get_encoding(self, model: str) -> tiktoken.Encoding:
+        """Returns the encoding of `model`, resolving it once per Tokenizer."""
+        encoding = self._encodings.get(model)
+
+        if encoding is None:
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                logging.warning("model not found. Using %s encoding.", self.DEFAULT_ENCODING)
+
+                encoding = tiktoken.get_encoding(self.DEFAULT_ENCODING)
+
+            self._encodings[model] = encoding
+
+        return encoding
@@ -10,7 +10,7 @@ class SimpleTokenizer(BaseTokenizer):
     model: str = field(init=False, kw_only=True)
     characters_per_token: int = field(kw_only=True)
 
-    def count_tokens(self, text: str) -> int:
+    def try_count_tokens(self, text: str) -> int:
         num_tokens = (len(text) + self.characters_per_token - 1) // self.characters_per_token
 
         return num_tokens
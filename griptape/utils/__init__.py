@@ -7,6 +7,11 @@ from .command_runner import CommandRunner
 from .chat import Chat
 from .futures import execute_futures_dict
 from .futures import execute_futures_list
+from .execution_context import ExecutionContext
+from .rate_limiter import RateLimiter
+from .single_flight import SingleFlight
+from .micro_batcher import MicroBatcher
+from .token_count_cache import TokenCountCache
 from .token_counter import TokenCounter
 from .dict_utils import remove_null_values_in_dict_recursively, dict_merge, remove_key_in_dict_recursively
 from .file_utils import load_file, load_files
@@ -37,6 +42,11 @@ __all__ = [
     "is_dependency_installed",
     "execute_futures_dict",
     "execute_futures_list",
+    "ExecutionContext",
+    "RateLimiter",
+    "SingleFlight",
+    "MicroBatcher",
+    "TokenCountCache",
     "TokenCounter",
     "remove_null_values_in_dict_recursively",
     "dict_merge",
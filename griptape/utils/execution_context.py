@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent import futures
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Optional
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_current_execution_context: contextvars.ContextVar[Optional[ExecutionContext]] = contextvars.ContextVar(
+    "griptape_execution_context", default=None
+)
+
+
+@define
+class ExecutionContext:
+    """A bounded thread pool shared by a Structure and every component that runs under it.
+
+    While a context is active, components that default to `ExecutionContext.current_executor()` submit their work to
+    the shared pool instead of creating a `ThreadPoolExecutor` of their own, and calls wrapped in
+    `ExecutionContext.current_limit()` are capped by `concurrency_limits`. Work submitted from a pool thread while every
+    worker is busy runs in the submitting thread, so nested executors can't deadlock the pool.
+
+    Attributes:
+        max_workers: Maximum number of threads in the shared pool.
+        concurrency_limits: Maximum number of concurrent calls for each kind of work, for example
+            `{"prompt": 16, "embedding": 64, "tools": 8}`. Kinds without a limit are only bounded by `max_workers`.
+    """
+
+    @define(frozen=True)
+    class LimitMetrics:
+        limit: int = field(kw_only=True)
+        active: int = field(kw_only=True)
+        waiting: int = field(kw_only=True)
+
+    @define(frozen=True)
+    class Metrics:
+        max_workers: int = field(kw_only=True)
+        active: int = field(kw_only=True)
+        queue_depth: int = field(kw_only=True)
+        completed: int = field(kw_only=True)
+        limits: dict[str, ExecutionContext.LimitMetrics] = field(kw_only=True)
+
+        @property
+        def utilization(self) -> float:
+            return self.active / self.max_workers
+
+    @define
+    class _Limit:
+        limit: int = field()
+        active: int = field(default=0, init=False)
+        waiting: int = field(default=0, init=False)
+        condition: threading.Condition = field(factory=threading.Condition, init=False)
+
+    max_workers: int = field(default=32, kw_only=True)
+    concurrency_limits: dict[str, int] = field(factory=dict, kw_only=True)
+    _executor: Optional[futures.ThreadPoolExecutor] = field(default=None, init=False)
+    _limits: dict[str, ExecutionContext._Limit] = field(init=False)
+    _queued: int = field(default=0, init=False)
+    _active: int = field(default=0, init=False)
+    _completed: int = field(default=0, init=False)
+    _thread_lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _worker_state: threading.local = field(factory=threading.local, init=False)
+
+    @max_workers.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_max_workers(self, _: Any, max_workers: int) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+    def __attrs_post_init__(self) -> None:
+        self._limits = {name: ExecutionContext._Limit(limit) for name, limit in self.concurrency_limits.items()}
+
+    @classmethod
+    def current(cls) -> Optional[ExecutionContext]:
+        """Returns the active Execution Context, if any."""
+        return _current_execution_context.get()
+
+    @classmethod
+    def current_executor(cls, name: Optional[str] = None) -> futures.Executor:
+        """Returns an executor for `name` work in the active Execution Context, or a new `ThreadPoolExecutor` if none is active."""
+        execution_context = cls.current()
+
+        return futures.ThreadPoolExecutor() if execution_context is None else execution_context.executor(name)
+
+    @classmethod
+    def current_limit(cls, name: str) -> ContextManager:
+        """Returns a context manager that holds a `name` slot of the active Execution Context, if any."""
+        execution_context = cls.current()
+
+        return nullcontext() if execution_context is None else execution_context.limit(name)
+
+    @property
+    def metrics(self) -> Metrics:
+        with self._thread_lock:
+            active = self._active
+            queued = self._queued
+            completed = self._completed
+
+        limits = {}
+        for name, limit in self._limits.items():
+            with limit.condition:
+                limits[name] = ExecutionContext.LimitMetrics(
+                    limit=limit.limit, active=limit.active, waiting=limit.waiting
+                )
+
+        return ExecutionContext.Metrics(
+            max_workers=self.max_workers,
+            active=active,
+            queue_depth=queued + sum(limit.waiting for limit in limits.values()),
+            completed=completed,
+            limits=limits,
+        )
+
+    @contextmanager
+    def activate(self) -> Iterator[ExecutionContext]:
+        """Makes this the active Execution Context for the current thread or task, and for the work it submits."""
+        token = _current_execution_context.set(self)
+
+        try:
+            yield self
+        finally:
+            _current_execution_context.reset(token)
+
+    def executor(self, name: Optional[str] = None) -> futures.Executor:
+        """Returns an executor that submits `name` work to the shared pool.
+
+        Shutting the returned executor down only waits for, or cancels, the work submitted through it.
+        """
+        return _SharedExecutor(self, name)
+
+    @contextmanager
+    def limit(self, name: str) -> Iterator[None]:
+        """Holds one of the `name` slots from `concurrency_limits` for the duration of the block."""
+        limit = self._limits.get(name)
+
+        if limit is None:
+            yield
+            return
+
+        with limit.condition:
+            limit.waiting += 1
+            try:
+                limit.condition.wait_for(lambda: limit.active < limit.limit)
+            finally:
+                limit.waiting -= 1
+            limit.active += 1
+
+        try:
+            yield
+        finally:
+            with limit.condition:
+                limit.active -= 1
+                limit.condition.notify()
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        with self._thread_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def submit(self, name: Optional[str], fn: Callable, /, *args, **kwargs) -> futures.Future:
+        context = contextvars.copy_context()
+
+        with self._thread_lock:
+            # Running inline keeps a pool thread from waiting on work that no free thread can pick up.
+            run_inline = getattr(self._worker_state, "is_worker", False) and (
+                self._queued + self._active >= self.max_workers
+            )
+
+            if not run_inline:
+                self._queued += 1
+
+        if run_inline:
+            future = futures.Future()
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self._call(name, context, fn, args, kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            return future
+
+        future = self._get_executor().submit(self._run, name, context, fn, args, kwargs)
+        future.add_done_callback(self._on_done)
+
+        return future
+
+    def _get_executor(self) -> futures.ThreadPoolExecutor:
+        with self._thread_lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="griptape",
+                    initializer=self._init_worker,
+                )
+
+            return self._executor
+
+    def _init_worker(self) -> None:
+        self._worker_state.is_worker = True
+
+    def _run(self, name: Optional[str], context: contextvars.Context, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        with self._thread_lock:
+            self._queued -= 1
+            self._active += 1
+
+        try:
+            return self._call(name, context, fn, args, kwargs)
+        finally:
+            with self._thread_lock:
+                self._active -= 1
+                self._completed += 1
+
+    def _call(self, name: Optional[str], context: contextvars.Context, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        with self.limit(name) if name is not None else nullcontext():
+            return context.run(fn, *args, **kwargs)
+
+    def _on_done(self, future: futures.Future) -> None:
+        # Cancelled work never reaches `_run`, so it's still counted as queued.
+        if future.cancelled():
+            with self._thread_lock:
+                self._queued -= 1
+
+
+class _SharedExecutor(futures.Executor):
+    def __init__(self, execution_context: ExecutionContext, name: Optional[str]) -> None:
+        self._execution_context = execution_context
+        self._name = name
+        self._futures: set[futures.Future] = set()
+        self._thread_lock = threading.Lock()
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> futures.Future:
+        future = self._execution_context.submit(self._name, fn, *args, **kwargs)
+
+        with self._thread_lock:
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        with self._thread_lock:
+            pending_futures = list(self._futures)
+
+        if cancel_futures:
+            for future in pending_futures:
+                future.cancel()
+
+        if wait:
+            futures.wait(pending_futures)
+
+    def _discard(self, future: futures.Future) -> None:
+        with self._thread_lock:
+            self._futures.discard(future)
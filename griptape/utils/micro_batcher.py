@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent import futures
+from typing import Callable, Generic, Optional, TypeVar
+
+from attrs import define, field
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@define
+class MicroBatcher(Generic[T, R]):
+    """Collects items submitted from many threads and processes them in batches on a background thread.
+
+    A batch is processed once it holds `max_batch_size` items, or `max_wait` seconds after its first item arrived,
+    whichever comes first. Each submitter gets a future for its own item's result.
+
+    Attributes:
+        process_batch_fn: Processes a batch of items, returning one result per item in the same order.
+        max_batch_size: Maximum number of items in a batch.
+        max_wait: Maximum number of seconds an item waits for the batch to fill up.
+    """
+
+    process_batch_fn: Callable[[list[T]], list[R]] = field(kw_only=True)
+    max_batch_size: int = field(default=8, kw_only=True)
+    max_wait: float = field(default=0.01, kw_only=True)
+    _pending: deque[tuple[T, futures.Future[R], float]] = field(factory=deque, init=False)
+    _condition: threading.Condition = field(factory=threading.Condition, init=False)
+    _worker: Optional[threading.Thread] = field(default=None, init=False)
+
+    def submit(self, item: T) -> futures.Future[R]:
+        future = futures.Future()
+
+        with self._condition:
+            self._pending.append((item, future, time.monotonic()))
+
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="griptape-micro-batcher", daemon=True)
+                self._worker.start()
+
+            self._condition.notify()
+
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+
+            if batch is None:
+                return
+
+            batch = [entry for entry in batch if entry[1].set_running_or_notify_cancel()]
+            items = [item for item, _, _ in batch]
+
+            try:
+                results = self.process_batch_fn(items)
+
+                if len(results) != len(items):
+                    raise ValueError(f"Expected {len(items)} results, got {len(results)}.")
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future, _), result in zip(batch, results):
+                    future.set_result(result)
+
+    def _next_batch(self) -> Optional[list[tuple[T, futures.Future[R], float]]]:
+        """Waits for the next batch to be ready, or returns `None` once no item arrived for `max_wait` seconds."""
+        with self._condition:
+            if not self._pending:
+                self._condition.wait(timeout=self.max_wait)
+
+                if not self._pending:
+                    # Let the thread exit while idle. The next `submit` starts a new one.
+                    self._worker = None
+
+                    return None
+
+            deadline = self._pending[0][2] + self.max_wait
+
+            while len(self._pending) < self.max_batch_size and (remaining := deadline - time.monotonic()) > 0:
+                self._condition.wait(timeout=remaining)
+
+            return [self._pending.popleft() for _ in range(min(self.max_batch_size, len(self._pending)))]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from attrs import define, field
+
+
+@define
+class RateLimiter:
+    """Client-side token bucket limiter for requests-per-minute and tokens-per-minute budgets.
+
+    A pair of buckets is kept for every key, so a single limiter can be shared by all the Drivers of a provider and
+    model. Both buckets start full and refill continuously. Callers that don't fit in the budgets block until they do,
+    and are served in the order they arrived.
+
+    Attributes:
+        requests_per_minute: Maximum number of requests per minute for each key. `None` means no limit.
+        tokens_per_minute: Maximum number of tokens per minute for each key. `None` means no limit.
+        clock: Returns the current time in seconds.
+    """
+
+    @define
+    class _Bucket:
+        requests: float = field()
+        tokens: float = field()
+        updated_at: float = field()
+        waiters: deque[object] = field(factory=deque, init=False)
+
+    requests_per_minute: Optional[int] = field(default=None, kw_only=True)
+    tokens_per_minute: Optional[int] = field(default=None, kw_only=True)
+    clock: Callable[[], float] = field(default=time.monotonic, kw_only=True)
+    _buckets: dict[str, RateLimiter._Bucket] = field(factory=dict, init=False)
+    _condition: threading.Condition = field(factory=threading.Condition, init=False)
+
+    def acquire(self, key: str, tokens: int = 0) -> int:
+        """Blocks until a request of `tokens` fits in the budgets of `key`.
+
+        Requests larger than `tokens_per_minute` are only charged `tokens_per_minute`, so they can still be sent.
+
+        Args:
+            key: Key of the budgets, usually the provider and model.
+            tokens: Estimated number of tokens of the request.
+
+        Returns:
+            The number of tokens charged, to pass to `reconcile` once the actual usage is known.
+        """
+        if self.tokens_per_minute is not None:
+            tokens = min(tokens, self.tokens_per_minute)
+
+        with self._condition:
+            bucket = self._get_bucket(key)
+            ticket = object()
+            bucket.waiters.append(ticket)
+
+            try:
+                while True:
+                    wait_time = self._wait_time(bucket, tokens) if bucket.waiters[0] is ticket else None
+
+                    if wait_time == 0:
+                        bucket.requests -= 1
+                        bucket.tokens -= tokens
+
+                        return tokens
+
+                    self._condition.wait(timeout=wait_time)
+            finally:
+                bucket.waiters.remove(ticket)
+                self._condition.notify_all()
+
+    def reconcile(self, key: str, charged_tokens: int, used_tokens: int) -> None:
+        """Corrects the tokens charged by `acquire` with the tokens the request actually used.
+
+        Args:
+            key: Key passed to `acquire`.
+            charged_tokens: Tokens returned by `acquire`.
+            used_tokens: Tokens the request actually used.
+        """
+        with self._condition:
+            bucket = self._get_bucket(key)
+            bucket.tokens -= used_tokens - charged_tokens
+
+            if self.tokens_per_minute is not None:
+                bucket.tokens = min(bucket.tokens, self.tokens_per_minute)
+
+            self._condition.notify_all()
+
+    def _get_bucket(self, key: str) -> RateLimiter._Bucket:
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            bucket = RateLimiter._Bucket(
+                requests=self.requests_per_minute or 0,
+                tokens=self.tokens_per_minute or 0,
+                updated_at=self.clock(),
+            )
+            self._buckets[key] = bucket
+
+        return bucket
+
+    def _wait_time(self, bucket: RateLimiter._Bucket, tokens: int) -> float:
+        """Refills `bucket` and returns how long to wait until a request of `tokens` fits in it."""
+        now = self.clock()
+        elapsed = now - bucket.updated_at
+        bucket.updated_at = now
+        wait_time = 0.0
+
+        if self.requests_per_minute is not None:
+            refill_rate = self.requests_per_minute / 60
+            bucket.requests = min(self.requests_per_minute, bucket.requests + elapsed * refill_rate)
+            wait_time = max(wait_time, (1 - bucket.requests) / refill_rate)
+        else:
+            bucket.requests = 1
+
+        if self.tokens_per_minute is not None:
+            refill_rate = self.tokens_per_minute / 60
+            bucket.tokens = min(self.tokens_per_minute, bucket.tokens + elapsed * refill_rate)
+            wait_time = max(wait_time, (tokens - bucket.tokens) / refill_rate)
+        else:
+            bucket.tokens = tokens
+
+        return max(wait_time, 0.0)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent import futures
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+from attrs import define, field
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+T = TypeVar("T")
+
+
+@define
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into a single call.
+
+    The first caller for a key runs the call, and callers that arrive while it's in flight wait for its result, or its
+    exception, instead of running it again. Once the call finishes, the next caller for the key runs it again, so
+    results are never reused after the fact.
+    """
+
+    _futures: dict[str, futures.Future] = field(factory=dict, init=False)
+    _thread_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Runs `fn`, unless a call for `key` is already in flight, in which case waits for that call's result.
+
+        Returns:
+            The result, and whether it was shared from another caller's call.
+        """
+        future, is_leader = self._join(key)
+
+        if not is_leader:
+            return future.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future, exception=e)
+
+            raise
+
+        self._finish(key, future, result=result)
+
+        return result, False
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Async counterpart of `do`, coalesced with both sync and async callers."""
+        future, is_leader = self._join(key)
+
+        if not is_leader:
+            return await asyncio.wrap_future(future), True
+
+        try:
+            result = await fn()
+        except BaseException as e:
+            self._finish(key, future, exception=e)
+
+            raise
+
+        self._finish(key, future, result=result)
+
+        return result, False
+
+    def _join(self, key: str) -> tuple[futures.Future, bool]:
+        with self._thread_lock:
+            future = self._futures.get(key)
+
+            if future is not None:
+                return future, False
+
+            future = self._futures[key] = futures.Future()
+
+            return future, True
+
+    def _finish(
+        self, key: str, future: futures.Future, *, result: object = None, exception: BaseException | None = None
+    ) -> None:
+        with self._thread_lock:
+            del self._futures[key]
+
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from attrs import define, field
+
+
+@define
+class TokenCountCache:
+    """Thread-safe LRU cache of token counts, shared between Tokenizers.
+
+    Keys are built by the Tokenizer from its class, model and stop sequences, along with a hash of the counted text,
+    so a single cache can be shared by Tokenizers of different models.
+
+    Attributes:
+        max_entries: Maximum number of token counts kept. Least recently used counts are evicted first.
+        hits: Number of token counts found in the cache.
+        misses: Number of token counts computed by a Tokenizer.
+    """
+
+    max_entries: int = field(default=10_000, kw_only=True)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: OrderedDict[str, int] = field(factory=OrderedDict, init=False)
+    _thread_lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    @max_entries.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_max_entries(self, _: Any, max_entries: int) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks can't be pickled, for example when a Loader is sent to a process pool.
+        with self._thread_lock:
+            return {
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": OrderedDict(self._entries),
+            }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.max_entries = state["max_entries"]
+        self.hits = state["hits"]
+        self.misses = state["misses"]
+        self._entries = state["entries"]
+        self._thread_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[int]:
+        """Returns the token count cached for `key`, or `None` if there isn't one."""
+        with self._thread_lock:
+            count = self._entries.get(key)
+
+            if count is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+            return count
+
+    def set(self, key: str, count: int) -> None:
+        with self._thread_lock:
+            self._entries[key] = count
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_count(self, key: str, count_fn: Callable[[], int]) -> int:
+        """Returns the token count cached for `key`, calling `count_fn` to compute and cache it on a miss.
+
+        `count_fn` runs outside the lock, so concurrent misses on the same key may both compute the count.
+        """
+        count = self.get(key)
+
+        if count is None:
+            count = count_fn()
+
+            self.set(key, count)
+
+        return count
+
+    def clear(self) -> None:
+        """Removes every cached token count and resets the statistics."""
+        with self._thread_lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
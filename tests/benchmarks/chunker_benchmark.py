@@ -0,0 +1,86 @@
+"""Compares the token offsets chunking engine of `BaseChunker` with the recursive one.
+
+Run with `python -m tests.benchmarks.chunker_benchmark`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from griptape.chunkers import BaseChunker, MarkdownChunker, PdfChunker, TextChunker
+
+WORDS = [
+    "griptape", "structure", "agent", "pipeline", "workflow", "task", "memory", "driver", "prompt", "vector",
+    "embedding", "chunk", "token", "the", "a", "of", "and", "to", "in", "is", "for", "with", "on", "that",
+]  # fmt: skip
+
+
+def generate_document(size: int, *, markdown: bool, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    paragraphs = []
+    length = 0
+
+    while length < size:
+        sentences = [
+            rng.choice([" ", "  "]).join(rng.choice(WORDS) for _ in range(rng.randint(4, 30))).capitalize()
+            + rng.choice([".", "!", "?"])
+            for _ in range(rng.randint(1, 12))
+        ]
+        paragraph = " ".join(sentences)
+
+        if markdown and rng.random() < 0.2:
+            paragraph = f"{'#' * rng.randint(2, 4)} {rng.choice(WORDS).capitalize()}\n{paragraph}"
+
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+
+    return "\n\n".join(paragraphs)
+
+
+def run(chunker: BaseChunker, text: str) -> tuple[list[str], list[str], float, float]:
+    # Load the encoding before timing either engine.
+    chunker.tokenizer.count_tokens(text[:100])
+
+    start = time.perf_counter()
+    recursive_chunks = chunker._chunk_recursively(text)
+    recursive_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    token_offsets = chunker.tokenizer.token_offsets(text)
+    if token_offsets is None:
+        raise ValueError(f"{chunker.tokenizer.__class__.__name__} doesn't provide token offsets.")
+    offset_chunks = chunker._chunk_by_token_offsets(text, token_offsets)
+    offset_time = time.perf_counter() - start
+
+    return recursive_chunks, offset_chunks, recursive_time, offset_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--max-tokens", type=int, nargs="+", default=[50, 500])
+    args = parser.parse_args()
+
+    print(f"{'chunker':<16}{'chars':>10}{'max':>6}{'chunks':>8}{'recursive':>12}{'offsets':>10}{'speedup':>9}  match")  # noqa: T201
+
+    for chunker_class in (TextChunker, MarkdownChunker, PdfChunker):
+        for size in args.sizes:
+            text = generate_document(size, markdown=chunker_class is MarkdownChunker)
+
+            for max_tokens in args.max_tokens:
+                recursive_chunks, offset_chunks, recursive_time, offset_time = run(
+                    chunker_class(max_tokens=max_tokens), text
+                )
+                matching = len(set(recursive_chunks) & set(offset_chunks)) / max(len(recursive_chunks), 1)
+
+                print(  # noqa: T201
+                    f"{chunker_class.__name__:<16}{size:>10}{max_tokens:>6}{len(offset_chunks):>8}"
+                    f"{recursive_time:>11.2f}s{offset_time:>9.2f}s{recursive_time / offset_time:>8.1f}x"
+                    f"  {'identical' if recursive_chunks == offset_chunks else f'{matching:.1%} of chunks'}"
+                )
+
+
+if __name__ == "__main__":
+    main()
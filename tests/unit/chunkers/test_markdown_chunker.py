@@ -15,11 +15,11 @@ class TestTextChunker:
         text = [
             "## Header 1\n",
             gen_paragraph(MAX_TOKENS // 2, chunker.tokenizer, ". "),
-            "\n" "## Header 2\n",
+            "\n## Header 2\n",
             gen_paragraph(MAX_TOKENS // 2, chunker.tokenizer, ". "),
             "\n\n",
             gen_paragraph(MAX_TOKENS // 2, chunker.tokenizer, ". "),
-            "\n" "## Header 3\n",
+            "\n## Header 3\n",
             gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, ". "),
         ]
         chunks = chunker.chunk("".join(text))
@@ -42,3 +42,20 @@ class TestTextChunker:
         assert chunks[3].value.endswith(". foo-8.")
         assert chunks[4].value.endswith(". foo-14.")
         assert chunks[5].value.endswith(". foo-24.")
+
+    def test_chunk_matches_recursive_chunking(self, chunker):
+        text = "".join(
+            [
+                gen_paragraph(MAX_TOKENS, chunker.tokenizer, " "),
+                "\n## Header 1\n",
+                gen_paragraph(MAX_TOKENS * 3, chunker.tokenizer, ". "),
+                "\n#### Header 2\n",
+                gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, "! "),
+                "\n\n",
+                gen_paragraph(MAX_TOKENS * 4, chunker.tokenizer, ". "),
+                "\n## Header 3\n",
+                gen_paragraph(MAX_TOKENS // 2, chunker.tokenizer, "? "),
+            ]
+        )
+
+        assert [chunk.value for chunk in chunker.chunk(text)] == chunker._chunk_recursively(text)
@@ -1,7 +1,10 @@
+import io
+
 import pytest
 
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import TextChunker
+from griptape.tokenizers import OpenAiTokenizer
 from tests.unit.chunkers.utils import gen_paragraph
 
 MAX_TOKENS = 50
@@ -108,6 +111,76 @@ class TestTextChunker:
         assert chunks[6].value.endswith(" foo-5")
         assert chunks[7].value.endswith(" foo-16")
 
+    def test_chunk_matches_recursive_chunking(self, chunker):
+        text = "".join(
+            [
+                gen_paragraph(MAX_TOKENS * 3, chunker.tokenizer, "! "),
+                "\n\n\n\n",
+                gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, ". "),
+                "\n",
+                gen_paragraph(MAX_TOKENS * 5, chunker.tokenizer, "? "),
+                "\n\n",
+                gen_paragraph(MAX_TOKENS * 4, chunker.tokenizer, " "),
+                gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, ""),
+                "\n\n",
+                gen_paragraph(MAX_TOKENS * 3, chunker.tokenizer, "  \n"),
+            ]
+        )
+
+        assert [chunk.value for chunk in chunker.chunk(text)] == chunker._chunk_recursively(text)
+
+    def test_chunk_with_character_longer_than_max_tokens(self):
+        chunker = TextChunker(max_tokens=1)
+
+        assert [chunk.value for chunk in chunker.chunk("foo 🐍")] == ["foo", "🐍"]
+
+    def test_chunk_without_token_offsets(self, chunker, mocker):
+        mocker.patch.object(OpenAiTokenizer, "token_offsets", return_value=None)
+        chunk_recursively = mocker.spy(TextChunker, "_chunk_recursively")
+
+        chunks = chunker.chunk(gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, " "))
+
+        assert len(chunks) == 3
+        assert chunk_recursively.call_count > 1
+
+    @pytest.mark.parametrize("window_size", [1, 100, 1_000_000])
+    def test_iter_chunks(self, chunker, window_size):
+        text = "".join(
+            [
+                gen_paragraph(MAX_TOKENS * 2, chunker.tokenizer, "! "),
+                "\n\n",
+                gen_paragraph(MAX_TOKENS, chunker.tokenizer, ". "),
+                "\n",
+                gen_paragraph(MAX_TOKENS * 3, chunker.tokenizer, "? "),
+            ]
+        )
+        chunker.window_size = window_size
+
+        chunks = [chunk.value for chunk in chunker.iter_chunks(io.StringIO(text))]
+
+        assert chunks == [chunk.value for chunk in chunker.iter_chunks(text.splitlines(keepends=True))]
+        assert "".join(chunks).replace(" ", "") == "".join(text.split())
+        for chunk in chunks:
+            assert 0 < chunker.tokenizer.count_tokens(chunk) <= MAX_TOKENS
+        if window_size >= len(text):
+            assert chunks == [chunk.value for chunk in chunker.chunk(text)]
+
+    def test_iter_chunks_cuts_windows_at_first_separator(self, chunker):
+        chunker.window_size = 30
+        text = "foo bar. baz\n\nqux quux. corge grault garply waldo fred plugh"
+
+        chunks = [chunk.value for chunk in chunker.iter_chunks([text])]
+
+        assert chunks == ["foo bar. baz", "qux quux.", "corge grault garply waldo", "fred plugh"]
+
+    def test_iter_chunks_with_empty_source(self, chunker):
+        assert list(chunker.iter_chunks([])) == []
+        assert list(chunker.iter_chunks(io.StringIO(""))) == []
+
     def test_chunk_with_max_tokens(self, chunker):
         with pytest.raises(ValueError):
             TextChunker(max_tokens=-1)
+
+    def test_chunk_with_window_size(self, chunker):
+        with pytest.raises(ValueError):
+            TextChunker(window_size=0)
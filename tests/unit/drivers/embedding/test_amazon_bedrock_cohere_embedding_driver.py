@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import pytest
@@ -26,3 +27,10 @@ class TestAmazonBedrockCohereEmbeddingDriver:
 
     def test_try_embed_chunk(self):
         assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self):
+        driver = AmazonBedrockCohereEmbeddingDriver()
+        driver.bedrock_client.invoke_model.return_value.get().read.return_value = '{"embeddings": [[0, 1], [1, 0]]}'
+
+        assert driver.try_embed_chunks(["foo", "bar"]) == [[0, 1], [1, 0]]
+        assert json.loads(driver.bedrock_client.invoke_model.call_args.kwargs["body"])["texts"] == ["foo", "bar"]
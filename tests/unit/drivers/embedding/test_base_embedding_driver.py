@@ -1,8 +1,13 @@
+import asyncio
+import threading
+import time
+from concurrent import futures
 from unittest.mock import patch
 
 import pytest
 
 from griptape.artifacts import TextArtifact
+from griptape.utils import RateLimiter, SingleFlight
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -33,6 +38,92 @@ class TestBaseEmbeddingDriver:
 
         assert embedding == [0, 1]
 
+    def test_embed_strings(self, driver):
+        driver.mock_output = lambda chunk: [len(chunk), 1]
+
+        with patch.object(driver, "try_embed_chunks") as try_embed_chunks:
+            assert driver.embed_strings(["foo", "foobar"]) == [[3, 1], [6, 1]]
+
+        try_embed_chunks.assert_not_called()
+
+    def test_aembed_strings(self, driver):
+        driver.mock_output = lambda chunk: [len(chunk), 1]
+
+        assert asyncio.run(driver.aembed_string("foo")) == [3, 1]
+        assert asyncio.run(driver.aembed_strings(["foo", "foobar"])) == [[3, 1], [6, 1]]
+
+    def test_embed_strings_batches(self, driver):
+        driver.mock_output = lambda chunk: [len(chunk), 1]
+        driver.max_batch_size = 3
+        driver.max_batch_tokens = 10
+        driver.tokenizer.max_input_tokens = 20
+        strings = ["a", "bb", "ccc", "dddd", "e" * 30, "ffffff", "g"]
+
+        with patch.object(driver, "try_embed_chunks", wraps=driver.try_embed_chunks) as try_embed_chunks:
+            embeddings = driver.embed_strings(strings)
+
+        assert len(embeddings) == len(strings)
+        assert [embeddings[i] for i in (0, 1, 2, 3, 5, 6)] == [[1, 1], [2, 1], [3, 1], [4, 1], [6, 1], [1, 1]]
+        assert [call.args[0] for call in try_embed_chunks.call_args_list] == [
+            ["a", "bb", "ccc"],
+            ["dddd", "ffffff"],
+            ["g"],
+        ]
+
+    def test_embed_strings_with_rate_limiter(self, driver, mocker):
+        driver.rate_limiter = RateLimiter(requests_per_minute=60)
+        driver.max_batch_size = 2
+        acquire = mocker.spy(RateLimiter, "acquire")
+
+        driver.embed_strings(["a", "bb", "ccc"])
+
+        assert sorted(call.args[1:] for call in acquire.call_args_list) == [
+            ("MockEmbeddingDriver/foo", 3),
+            ("MockEmbeddingDriver/foo", 3),
+        ]
+
+    def test_embed_string_with_single_flight(self, driver, mocker):
+        event = threading.Event()
+        calls = []
+
+        def mock_output(chunk):
+            calls.append(chunk)
+            event.wait()
+
+            return [len(chunk), 1]
+
+        driver.single_flight = SingleFlight()
+        driver.mock_output = mock_output
+        join = mocker.spy(SingleFlight, "_join")
+
+        with futures.ThreadPoolExecutor() as executor:
+            leader = executor.submit(driver.embed_string, "foo")
+
+            while not calls:
+
+                time.sleep(0.01)
+
+            follower = executor.submit(driver.embed_string, "foo")
+
+            while len(join.spy_return_list) < 2:
+
+                time.sleep(0.01)
+            event.set()
+
+        assert leader.result() == follower.result() == [3, 1]
+        assert calls == ["foo"]
+
+    def test_request_key(self, driver):
+        assert driver.request_key("foo") == driver.request_key("foo")
+        assert driver.request_key("foo") != driver.request_key("bar")
+        assert driver.request_key("foo") != MockEmbeddingDriver(model="bar").request_key("foo")
+
+    def test_embed_strings_count_mismatch(self, driver):
+        driver.max_batch_size = 2
+
+        with patch.object(driver, "try_embed_chunks", return_value=[[0, 1]]), pytest.raises(ValueError):
+            driver.embed_strings(["foo", "bar"])
+
     @patch.object(MockEmbeddingDriver, "try_embed_chunk")
     def test_embed_string_throws_when_retries_exhausted(self, try_embed_chunk, driver):
         try_embed_chunk.side_effect = Exception("nope")
@@ -0,0 +1,103 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.drivers import CachedEmbeddingDriver, LocalVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestCachedEmbeddingDriver:
+    @pytest.fixture()
+    def embedding_driver(self):
+        return MockEmbeddingDriver(mock_output=lambda chunk: [len(chunk), 1])
+
+    @pytest.fixture()
+    def driver(self, embedding_driver):
+        return CachedEmbeddingDriver(embedding_driver=embedding_driver)
+
+    @pytest.fixture()
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    def test_init(self, driver, embedding_driver):
+        assert driver.model == "foo"
+        assert driver.tokenizer is embedding_driver.tokenizer
+        assert driver.cache_namespace == "foo"
+
+    def test_embed_string(self, driver, embedding_driver):
+        with patch.object(embedding_driver, "embed_strings", wraps=embedding_driver.embed_strings) as embed_strings:
+            assert driver.embed_string("foo") == [3, 1]
+            assert driver.embed_string("foo") == [3, 1]
+            assert driver.embed_string("foobar") == [6, 1]
+
+        assert embed_strings.call_count == 2
+        assert (driver.memory_hits, driver.disk_hits, driver.misses) == (1, 0, 2)
+        assert driver.hit_rate == pytest.approx(1 / 3)
+
+    def test_embed_strings(self, driver, embedding_driver):
+        driver.embed_string("foo")
+
+        with patch.object(embedding_driver, "embed_strings", wraps=embedding_driver.embed_strings) as embed_strings:
+            assert driver.embed_strings(["foo", "bar!", "bar!", "foo"]) == [[3, 1], [4, 1], [4, 1], [3, 1]]
+
+        embed_strings.assert_called_once_with(["bar!"])
+        assert driver.hits == 1
+        assert driver.misses == 2
+
+    def test_cache_namespace(self, embedding_driver):
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver)
+        other_driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, cache_namespace="bar")
+
+        assert driver._cache_key("foo") != other_driver._cache_key("foo")
+
+    def test_max_cache_bytes(self, embedding_driver):
+        # Each embedding is two float32 values.
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, max_cache_bytes=16)
+
+        driver.embed_strings(["a", "bb"])
+        driver.embed_string("a")
+        driver.embed_string("ccc")
+
+        assert driver._memory_cache_bytes == 16
+        assert list(driver._memory_cache.keys()) == [driver._cache_key("a"), driver._cache_key("ccc")]
+
+        driver.embed_string("bb")
+
+        assert driver.misses == 4
+
+    def test_persist_file(self, embedding_driver, temp_dir):
+        persist_file = os.path.join(temp_dir, "cache", "embeddings.db")
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file)
+
+        driver.embed_strings(["foo", "foobar"])
+
+        new_driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file)
+
+        with patch.object(embedding_driver, "embed_strings") as embed_strings:
+            assert new_driver.embed_strings(["foo", "foobar"]) == [[3, 1], [6, 1]]
+            assert new_driver.embed_string("foo") == [3, 1]
+
+        embed_strings.assert_not_called()
+        assert (new_driver.memory_hits, new_driver.disk_hits, new_driver.misses) == (1, 2, 0)
+
+    def test_clear_cache(self, embedding_driver, temp_dir):
+        persist_file = os.path.join(temp_dir, "embeddings.db")
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file)
+
+        driver.embed_string("foo")
+        driver.clear_cache()
+        driver.embed_string("foo")
+
+        assert driver.misses == 2
+
+    def test_vector_store_driver(self, driver):
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=driver)
+
+        vector_store_driver.upsert_text_artifacts_batch([TextArtifact("foo"), TextArtifact("bar")])
+
+        assert [entry.to_artifact().value for entry in vector_store_driver.query("foo")] == ["foo", "bar"]
+        assert driver.hits == 1
@@ -26,6 +26,18 @@ class TestOpenAiEmbeddingDriver:
     def test_try_embed_chunk(self):
         assert OpenAiEmbeddingDriver().try_embed_chunk("foobar") == [0, 1, 0]
 
+    def test_try_embed_chunks(self, mock_openai):
+        mock_openai.return_value.data = [Mock(embedding=[0, 1, 0]), Mock(embedding=[1, 0, 0])]
+
+        assert OpenAiEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
+
+    def test_embed_strings(self, mock_openai):
+        mock_openai.return_value.data = [Mock(embedding=[0, 1, 0]), Mock(embedding=[1, 0, 0])]
+
+        assert OpenAiEmbeddingDriver().embed_strings(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        mock_openai.assert_called_once()
+
     @pytest.mark.parametrize("model", OpenAiTokenizer.EMBEDDING_MODELS)
     def test_try_embed_chunk_replaces_newlines_in_older_ada_models(self, model, mock_openai):
         OpenAiEmbeddingDriver(model=model).try_embed_chunk("foo\nbar")
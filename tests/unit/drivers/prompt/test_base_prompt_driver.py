@@ -1,9 +1,24 @@
+import asyncio
+import threading
+import time
+from concurrent import futures
+
+import pytest
+
 from griptape.artifacts import ErrorArtifact, TextArtifact
-from griptape.common import Message, PromptStack
-from griptape.events import FinishPromptEvent, StartPromptEvent
+from griptape.common import ActionCallDeltaMessageContent, DeltaMessage, Message, PromptStack
+from griptape.drivers import LocalPromptCacheDriver
+from griptape.events import (
+    CompletionChunkEvent,
+    FinishPromptEvent,
+    PromptCacheHitEvent,
+    PromptCacheMissEvent,
+    StartPromptEvent,
+)
 from griptape.mixins import EventPublisherMixin
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask, ToolkitTask
+from griptape.utils import RateLimiter, SingleFlight
 from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.mocks.mock_tool.tool import MockTool
@@ -66,3 +81,193 @@ class TestBasePromptDriver:
         output = pipeline.run().output_task.output
         assert isinstance(output, TextArtifact)
         assert output.value == "mock output"
+
+    def test_run_with_on_action_call(self, mocker):
+        events = []
+
+        def try_stream(self, prompt_stack):
+            yield DeltaMessage(content=ActionCallDeltaMessageContent(index=0, tag="foo", name="MockTool", path="test"))
+            yield DeltaMessage(content=ActionCallDeltaMessageContent(index=0, partial_input='{"values": '))
+            yield DeltaMessage(content=ActionCallDeltaMessageContent(index=0, partial_input='{"test": "foo"}'))
+            yield DeltaMessage(content=ActionCallDeltaMessageContent(index=0, partial_input="}"))
+            events.append("first call streamed")
+            yield DeltaMessage(content=ActionCallDeltaMessageContent(index=1, tag="bar", name="MockTool", path="test"))
+            yield DeltaMessage(content=ActionCallDeltaMessageContent(index=1, partial_input="{}"))
+            events.append("second call streamed")
+
+        mocker.patch.object(MockPromptDriver, "try_stream", try_stream)
+        driver = MockPromptDriver(stream=True)
+
+        result = driver.run(PromptStack(messages=[]), on_action_call=lambda action: events.append(action.tag))
+
+        assert events == ["foo", "first call streamed", "bar", "second call streamed"]
+        assert [artifact.value.input for artifact in result.to_artifact().value] == [{"values": {"test": "foo"}}, {}]
+
+    def test_run_with_rate_limiter(self, mocker):
+        rate_limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1000)
+        acquire = mocker.spy(RateLimiter, "acquire")
+        reconcile = mocker.spy(RateLimiter, "reconcile")
+        driver = MockPromptDriver(max_tokens=10, rate_limiter=rate_limiter)
+        prompt_stack = PromptStack(messages=[Message("foo", role=Message.USER_ROLE)])
+
+        driver.run(prompt_stack)
+
+        tokens = len(driver.prompt_stack_to_string(prompt_stack)) + 10
+        acquire.assert_called_once_with(rate_limiter, "MockPromptDriver/test-model", tokens)
+        reconcile.assert_called_once_with(rate_limiter, "MockPromptDriver/test-model", tokens, 200)
+
+    def test_run_with_prompt_cache_driver(self, mocker):
+        mock_publish_event = mocker.patch.object(EventPublisherMixin, "publish_event")
+        try_run = mocker.spy(MockPromptDriver, "try_run")
+        driver = MockPromptDriver(prompt_cache_driver=LocalPromptCacheDriver())
+
+        first_result = driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+        second_result = driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert try_run.call_count == 1
+        assert second_result.value == first_result.value == "mock output"
+        assert [type(event) for event in events] == [
+            PromptCacheMissEvent,
+            StartPromptEvent,
+            FinishPromptEvent,
+            PromptCacheHitEvent,
+            StartPromptEvent,
+            FinishPromptEvent,
+        ]
+
+    def test_run_with_prompt_cache_driver_and_stream(self, mocker):
+        mock_publish_event = mocker.patch.object(EventPublisherMixin, "publish_event")
+        driver = MockPromptDriver(stream=True, use_native_tools=True, prompt_cache_driver=LocalPromptCacheDriver())
+        prompt_stack = PromptStack(messages=[Message("foo", role=Message.USER_ROLE)], tools=[MockTool()])
+
+        driver.run(prompt_stack)
+        streamed_tokens = [
+            call_args[0][0].token
+            for call_args in mock_publish_event.call_args_list
+            if isinstance(call_args[0][0], CompletionChunkEvent)
+        ]
+        mock_publish_event.reset_mock()
+        result = driver.run(prompt_stack)
+        replayed_tokens = [
+            call_args[0][0].token
+            for call_args in mock_publish_event.call_args_list
+            if isinstance(call_args[0][0], CompletionChunkEvent)
+        ]
+
+        assert result.value.name == "MockTool"
+        assert streamed_tokens == ["MockTool.test (mock-tag)", '{ "values": { "test": "test-value" } }']
+        assert replayed_tokens == ["MockTool.test (mock-tag)", '{"values": {"test": "test-value"}}']
+
+    def test_run_with_single_flight(self, mocker):
+        mock_publish_event = mocker.patch.object(EventPublisherMixin, "publish_event")
+        event = threading.Event()
+        started = threading.Event()
+
+        def mock_output(prompt_stack):
+            started.set()
+            event.wait()
+
+            return "mock output"
+
+        driver = MockPromptDriver(single_flight=SingleFlight(), mock_output=mock_output)
+        try_run = mocker.spy(MockPromptDriver, "try_run")
+        join = mocker.spy(SingleFlight, "_join")
+
+        with futures.ThreadPoolExecutor() as executor:
+            leader = executor.submit(driver.run, PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+            started.wait()
+            follower = executor.submit(driver.run, PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+            while len(join.spy_return_list) < 2:
+                time.sleep(0.01)
+            event.set()
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert try_run.call_count == 1
+        assert follower.result() is leader.result()
+        assert len([event for event in events if isinstance(event, FinishPromptEvent)]) == 2
+
+    def test_run_many(self, mocker):
+        mock_publish_event = mocker.patch.object(EventPublisherMixin, "publish_event")
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def mock_output(prompt_stack):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+            return prompt_stack.messages[0].value
+
+        driver = MockPromptDriver(mock_output=mock_output)
+        prompt_stacks = [PromptStack(messages=[Message(str(i), role=Message.USER_ROLE)]) for i in range(8)]
+
+        results = driver.run_many(prompt_stacks, max_concurrency=2)
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert [result.value for result in results] == [str(i) for i in range(8)]
+        assert max(max_running) <= 2
+        assert len([event for event in events if isinstance(event, FinishPromptEvent)]) == 8
+
+    def test_run_many_invalid_max_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            MockPromptDriver().run_many([PromptStack()], max_concurrency=0)
+
+    def test_arun_many(self):
+        driver = MockPromptDriver(mock_output=lambda prompt_stack: prompt_stack.messages[0].value)
+        prompt_stacks = [PromptStack(messages=[Message(str(i), role=Message.USER_ROLE)]) for i in range(4)]
+
+        results = asyncio.run(driver.arun_many(prompt_stacks, max_concurrency=2))
+
+        assert [result.value for result in results] == ["0", "1", "2", "3"]
+
+    def test_cache_key(self):
+        driver = MockPromptDriver()
+        prompt_stack = PromptStack()
+        prompt_stack.add_system_message("foo")
+        prompt_stack.add_user_message("bar")
+        other_prompt_stack = PromptStack()
+        other_prompt_stack.add_system_message("foo")
+        other_prompt_stack.add_user_message("bar")
+
+        assert driver.cache_key(prompt_stack) == driver.cache_key(other_prompt_stack)
+        assert driver.cache_key(prompt_stack) != MockPromptDriver(temperature=0.5).cache_key(prompt_stack)
+        assert driver.cache_key(prompt_stack) != driver.cache_key(PromptStack(messages=prompt_stack.messages[1:]))
+        assert driver.cache_key(prompt_stack) != driver.cache_key(
+            PromptStack(messages=prompt_stack.messages, tools=[MockTool()])
+        )
+
+    def test_arun(self):
+        result = asyncio.run(MockPromptDriver().arun(PromptStack(messages=[])))
+
+        assert isinstance(result, Message)
+        assert result.value == "mock output"
+
+    def test_arun_with_stream(self, mocker):
+        mock_publish_event = mocker.patch.object(EventPublisherMixin, "publish_event")
+        result = asyncio.run(MockPromptDriver(stream=True).arun(PromptStack(messages=[])))
+
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert result.value == "mock output"
+        assert "".join(event.token for event in events if isinstance(event, CompletionChunkEvent)) == "mock output"
+
+    def test_arun_retries_failure(self):
+        driver = MockFailingPromptDriver(max_failures=2, max_attempts=1)
+
+        with pytest.raises(Exception, match="failed attempt"):
+            asyncio.run(driver.arun(PromptStack(messages=[])))
+
+    def test_arun_via_pipeline_with_tools(self):
+        driver = MockPromptDriver(max_attempts=1, use_native_tools=True)
+        pipeline = Pipeline(prompt_driver=driver)
+
+        pipeline.add_task(ToolkitTask(tools=[MockTool()]))
+
+        output = asyncio.run(pipeline.arun()).output_task.output
+        assert isinstance(output, TextArtifact)
+        assert output.value == "mock output"
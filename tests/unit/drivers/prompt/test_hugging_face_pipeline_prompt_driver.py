@@ -1,3 +1,5 @@
+from concurrent import futures
+
 import pytest
 
 from griptape.common import PromptStack
@@ -49,6 +51,47 @@ class TestHuggingFacePipelinePromptDriver:
         assert message.usage.input_tokens == 3
         assert message.usage.output_tokens == 3
 
+    def test_run_many(self, prompt_stack, mock_generator, mock_autotokenizer):
+        # Given
+        driver = HuggingFacePipelinePromptDriver(model="foo", max_tokens=42)
+        mock_autotokenizer.pad_token = None
+        mock_autotokenizer.pad_token_id = 0
+        mock_autotokenizer.pad.side_effect = lambda encoded_inputs, **kwargs: {
+            "input_ids": [[0] * (3 - len(tokens)) + tokens for tokens in encoded_inputs["input_ids"]]
+        }
+        mock_generator.model.generate.side_effect = lambda input_ids, **kwargs: [
+            [*tokens, 7, 8, 0][: len(tokens) + 3 - i] for i, tokens in enumerate(input_ids)
+        ]
+        mock_autotokenizer.decode.side_effect = lambda tokens, **kwargs: str(tokens)
+
+        # When
+        messages = driver.run_many([prompt_stack] * 3, max_concurrency=2)
+
+        # Then
+        assert [message.value for message in messages] == ["[7, 8]", "[7, 8]", "[7, 8]"]
+        assert [len(call.kwargs["input_ids"]) for call in mock_generator.model.generate.call_args_list] == [2, 1]
+        assert mock_autotokenizer.pad_token == mock_autotokenizer.eos_token
+        assert mock_autotokenizer.padding_side == "left"
+        assert messages[0].usage.input_tokens == 3
+        assert messages[0].usage.output_tokens == 2
+        mock_generator.assert_not_called()
+
+    def test_try_run_with_max_batch_size(self, prompt_stack, mock_generator, mock_autotokenizer):
+        # Given
+        driver = HuggingFacePipelinePromptDriver(model="foo", max_tokens=42, max_batch_size=4, max_batch_wait=1)
+        mock_autotokenizer.pad_token_id = 0
+        mock_autotokenizer.pad.side_effect = lambda encoded_inputs, **kwargs: {"input_ids": encoded_inputs["input_ids"]}
+        mock_generator.model.generate.side_effect = lambda input_ids, **kwargs: [[*tokens, 7] for tokens in input_ids]
+
+        # When
+        with futures.ThreadPoolExecutor() as executor:
+            messages = list(executor.map(driver.try_run, [prompt_stack] * 4))
+
+        # Then
+        assert [message.value for message in messages] == ["model-output"] * 4
+        assert [len(call.kwargs["input_ids"]) for call in mock_generator.model.generate.call_args_list] == [4]
+        mock_generator.assert_not_called()
+
     def test_try_stream(self, prompt_stack):
         # Given
         driver = HuggingFacePipelinePromptDriver(model="foo", max_tokens=42)
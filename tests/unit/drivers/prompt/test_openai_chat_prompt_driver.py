@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -207,6 +208,24 @@ class TestOpenAiChatPromptDriverFixtureMixin:
         )
         return mock_chat_create
 
+    @pytest.fixture()
+    def mock_async_chat_completion_create(self, mocker, mock_chat_completion_create):
+        mock_chat_create = mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create
+        mock_chat_create.side_effect = AsyncMock(return_value=mock_chat_completion_create.return_value)
+
+        return mock_chat_create
+
+    @pytest.fixture()
+    def mock_async_chat_completion_stream_create(self, mocker, mock_chat_completion_stream_create):
+        async def stream():
+            for chunk in mock_chat_completion_stream_create.return_value:
+                yield chunk
+
+        mock_chat_create = mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create
+        mock_chat_create.side_effect = AsyncMock(return_value=stream())
+
+        return mock_chat_create
+
     @pytest.fixture()
     def prompt_stack(self):
         prompt_stack = PromptStack()
@@ -403,6 +422,64 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
         assert isinstance(event.content, TextDeltaMessageContent)
         assert event.content.text == ""
 
+    def test_atry_run(self, mock_async_chat_completion_create, mock_chat_completion_create, prompt_stack, messages):
+        # Given
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, use_native_tools=False)
+
+        # When
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        # Then
+        mock_async_chat_completion_create.assert_called_once_with(
+            model=driver.model,
+            temperature=driver.temperature,
+            user=driver.user,
+            messages=messages,
+            seed=driver.seed,
+        )
+        mock_chat_completion_create.assert_not_called()
+        assert message.value[0].value == "model-output"
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_atry_stream(self, mock_async_chat_completion_stream_create, prompt_stack, messages):
+        # Given
+        driver = OpenAiChatPromptDriver(
+            model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, stream=True, use_native_tools=False
+        )
+
+        # When
+        async def collect():
+            return [message_delta async for message_delta in driver.atry_stream(prompt_stack)]
+
+        message_deltas = asyncio.run(collect())
+
+        # Then
+        mock_async_chat_completion_stream_create.assert_called_once_with(
+            model=driver.model,
+            temperature=driver.temperature,
+            user=driver.user,
+            stream=True,
+            messages=messages,
+            seed=driver.seed,
+            stream_options={"include_usage": True},
+        )
+        assert len(message_deltas) == 5
+        assert message_deltas[0].content.text == "model-output"
+        assert message_deltas[2].content.partial_input == '{"foo": "bar"}'
+        assert message_deltas[3].usage.input_tokens == 5
+
+    def test_arun_with_stream(self, mock_async_chat_completion_stream_create, prompt_stack):
+        driver = OpenAiChatPromptDriver(
+            model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, stream=True, use_native_tools=True
+        )
+
+        message = asyncio.run(driver.arun(prompt_stack))
+
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.input == {"foo": "bar"}
+        assert message.usage.output_tokens == 10
+
     def test_try_run_with_max_tokens(self, mock_chat_completion_create, prompt_stack, messages):
         # Given
         driver = OpenAiChatPromptDriver(
@@ -0,0 +1,62 @@
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.common import Message, TextMessageContent
+from griptape.drivers import LocalPromptCacheDriver
+
+
+class TestLocalPromptCacheDriver:
+    @pytest.fixture()
+    def message(self):
+        return Message(
+            content=[TextMessageContent(TextArtifact("foo"))],
+            role=Message.ASSISTANT_ROLE,
+            usage=Message.Usage(input_tokens=1, output_tokens=2),
+        )
+
+    @pytest.fixture()
+    def driver(self):
+        return LocalPromptCacheDriver(max_entries=2)
+
+    def test_load(self, driver, message):
+        assert driver.load("foo") is None
+
+        driver.store("foo", message)
+
+        assert driver.load("foo").value == "foo"
+        assert driver.load("foo").usage.output_tokens == 2
+
+    def test_lru_eviction(self, driver, message):
+        driver.store("foo", message)
+        driver.store("bar", message)
+        driver.load("foo")
+        driver.store("baz", message)
+
+        assert driver.load("foo") is not None
+        assert driver.load("bar") is None
+        assert driver.load("baz") is not None
+
+    def test_ttl(self, message, mocker):
+        time = mocker.patch("griptape.drivers.prompt_cache.local_prompt_cache_driver.time.time", return_value=100)
+        driver = LocalPromptCacheDriver(ttl=10)
+
+        driver.store("foo", message)
+
+        time.return_value = 109
+        assert driver.load("foo") is not None
+
+        time.return_value = 110
+        assert driver.load("foo") is None
+
+    def test_persist_file(self, message, tmp_path):
+        persist_file = str(tmp_path / "cache" / "prompts.db")
+
+        LocalPromptCacheDriver(persist_file=persist_file).store("foo", message)
+        driver = LocalPromptCacheDriver(persist_file=persist_file)
+
+        assert driver.load("foo").value == "foo"
+
+        driver.clear()
+
+        assert driver.load("foo") is None
+        assert LocalPromptCacheDriver(persist_file=persist_file).load("foo") is None
@@ -0,0 +1,38 @@
+import pytest
+import redis
+
+from griptape.artifacts import TextArtifact
+from griptape.common import Message, TextMessageContent
+from griptape.drivers import RedisPromptCacheDriver
+
+
+class TestRedisPromptCacheDriver:
+    @pytest.fixture()
+    def message(self):
+        return Message(content=[TextMessageContent(TextArtifact("foo"))], role=Message.ASSISTANT_ROLE)
+
+    @pytest.fixture()
+    def driver(self):
+        return RedisPromptCacheDriver(host="127.0.0.1", port=6379, ttl=1.5)
+
+    def test_load(self, driver, message, mocker):
+        get = mocker.patch.object(redis.Redis, "get", side_effect=[None, message.to_json()])
+
+        assert driver.load("foo") is None
+        assert driver.load("foo").value == "foo"
+        get.assert_called_with("griptape_prompt_cache:foo")
+
+    def test_store(self, driver, message, mocker):
+        set_ = mocker.patch.object(redis.Redis, "set")
+
+        driver.store("foo", message)
+
+        set_.assert_called_once_with("griptape_prompt_cache:foo", message.to_json(), px=1500)
+
+    def test_clear(self, driver, mocker):
+        mocker.patch.object(redis.Redis, "scan_iter", return_value=iter([b"griptape_prompt_cache:foo"]))
+        delete = mocker.patch.object(redis.Redis, "delete")
+
+        driver.clear()
+
+        delete.assert_called_once_with(b"griptape_prompt_cache:foo")
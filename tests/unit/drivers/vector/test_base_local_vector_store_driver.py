@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from unittest.mock import patch
 
@@ -50,6 +51,35 @@ class BaseLocalVectorStoreDriver(ABC):
         assert foo_entries[0].to_artifact().value == "foo"
         assert bar_entries[0].to_artifact().value == "bar"
 
+    def test_upsert_text_artifacts_batch(self, driver):
+        existing_vector_id = driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+
+        with patch.object(driver.embedding_driver, "embed_string", wraps=driver.embedding_driver.embed_string) as embed:
+            vector_ids = driver.upsert_text_artifacts_batch(
+                {"foo": [TextArtifact("foo"), TextArtifact("bar")], "bar": [TextArtifact("bar")]},
+                meta={"source": "test"},
+            )
+
+        assert embed.call_count == 2
+        assert vector_ids["foo"][0] == existing_vector_id
+        assert len(driver.entries) == 3
+        assert [artifact.value for artifact in driver.load_artifacts(namespace="foo")] == ["foo", "bar"]
+        assert driver.load_entry(vector_ids["bar"][0], namespace="bar").meta["source"] == "test"
+        assert driver.upsert_text_artifacts_batch([TextArtifact("baz")]) == [driver.load_entries()[-1].id]
+
+    def test_upsert_vectors(self, driver):
+        vector_ids = driver.upsert_vectors(
+            [[0, 1], [1, 0]], vector_ids=["foo", None], namespace="test", metas=[{"foo": "bar"}, None]
+        )
+
+        assert vector_ids[0] == "foo"
+        assert driver.load_entry("foo", namespace="test").meta == {"foo": "bar"}
+        assert driver.load_entry(vector_ids[1], namespace="test").vector == [1, 0]
+        assert driver.find_existing_vector_ids(["foo", "bar"], namespace="test") == {"foo"}
+
+        with pytest.raises(ValueError):
+            driver.upsert_vectors([[0, 1]], vector_ids=["foo", "bar"])
+
     def test_query(self, driver):
         vector_id = driver.upsert_text_artifact(TextArtifact("foobar"), namespace="test-namespace")
 
@@ -61,6 +91,12 @@ class BaseLocalVectorStoreDriver(ABC):
         assert driver.query("foobar")[0].to_artifact().value == "foobar"
         assert driver.query("foobar")[0].id == vector_id
 
+    def test_aquery(self, driver):
+        vector_ids = asyncio.run(driver.aupsert_text_artifacts_batch([TextArtifact("foo"), TextArtifact("bar")]))
+
+        assert [entry.id for entry in asyncio.run(driver.aquery("foo", count=1))] == vector_ids[:1]
+        assert [len(entries) for entries in asyncio.run(driver.aquery_many(["foo", "bar"]))] == [2, 2]
+
     def test_load_entry(self, driver):
         vector_id = driver.upsert_text_artifact(TextArtifact("foobar"), namespace="test-namespace")
 
@@ -1,3 +1,6 @@
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 
 from griptape.artifacts import TextArtifact
@@ -22,3 +25,218 @@ class TestLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
 
         assert len(driver.load_artifacts(namespace="foo")) == 0
         assert len(driver.load_artifacts()) == 2
+
+    def test_query_ranks_by_cosine_similarity(self):
+        vectors = {"north": [0.0, 1.0], "east": [1.0, 0.0], "north-east": [1.0, 1.0]}
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: vectors[chunk]), initial_capacity=1
+        )
+
+        for value in vectors:
+            driver.upsert_text(value, vector_id=value)
+
+        result = driver.query("north", count=2)
+
+        assert [entry.id for entry in result] == ["north", "north-east"]
+        assert result[0].score == pytest.approx(1.0)
+        assert result[1].score == pytest.approx(0.7071, abs=1e-4)
+        assert [entry.id for entry in driver.query("east")] == ["east", "north-east", "north"]
+
+    def test_query_many(self):
+        vectors = {"north": [0.0, 1.0], "east": [1.0, 0.0], "north-east": [1.0, 1.0]}
+        embedding_driver = MockEmbeddingDriver(mock_output=lambda chunk: vectors[chunk])
+        driver = LocalVectorStoreDriver(embedding_driver=embedding_driver)
+
+        for value in vectors:
+            driver.upsert_text(value, vector_id=value, namespace="a" if value != "east" else "b")
+
+        with patch.object(embedding_driver, "embed_strings", wraps=embedding_driver.embed_strings) as embed_strings:
+            results = driver.query_many(["north", "east"], count=2)
+
+        embed_strings.assert_called_once_with(["north", "east"])
+        assert [[entry.id for entry in entries] for entries in results] == [
+            ["north", "north-east"],
+            ["east", "north-east"],
+        ]
+        assert results[0][1].score == pytest.approx(driver.query("north", count=2)[1].score)
+        assert [[entry.id for entry in entries] for entries in driver.query_many(["east"], namespace="a")] == [
+            ["north-east", "north"]
+        ]
+        assert driver.query_many(["east"], namespace="c") == [[]]
+        assert driver.query_many([]) == []
+
+    def test_query_many_blocks(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo")
+        driver.upsert_vector([1, 0], vector_id="bar")
+        driver.QUERY_SCORE_BLOCK_SIZE = 2
+
+        assert [[entry.id for entry in entries] for entries in driver.query_many(["foo", "bar", "baz"])] == [
+            ["foo", "bar"]
+        ] * 3
+
+    def test_query_many_quantized(self, clustered_vectors):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: clustered_vectors[int(chunk)]),
+            quantization="int8",
+        )
+        driver.upsert_vectors(clustered_vectors, vector_ids=[str(i) for i in range(len(clustered_vectors))])
+
+        assert [[entry.id for entry in entries] for entries in driver.query_many(["0", "1"], count=5)] == [
+            [entry.id for entry in driver.query(query, count=5)] for query in ["0", "1"]
+        ]
+
+    def test_query_count_zero(self, driver):
+        driver.upsert_text_artifact(TextArtifact("foobar"))
+
+        assert driver.query("foobar", count=0) == []
+
+    def test_query_custom_relatedness_fn(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), relatedness_fn=lambda x, y: 0.5)
+        driver.upsert_text_artifact(TextArtifact("foobar"))
+
+        assert driver.query("foobar")[0].score == 0.5
+
+    def test_query_reflects_entries_modified_directly(self, driver):
+        driver.upsert_text_artifact(TextArtifact("foo"))
+        driver.entries = {}
+
+        assert driver.query("foo") == []
+
+    def test_upsert_vector_dimension_mismatch(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo")
+
+        with pytest.raises(ValueError):
+            driver.upsert_vector([0, 1, 2], vector_id="bar")
+
+    def test_load_entries_namespace(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="a")
+        driver.upsert_vector([0, 1], vector_id="bar", namespace="ab")
+        driver.upsert_vector([0, 1], vector_id="baz", namespace="a")
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="a", meta={"updated": True})
+
+        assert [entry.id for entry in driver.load_entries(namespace="a")] == ["foo", "baz"]
+        assert driver.load_entries(namespace="a")[0].meta == {"updated": True}
+        assert [entry.id for entry in driver.load_entries(namespace="ab")] == ["bar"]
+        assert driver.load_entries(namespace="c") == []
+        assert len(driver.load_entries()) == 3
+
+    def test_query_filter(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo", meta={"lang": "en", "page": 1})
+        driver.upsert_vector([0, 1], vector_id="bar", meta={"lang": "de", "page": 1})
+        driver.upsert_vector([0, 1], vector_id="baz", meta={"lang": "en", "page": 2, "tags": ["x"]})
+        driver.upsert_vector([0, 1], vector_id="qux", namespace="other", meta={"lang": "en", "page": True})
+
+        assert [entry.id for entry in driver.query("foo", filter={"lang": "en"})] == ["foo", "baz", "qux"]
+        assert [entry.id for entry in driver.query("foo", filter={"lang": "en", "page": 1})] == ["foo"]
+        assert [entry.id for entry in driver.query("foo", filter={"page": True})] == ["qux"]
+        assert [entry.id for entry in driver.query("foo", filter={"tags": ["x"]})] == ["baz"]
+        assert [entry.id for entry in driver.query("foo", namespace="other", filter={"lang": "en"})] == ["qux"]
+        assert driver.query("foo", filter={"lang": "fr"}) == []
+
+    def test_query_filter_after_update(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo", meta={"lang": "en"})
+        driver.upsert_vector([0, 1], vector_id="bar", meta={"lang": "en"})
+
+        assert len(driver.query("foo", filter={"lang": "en"})) == 2
+
+        driver.upsert_vector([0, 1], vector_id="foo", meta={"lang": "de"})
+        driver.upsert_vector([0, 1], vector_id="baz", meta={"lang": "de"})
+
+        assert [entry.id for entry in driver.query("foo", filter={"lang": "en"})] == ["bar"]
+        assert [entry.id for entry in driver.query("foo", filter={"lang": "de"})] == ["foo", "baz"]
+
+    @pytest.fixture()
+    def clustered_vectors(self):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(8, 16))
+
+        return [(centers[i % 8] + 0.1 * rng.normal(size=16)).tolist() for i in range(200)]
+
+    def test_query_ivf(self, clustered_vectors):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: clustered_vectors[int(chunk)]),
+            ivf_lists=8,
+            ivf_probes=2,
+            ivf_min_rows=100,
+        )
+        exact_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: clustered_vectors[int(chunk)])
+        )
+
+        for i, vector in enumerate(clustered_vectors):
+            driver.upsert_vector(vector, vector_id=str(i))
+            exact_driver.upsert_vector(vector, vector_id=str(i))
+
+        assert [entry.id for entry in driver.query("3", count=5)] == [
+            entry.id for entry in exact_driver.query("3", count=5)
+        ]
+        assert driver._ivf_index is not None
+        assert driver.measure_ivf_recall(count=5) >= 0.9
+
+        driver.upsert_vector(clustered_vectors[3], vector_id="new")
+
+        assert driver.query("3", count=1)[0].id in ("3", "new")
+        assert driver._ivf_index.assigned_rows == 201
+
+    def test_query_ivf_below_min_rows(self, clustered_vectors):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: clustered_vectors[int(chunk)]),
+            ivf_lists=8,
+        )
+
+        for i, vector in enumerate(clustered_vectors):
+            driver.upsert_vector(vector, vector_id=str(i))
+
+        assert len(driver.query("3")) == 200
+        assert driver._ivf_index is None
+
+    def test_measure_ivf_recall_all_probes(self, clustered_vectors):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), ivf_lists=8, ivf_probes=8, ivf_min_rows=100
+        )
+
+        for i, vector in enumerate(clustered_vectors):
+            driver.upsert_vector(vector, vector_id=str(i))
+
+        assert driver.measure_ivf_recall(count=10, sample_size=20) == 1.0
+
+    @pytest.mark.parametrize("quantization", ["int8", "float16"])
+    def test_query_quantized(self, clustered_vectors, quantization):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: clustered_vectors[int(chunk)]),
+            quantization=quantization,
+        )
+        exact_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: clustered_vectors[int(chunk)])
+        )
+
+        for i, vector in enumerate(clustered_vectors[:100]):
+            driver.upsert_vector(vector, vector_id=str(i))
+            exact_driver.upsert_vector(vector, vector_id=str(i))
+
+        result = driver.query("3", count=5)
+        exact_result = exact_driver.query("3", count=5)
+
+        assert [entry.id for entry in result] == [entry.id for entry in exact_result]
+        assert [entry.score for entry in result] == pytest.approx([entry.score for entry in exact_result])
+        assert driver._quantizer.codes.dtype == np.dtype(quantization)
+
+        driver.upsert_vector(clustered_vectors[150], vector_id="new")
+
+        assert driver._quantizer.encoded_rows == 101
+        assert driver.query("150", count=1)[0].id == "new"
+
+    def test_query_quantized_without_rerank(self, clustered_vectors):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: clustered_vectors[int(chunk)]),
+            quantization="int8",
+            quantization_rerank_factor=None,
+        )
+
+        for i, vector in enumerate(clustered_vectors):
+            driver.upsert_vector(vector, vector_id=str(i))
+
+        result = driver.query("3", count=1)
+
+        assert result[0].id == "3"
+        assert result[0].score == pytest.approx(1.0, abs=1e-2)
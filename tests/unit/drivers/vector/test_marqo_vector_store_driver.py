@@ -117,6 +117,21 @@ class TestMarqoVectorStorageDriver:
         }
         assert result == expected_return_value["items"][0]["_id"]
 
+    def test_upsert_text_artifacts_batch(self, driver, mock_marqo):
+        mock_marqo.index().add_documents.return_value = {
+            "errors": False,
+            "items": [
+                {"_id": "foo", "result": "created", "status": 201},
+                {"_id": "bar", "result": "created", "status": 201},
+            ],
+        }
+
+        result = driver.upsert_text_artifacts_batch([TextArtifact("foo"), TextArtifact("bar")])
+
+        mock_marqo.index().add_documents.assert_called_once()
+        assert len(mock_marqo.index().add_documents.call_args.args[0]) == 2
+        assert result == ["foo", "bar"]
+
     def test_search(self, driver, mock_marqo):
         results = driver.query("Test query")
         mock_marqo.index().search.assert_called()
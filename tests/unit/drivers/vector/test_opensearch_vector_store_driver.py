@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from griptape.drivers import OpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestOpenSearchVectorStoreDriver:
@@ -50,3 +51,40 @@ class TestOpenSearchVectorStoreDriver:
             results = driver.query(query_string, count=5, namespace="company")
             assert len(results) == 1, "Expected results from the query"
             assert results[0].id == "query_result", "Expected a result id"
+
+    def test_query_many(self):
+        client = Mock()
+        client.msearch.return_value = {
+            "responses": [
+                {
+                    "hits": {
+                        "hits": [{"_id": "foo", "_score": 0.9, "_source": {"namespace": "company", "metadata": {}}}]
+                    }
+                },
+                {"hits": {"hits": []}},
+            ]
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        results = driver.query_many(["foo", "bar"], count=3, namespace="company")
+
+        body = client.msearch.call_args.kwargs["body"]
+        assert [len(entries) for entries in results] == [1, 0]
+        assert results[0][0].id == "foo"
+        assert results[0][0].namespace == "company"
+        assert body[0] == {"index": "test"}
+        assert body[1]["size"] == 3
+        assert len(body) == 4
+        client.search.assert_not_called()
+
+    def test_query_many_error(self):
+        client = Mock()
+        client.msearch.return_value = {"responses": [{"error": {"type": "index_not_found_exception"}}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="test", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        with pytest.raises(ValueError):
+            driver.query_many(["foo"])
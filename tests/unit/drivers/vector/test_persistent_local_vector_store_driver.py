@@ -1,6 +1,9 @@
+import json
 import os
 import tempfile
+from pathlib import Path
 
+import numpy as np
 import pytest
 
 from griptape.artifacts import TextArtifact
@@ -29,3 +32,253 @@ class TestPersistentLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
         new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
 
         assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+
+    def test_upsert_appends_record(self, driver, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+
+        driver.upsert_text_artifact(TextArtifact("foo"))
+        driver.upsert_text_artifact(TextArtifact("bar"))
+
+        records = [json.loads(line) for line in Path(persist_file).read_text().splitlines()]
+
+        assert len(records) == 2
+        assert records[1]["op"] == "upsert"
+        assert records[1]["entry"]["id"] == driver.load_entries()[1].id
+
+    def test_replay_uses_latest_record(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, compaction_threshold=None
+        )
+
+        driver.upsert_vector([0, 1], vector_id="foo", meta={"version": 1})
+        driver.upsert_vector([1, 0], vector_id="foo", meta={"version": 2})
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, compaction_threshold=None
+        )
+
+        assert len(new_driver.entries) == 1
+        assert new_driver.load_entry("foo").meta == {"version": 2}
+        assert new_driver.load_entry("foo").vector == [1, 0]
+
+    def test_upsert_vectors_appends_records(self, driver, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+
+        driver.upsert_vectors([[0, 1], [1, 0]], vector_ids=["foo", "bar"])
+
+        with pytest.raises(ValueError):
+            driver.upsert_vectors([[1, 1], [1, 1, 1]], vector_ids=["baz", "qux"])
+
+        records = [json.loads(line) for line in Path(persist_file).read_text().splitlines()]
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+
+        assert [record["key"] for record in records] == ["foo", "bar", "baz"]
+        assert [entry.id for entry in new_driver.load_entries()] == ["foo", "bar", "baz"]
+
+    def test_compact(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, compaction_threshold=None
+        )
+
+        for version in range(3):
+            driver.upsert_vector([0, 1], vector_id="foo", meta={"version": version})
+
+        assert len(Path(persist_file).read_text().splitlines()) == 3
+
+        driver.compact()
+
+        assert len(Path(persist_file).read_text().splitlines()) == 1
+
+        assert LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file).load_entry(
+            "foo"
+        ).meta == {"version": 2}
+
+    def test_compaction_threshold(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, compaction_threshold=2
+        )
+
+        for version in range(3):
+            driver.upsert_vector([0, 1], vector_id="foo", meta={"version": version})
+
+        assert len(Path(persist_file).read_text().splitlines()) == 1
+
+    def test_load_legacy_file(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+
+        with open(persist_file, "w") as file:
+            json.dump({"foo": {"id": "foo", "vector": [0, 1], "score": None, "meta": None, "namespace": None}}, file)
+
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+        driver.upsert_vector([0, 1], vector_id="bar")
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+
+        assert [entry.id for entry in new_driver.load_entries()] == ["foo", "bar"]
+
+    def test_load_torn_record(self, driver, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+
+        driver.upsert_vector([0, 1], vector_id="foo")
+
+        with open(persist_file, "a") as file:
+            file.write('{"op": "upsert", "key": "ba')
+
+        new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+        new_driver.upsert_vector([0, 1], vector_id="baz")
+
+        assert [entry.id for entry in new_driver.load_entries()] == ["foo", "baz"]
+        assert (
+            len(LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file).entries) == 2
+        )
+
+    def test_binary_snapshot(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, snapshot_format="binary"
+        )
+
+        driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+        driver.upsert_vector([1, 0], vector_id="bar", meta={"bar": "baz"})
+        driver.compact()
+
+        assert Path(persist_file).read_text() == ""
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, snapshot_format="binary"
+        )
+
+        assert isinstance(new_driver._snapshot_vectors, np.memmap)
+        assert new_driver.query("foo", namespace="foo")[0].to_artifact().value == "foo"
+        assert new_driver.load_entry("bar").vector == [1, 0]
+        assert new_driver.load_entry("bar").meta == {"bar": "baz"}
+        assert [entry.id for entry in new_driver.query("foo", include_vectors=True)] == [
+            driver.load_entries(namespace="foo")[0].id,
+            "bar",
+        ]
+
+    def test_binary_snapshot_indexes(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, snapshot_format="binary"
+        )
+
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="a", meta={"lang": "en"})
+        driver.upsert_vector([0, 1], vector_id="bar", namespace="b", meta={"lang": "en"})
+        driver.compact()
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, snapshot_format="binary"
+        )
+        new_driver.upsert_vector([0, 1], vector_id="baz", namespace="a", meta={"lang": "de"})
+        new_driver.upsert_vector([0, 1], vector_id="foo", namespace="a", meta={"lang": "de"})
+
+        assert [entry.id for entry in new_driver.load_entries(namespace="a")] == ["foo", "baz"]
+        assert [entry.id for entry in new_driver.query("foo", filter={"lang": "en"})] == ["bar"]
+        assert [entry.id for entry in new_driver.query("foo", namespace="a", filter={"lang": "de"})] == ["foo", "baz"]
+
+    def test_binary_snapshot_with_log(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, snapshot_format="binary"
+        )
+
+        driver.upsert_vector([0, 1], vector_id="foo")
+        driver.compact()
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, snapshot_format="binary"
+        )
+        new_driver.upsert_vector([1, 0], vector_id="foo")
+        new_driver.upsert_vector([1, 1], vector_id="bar")
+
+        assert new_driver.query("foo", count=1, include_vectors=True)[0].id == "bar"
+
+        reloaded_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, snapshot_format="binary"
+        )
+
+        assert reloaded_driver.load_entry("foo").vector == [1, 0]
+        assert reloaded_driver.load_entry("bar").vector == [1, 1]
+
+        reloaded_driver.compact()
+
+        assert len(list(Path(temp_dir).glob("store.json.snapshot-1.*"))) == 4
+        assert not list(Path(temp_dir).glob("store.json.snapshot-0.*"))
+
+    def test_binary_snapshot_to_json(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, snapshot_format="binary"
+        )
+
+        driver.upsert_vector([0, 1], vector_id="foo", meta={"foo": "bar"})
+        driver.compact()
+
+        json_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
+        json_driver.compact()
+
+        assert [path.name for path in Path(temp_dir).iterdir()] == ["store.json"]
+        assert LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file).load_entry(
+            "foo"
+        ).meta == {"foo": "bar"}
+
+    def test_ivf_index_persistence(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        rng = np.random.default_rng(0)
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, ivf_lists=4, ivf_min_rows=10
+        )
+
+        for i in range(20):
+            driver.upsert_vector(rng.normal(size=8).tolist(), vector_id=str(i))
+
+        driver.embedding_driver = MockEmbeddingDriver(mock_output=lambda chunk: [1.0] * 8)
+        driver.query("foo")
+        driver.compact()
+
+        assert os.path.isfile(f"{persist_file}.ivf.npz")
+
+        driver.upsert_vector(rng.normal(size=8).tolist(), vector_id="new")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, ivf_lists=4, ivf_min_rows=10
+        )
+
+        assert new_driver._ivf_index is not None
+        assert new_driver._ivf_index.trained_rows == 20
+        assert new_driver._ivf_index.assigned_rows == 21
+        np.testing.assert_array_equal(new_driver._ivf_index.centroids, driver._ivf_index.centroids)
+
+    def test_quantizer_persistence(self, temp_dir):
+        persist_file = os.path.join(temp_dir, "store.json")
+        rng = np.random.default_rng(0)
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: [1.0] * 8),
+            persist_file=persist_file,
+            snapshot_format="binary",
+            quantization="int8",
+        )
+
+        for i in range(20):
+            driver.upsert_vector(rng.normal(size=8).tolist(), vector_id=str(i))
+
+        driver.query("foo", count=3)
+        driver.compact()
+        driver.upsert_vector(rng.normal(size=8).tolist(), vector_id="new")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(mock_output=lambda chunk: [1.0] * 8),
+            persist_file=persist_file,
+            snapshot_format="binary",
+            quantization="int8",
+        )
+
+        assert new_driver._quantizer.fitted_rows == 20
+        assert new_driver._quantizer.encoded_rows == 21
+        assert [entry.id for entry in new_driver.query("foo", count=3)] == [
+            entry.id for entry in driver.query("foo", count=3)
+        ]
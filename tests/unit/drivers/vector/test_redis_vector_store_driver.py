@@ -48,6 +48,24 @@ class TestRedisVectorStorageDriver:
             == "some_vector_id"
         )
 
+    def test_upsert_vectors(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+
+        assert driver.upsert_vectors([[1.0, 2.0], [3.0, 4.0]], vector_ids=["foo", "bar"], namespace="baz") == [
+            "foo",
+            "bar",
+        ]
+        assert [call.args[0] for call in pipeline.hset.call_args_list] == ["baz:foo", "baz:bar"]
+        pipeline.execute.assert_called_once()
+        mock_client.hset.assert_not_called()
+
+    def test_find_existing_vector_ids(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [1, 0]
+
+        assert driver.find_existing_vector_ids(["foo", "bar"], namespace="baz") == {"foo"}
+        assert [call.args[0] for call in pipeline.exists.call_args_list] == ["baz:foo", "baz:bar"]
+
     def test_load_entry(self, driver, mock_hgetall):
         entry = driver.load_entry("some_vector_id")
         mock_hgetall.assert_called_once_with("some_vector_id")
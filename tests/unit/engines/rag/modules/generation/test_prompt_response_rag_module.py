@@ -4,6 +4,7 @@ from griptape.artifacts import TextArtifact
 from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import PromptResponseRagModule
 from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestPromptResponseRagModule:
@@ -14,6 +15,25 @@ class TestPromptResponseRagModule:
     def test_run(self, module):
         assert module.run(RagContext(query="test")).output.value == "mock output"
 
+    @pytest.mark.parametrize("fitting_chunks", [0, 1, 2, 3])
+    def test_run_includes_chunks_that_fit(self, fitting_chunks):
+        tokenizer = MockTokenizer(model="foo-model")
+        prompt_driver = MockPromptDriver(
+            tokenizer=tokenizer,
+            mock_output=lambda prompt_stack: str(prompt_stack.messages[0].to_text().count("*TEXT SEGMENT")),
+        )
+        module = PromptResponseRagModule(prompt_driver=prompt_driver, answer_token_offset=10)
+        context = RagContext(query="test", text_chunks=[TextArtifact(f"*TEXT SEGMENT {i}*") for i in range(3)])
+
+        def prompt_length(chunk_count):
+            system_prompt = module.generate_system_template(context, context.text_chunks[:chunk_count])
+
+            return len(prompt_driver.prompt_stack_to_string(module.generate_query_prompt_stack(system_prompt, "test")))
+
+        tokenizer.max_input_tokens = prompt_length(fitting_chunks) + 11
+
+        assert module.run(context).output.value == str(fitting_chunks)
+
     def test_prompt(self, module):
         system_message = module.default_system_template_generator(
             RagContext(query="test", before_query=["*RULESET*", "*META*"], after_query=[]),
@@ -59,3 +59,16 @@ class TestCsvLoader:
             assert first_artifact.value["Foo"] == "foo1"
             assert first_artifact.value["Bar"] == "bar1"
             assert first_artifact.embedding == [0, 1]
+
+    def test_load_collection_in_process_pool(self, loader, create_source):
+        sources = [create_source("test-1.csv"), create_source("test-2.csv")]
+        loader.use_process_pool = True
+        loader.use_shared_memory = True
+
+        collection = loader.load_collection(sources)
+
+        assert collection.keys() == {loader.to_key(source) for source in sources}
+        for source in sources:
+            artifacts = collection[loader.to_key(source)]
+            assert [artifact.value for artifact in artifacts] == [artifact.value for artifact in loader.load(source)]
+            assert artifacts[0].embedding == [0, 1]
@@ -1,5 +1,8 @@
+import io
+
 import pytest
 
+from griptape.drivers import LocalVectorStoreDriver
 from griptape.loaders.text_loader import TextLoader
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
@@ -45,3 +48,60 @@ class TestTextLoader:
         artifact = artifacts[0]
         assert artifact.embedding == [0, 1]
         assert artifact.encoding == loader.encoding
+
+    def test_load_collection_timings(self, loader, create_source):
+        sources = [create_source("test.txt")]
+
+        loader.load_collection(sources)
+
+        assert loader.load_timings.keys() == {loader.to_key(source) for source in sources}
+        for timing in loader.load_timings.values():
+            assert 0 <= timing.load_time <= timing.total_time
+
+    @pytest.mark.parametrize("use_shared_memory", [False, True])
+    def test_load_collection_in_process_pool(self, loader, create_source, use_shared_memory):
+        sources = [create_source("test.txt"), "foo bar", "baz " * 100]
+        loader.use_process_pool = True
+        loader.max_processes = 2
+        loader.max_in_flight = 1
+        loader.use_shared_memory = use_shared_memory
+
+        collection = loader.load_collection(sources)
+
+        keys = [loader.to_key(source) for source in sources]
+        assert list(collection.keys()) == keys
+        assert list(loader.load_timings.keys()) == keys
+        for source, key in zip(sources, keys):
+            assert [artifact.value for artifact in collection[key]] == [
+                artifact.value for artifact in loader.load(source)
+            ]
+            assert collection[key][0].embedding == [0, 1]
+            assert collection[key][0].encoding == loader.encoding
+            assert 0 <= loader.load_timings[key].load_time <= loader.load_timings[key].total_time
+
+    def test_load_stream(self, loader, str_from_resource_path):
+        text = str_from_resource_path("test.txt")
+        loader.stream_batch_size = 10
+
+        artifacts = list(loader.load_stream(io.StringIO(text)))
+
+        assert [artifact.value for artifact in artifacts] == [artifact.value for artifact in loader.load(text)]
+        assert artifacts[0].encoding == loader.encoding
+        assert artifacts[0].embedding == [0, 1]
+
+    @pytest.mark.parametrize("namespace", [None, "foo"])
+    def test_load_stream_into_vector_store(self, loader, str_from_resource_path, mocker, namespace):
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+        upsert_text_artifacts_batch = mocker.spy(vector_store_driver, "upsert_text_artifacts_batch")
+        loader.stream_batch_size = 10
+
+        text = str_from_resource_path("test.txt")
+
+        count = loader.load_stream_into_vector_store(io.StringIO(text), vector_store_driver, namespace=namespace)
+
+        assert count == 39
+        assert upsert_text_artifacts_batch.call_count == 4
+        # Repeated chunks share a vector id, so they are only upserted once.
+        assert {entry.to_artifact().value for entry in vector_store_driver.load_entries(namespace=namespace)} == {
+            artifact.value for artifact in loader.load(text)
+        }
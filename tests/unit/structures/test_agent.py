@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from griptape.engines import PromptSummaryEngine
@@ -205,6 +207,25 @@ class TestAgent:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        task = PromptTask("test")
+        agent = Agent(prompt_driver=MockPromptDriver())
+        agent.add_task(task)
+
+        result = asyncio.run(agent.arun())
+
+        assert "mock output" in result.output_task.output.to_text()
+        assert task.state == BaseTask.State.FINISHED
+        assert len(agent.conversation_memory.runs) == 1
+
+    def test_arun_with_tools(self):
+        agent = Agent(prompt_driver=MockPromptDriver(use_native_tools=True), tools=[MockTool()])
+
+        result = asyncio.run(agent.arun("foo"))
+
+        assert result.output_task.output.value == "mock output"
+        assert len(agent.task.subtasks) == 2
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         agent = Agent(prompt_driver=MockPromptDriver())
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 import pytest
@@ -331,6 +332,27 @@ class TestPipeline:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        task1 = PromptTask("test1")
+        task2 = PromptTask("test2")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(), tasks=[task1, task2])
+
+        result = asyncio.run(pipeline.arun())
+
+        assert "mock output" in result.output_task.output.to_text()
+        assert task1.state == BaseTask.State.FINISHED
+        assert task2.state == BaseTask.State.FINISHED
+        assert len(pipeline.conversation_memory.runs) == 1
+
+    def test_arun_with_error_artifact(self, error_artifact_task, waiting_task):
+        end_task = PromptTask("end")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver(), tasks=[error_artifact_task, waiting_task, end_task])
+
+        asyncio.run(pipeline.arun())
+
+        assert pipeline.output is None
+        assert waiting_task.is_pending()
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         pipeline = Pipeline(prompt_driver=MockPromptDriver())
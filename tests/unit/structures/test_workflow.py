@@ -1,4 +1,8 @@
+import asyncio
+import threading
 import time
+from concurrent import futures
+from unittest.mock import patch
 
 import pytest
 
@@ -8,6 +12,7 @@ from griptape.memory.task.storage import TextArtifactStorage
 from griptape.rules import Rule, Ruleset
 from griptape.structures import Workflow
 from griptape.tasks import BaseTask, CodeExecutionTask, PromptTask, ToolkitTask
+from griptape.utils import ExecutionContext
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.mocks.mock_tool.tool import MockTool
@@ -721,6 +726,45 @@ class TestWorkflow:
         assert ordered_tasks[2] == task2 or ordered_tasks[2] == task3
         assert ordered_tasks[3] == task4
 
+    def test_order_tasks_is_cached(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        workflow = Workflow(prompt_driver=MockPromptDriver(), tasks=[task1, task2])
+
+        with patch.object(Workflow, "to_graph", autospec=True, side_effect=Workflow.to_graph) as to_graph:
+            assert workflow.order_tasks() == workflow.order_tasks()
+            assert to_graph.call_count == 1
+
+            task2.add_child(task1)
+            task1.add_parent(task2)
+
+            assert workflow.order_tasks() == [task2, task1]
+            assert workflow.output_task == task1
+
+            task3 = PromptTask("prompt3", id="task3", parent_ids=["task1"])
+            workflow.add_task(task3)
+            task1.add_child(task3)
+
+            assert workflow.output_task == task3
+            assert to_graph.call_count == 3
+            assert workflow.output_task == task3
+            assert to_graph.call_count == 3
+
+    def test_find_task(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        workflow = Workflow(prompt_driver=MockPromptDriver(), tasks=[task1])
+
+        assert workflow.find_task("task1") == task1
+
+        task2.preprocess(workflow)
+        workflow.tasks.append(task2)
+
+        assert workflow.find_task("task2") == task2
+
+        with pytest.raises(ValueError, match="Task with id task3 doesn't exist."):
+            workflow.find_task("task3")
+
     def test_context(self):
         parent = PromptTask("parent")
         task = PromptTask("test")
@@ -776,6 +820,136 @@ class TestWorkflow:
 
         assert workflow.output is not None
 
+    def test_run_submits_children_when_parents_finish(self):
+        finished_task_ids = []
+
+        def fn(delay):
+            def run(task):
+                time.sleep(delay)
+                finished_task_ids.append(task.id)
+
+                return TextArtifact(task.id)
+
+            return run
+
+        slow_task = CodeExecutionTask(run_fn=fn(0.5), id="slow")
+        fast_task = CodeExecutionTask(run_fn=fn(0), id="fast")
+        fast_child_task = CodeExecutionTask(run_fn=fn(0), id="fast_child", parent_ids=["fast"])
+        end_task = CodeExecutionTask(run_fn=fn(0), id="end", parent_ids=["slow", "fast_child"])
+        executors = []
+
+        def futures_executor_fn():
+            executors.append(futures.ThreadPoolExecutor())
+
+            return executors[-1]
+
+        workflow = Workflow(
+            tasks=[slow_task, fast_task, fast_child_task, end_task], futures_executor_fn=futures_executor_fn
+        )
+        workflow.run()
+
+        assert finished_task_ids == ["fast", "fast_child", "slow", "end"]
+        assert len(executors) == 1
+        assert workflow.output.value == "end"
+
+    def test_run_fail_fast_cancels_pending_tasks(self, error_artifact_task):
+        task_ids = []
+
+        def fn(task):
+            task_ids.append(task.id)
+
+            return TextArtifact(task.id)
+
+        tasks = [CodeExecutionTask(run_fn=fn, id=f"task{i}") for i in range(5)]
+        end_task = CodeExecutionTask(run_fn=fn, id="end", parent_ids=[task.id for task in tasks])
+        workflow = Workflow(
+            tasks=[error_artifact_task, *tasks, end_task],
+            futures_executor_fn=lambda: futures.ThreadPoolExecutor(max_workers=1),
+        )
+        workflow.run()
+
+        assert "end" not in task_ids
+        assert end_task.is_pending()
+
+    def test_arun(self):
+        task1 = PromptTask("test1", id="task1")
+        task2 = PromptTask("test2", id="task2", parent_ids=["task1"])
+        task3 = PromptTask("test3", id="task3", parent_ids=["task1"])
+        task4 = PromptTask("test4", id="task4", parent_ids=["task2", "task3"])
+        workflow = Workflow(prompt_driver=MockPromptDriver(), tasks=[task1, task2, task3, task4])
+
+        assert asyncio.run(workflow.arun()) is workflow
+        assert all(task.is_finished() for task in workflow.tasks)
+        assert workflow.output.value == "mock output"
+        assert len(workflow.conversation_memory.runs) == 1
+
+    def test_arun_awaits_tasks_concurrently(self):
+        async def atry_run(driver, prompt_stack):
+            await asyncio.sleep(0.5)
+
+            return driver.try_run(prompt_stack)
+
+        tasks = [PromptTask(f"test{i}") for i in range(20)]
+        workflow = Workflow(prompt_driver=MockPromptDriver(), tasks=tasks)
+
+        with patch.object(MockPromptDriver, "atry_run", atry_run):
+            start = time.perf_counter()
+            asyncio.run(workflow.arun())
+
+        assert time.perf_counter() - start < 5
+        assert all(task.output.value == "mock output" for task in tasks)
+
+    def test_arun_with_error_artifact(self, error_artifact_task, waiting_task):
+        end_task = PromptTask("end")
+        end_task.add_parents([error_artifact_task, waiting_task])
+        workflow = Workflow(prompt_driver=MockPromptDriver(), tasks=[waiting_task, error_artifact_task, end_task])
+
+        asyncio.run(workflow.arun())
+
+        assert workflow.output is None
+        assert end_task.is_pending()
+        assert waiting_task.is_finished()
+
+    def test_arun_with_error_artifact_no_fail_fast(self, error_artifact_task, waiting_task):
+        end_task = PromptTask("end")
+        end_task.add_parents([error_artifact_task, waiting_task])
+        workflow = Workflow(
+            prompt_driver=MockPromptDriver(), tasks=[waiting_task, error_artifact_task, end_task], fail_fast=False
+        )
+
+        asyncio.run(workflow.arun())
+
+        assert workflow.output is not None
+
+    def test_run_with_execution_context(self):
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def mock_output(prompt_stack):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+            return "mock output"
+
+        execution_context = ExecutionContext(max_workers=4, concurrency_limits={"prompt": 2})
+        workflow = Workflow(
+            prompt_driver=MockPromptDriver(mock_output=mock_output),
+            tasks=[PromptTask(f"test{i}") for i in range(8)],
+            execution_context=execution_context,
+        )
+
+        workflow.run()
+
+        assert max(max_running) == 2
+        assert all(task.output.value == "mock output" for task in workflow.tasks)
+        assert execution_context.metrics.completed >= 8
+        assert ExecutionContext.current() is None
+
     @staticmethod
     def _validate_topology_1(workflow) -> None:
         assert len(workflow.tasks) == 4
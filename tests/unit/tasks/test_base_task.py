@@ -1,8 +1,9 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import Mock, patch
 
 import pytest
 
-from griptape.artifacts import TextArtifact
+from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.events.event_listener import EventListener
 from griptape.structures import Agent, Workflow
 from griptape.tasks import ActionsSubtask
@@ -80,3 +81,18 @@ class TestBaseTask:
         task.execute()
 
         assert task.structure.event_listeners[0].handler.call_count == 2
+
+    def test_aexecute(self, task):
+        output = asyncio.run(task.aexecute())
+
+        assert output.value == "foobar"
+        assert task.is_finished()
+        assert task.structure.event_listeners[0].handler.call_count == 2
+
+    def test_aexecute_with_error(self, task):
+        with patch.object(MockTask, "run", side_effect=ValueError("foo")):
+            output = asyncio.run(task.aexecute())
+
+        assert isinstance(output, ErrorArtifact)
+        assert output.value == "foo"
+        assert task.is_finished()
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from griptape.artifacts.image_artifact import ImageArtifact
@@ -21,6 +23,14 @@ class TestPromptTask:
 
         assert task.run().to_text() == "mock output"
 
+    def test_arun(self):
+        task = PromptTask("test")
+        pipeline = Pipeline(prompt_driver=MockPromptDriver())
+
+        pipeline.add_task(task)
+
+        assert asyncio.run(task.arun()).to_text() == "mock output"
+
     def test_to_text(self):
         task = PromptTask("{{ test }}", context={"test": "test value"})
 
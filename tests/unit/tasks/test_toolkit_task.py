@@ -1,3 +1,5 @@
+import asyncio
+
 from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.common import ToolAction
 from griptape.structures import Agent
@@ -184,6 +186,19 @@ class TestToolkitSubtask:
         assert len(task.subtasks) == 1
         assert result.output_task.output.to_text() == "done"
 
+    def test_run_execute_streamed_actions(self, mocker):
+        submit_action = mocker.spy(ActionsSubtask, "submit_action")
+        task = ToolkitTask("test", tools=[MockTool()], execute_streamed_actions=True)
+        agent = Agent(prompt_driver=MockPromptDriver(stream=True, use_native_tools=True))
+
+        agent.add_task(task)
+
+        result = agent.run()
+
+        assert submit_action.call_count == 1
+        assert task.subtasks[0].actions[0].output.value == "ack test-value"
+        assert result.output_task.output.to_text() == "mock output"
+
     def test_run_max_subtasks(self):
         output = 'Actions: [{"tag": "foo", "name": "Tool1", "path": "test", "input": {"values": {"test": "value"}}}]'
 
@@ -197,6 +212,19 @@ class TestToolkitSubtask:
         assert len(task.subtasks) == 3
         assert isinstance(task.output, ErrorArtifact)
 
+    def test_arun_max_subtasks(self):
+        output = 'Actions: [{"tag": "foo", "name": "Tool1", "path": "test", "input": {"values": {"test": "value"}}}]'
+
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")], max_subtasks=3)
+        agent = Agent(prompt_driver=MockPromptDriver(mock_output=output))
+
+        agent.add_task(task)
+
+        asyncio.run(agent.arun())
+
+        assert len(task.subtasks) == 3
+        assert isinstance(task.output, ErrorArtifact)
+
     def test_run_invalid_react_prompt(self):
         output = """foo bar"""
 
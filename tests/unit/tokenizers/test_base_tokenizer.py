@@ -1,5 +1,6 @@
 import logging
 
+from griptape.utils import TokenCountCache
 from tests.mocks.mock_tokenizer import MockTokenizer
 
 
@@ -12,3 +13,32 @@ class TestBaseTokenizer:
             assert tokenizer.max_output_tokens == 1000
 
             assert "gpt2 not found" in caplog.text
+
+    def test_count_tokens_with_token_count_cache(self, mocker):
+        token_count_cache = TokenCountCache()
+        try_count_tokens = mocker.spy(MockTokenizer, "try_count_tokens")
+        tokenizer = MockTokenizer(model="foo", max_input_tokens=10, token_count_cache=token_count_cache)
+        other_tokenizer = MockTokenizer(model="bar", token_count_cache=token_count_cache)
+
+        assert tokenizer.count_tokens("foo bar") == 7
+        assert tokenizer.count_input_tokens_left("foo bar") == 3
+        assert tokenizer.count_output_tokens_left("foo bar") == 993
+        assert other_tokenizer.count_tokens("foo bar") == 7
+
+        assert try_count_tokens.call_count == 2
+        assert token_count_cache.hits == 2
+        assert token_count_cache.misses == 2
+
+    def test_count_tokens_batch(self, mocker):
+        token_count_cache = TokenCountCache()
+        try_count_tokens_batch = mocker.spy(MockTokenizer, "try_count_tokens_batch")
+        tokenizer = MockTokenizer(model="foo", token_count_cache=token_count_cache)
+
+        tokenizer.count_tokens("foo")
+
+        assert tokenizer.count_tokens_batch(["foo", "bar baz", "foo"]) == [3, 7, 3]
+        try_count_tokens_batch.assert_called_once_with(tokenizer, ["bar baz"])
+        assert token_count_cache.hits == 2
+
+    def test_token_offsets(self):
+        assert MockTokenizer(model="foo").token_offsets("foo bar") is None
@@ -1,4 +1,5 @@
 import pytest
+import tiktoken
 
 from griptape.tokenizers import OpenAiTokenizer
 
@@ -30,6 +31,32 @@ class TestOpenAiTokenizer:
     def test_token_count_for_text(self, tokenizer, expected):
         assert tokenizer.count_tokens("foo bar huzzah") == expected
 
+    @pytest.mark.parametrize("tokenizer", ["gpt-4o", "not-a-real-model"], indirect=["tokenizer"])
+    def test_count_tokens_batch(self, tokenizer):
+        texts = ["foo bar huzzah", "", "<|endoftext|> foo"]
+        tokenizer.stop_sequences = ["<|endoftext|>"]
+
+        assert tokenizer.count_tokens_batch(texts) == [tokenizer.count_tokens(text) for text in texts]
+
+    @pytest.mark.parametrize("tokenizer", ["gpt-4o"], indirect=["tokenizer"])
+    def test_encoding_is_resolved_once(self, tokenizer, mocker):
+        encoding_for_model = mocker.spy(tiktoken, "encoding_for_model")
+
+        tokenizer.count_tokens("foo bar huzzah")
+        tokenizer.count_tokens("foo bar huzzah")
+
+        assert tokenizer.encoding is tokenizer.encoding
+        encoding_for_model.assert_called_once_with("gpt-4o")
+
+    @pytest.mark.parametrize("tokenizer", ["gpt-4o", "gpt-3.5-turbo"], indirect=["tokenizer"])
+    @pytest.mark.parametrize("text", ["foo bar huzzah", "", "  foo\n\nbar. <|endoftext|>", "naïve café 日本語 🐍"])
+    def test_token_offsets(self, tokenizer, text):
+        tokenizer.stop_sequences = ["<|endoftext|>"]
+        tokens = tokenizer.encoding.encode(text, allowed_special={"<|endoftext|>"})
+
+        assert tokenizer.token_offsets(text) == tokenizer.encoding.decode_with_offsets(tokens)[1]
+        assert len(tokenizer.token_offsets(text)) == tokenizer.count_tokens(text)
+
     def test_initialize_with_unknown_model(self):
         tokenizer = OpenAiTokenizer(model="not-a-real-model")
         assert tokenizer.max_input_tokens == OpenAiTokenizer.DEFAULT_MAX_TOKENS - OpenAiTokenizer.TOKEN_OFFSET
@@ -0,0 +1,117 @@
+import threading
+import time
+from concurrent import futures
+
+import pytest
+
+from griptape import utils
+from griptape.utils import ExecutionContext
+
+
+class TestExecutionContext:
+    @pytest.fixture()
+    def execution_context(self):
+        execution_context = ExecutionContext(max_workers=2, concurrency_limits={"prompt": 1})
+
+        yield execution_context
+
+        execution_context.shutdown()
+
+    def test_init(self):
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            ExecutionContext(max_workers=0)
+
+    def test_current_executor(self, execution_context):
+        assert ExecutionContext.current() is None
+        assert isinstance(ExecutionContext.current_executor(), futures.ThreadPoolExecutor)
+
+        with execution_context.activate():
+            assert ExecutionContext.current() is execution_context
+            assert not isinstance(ExecutionContext.current_executor(), futures.ThreadPoolExecutor)
+
+            with ExecutionContext.current_executor() as executor:
+                assert executor.submit(ExecutionContext.current).result() is execution_context
+
+        assert ExecutionContext.current() is None
+
+    def test_executor_is_bounded(self, execution_context):
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def fn():
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        with execution_context.executor() as executor:
+            utils.execute_futures_list([executor.submit(fn) for _ in range(6)])
+
+        assert max(max_running) == 2
+        assert execution_context.metrics.completed == 6
+        assert execution_context.metrics.queue_depth == 0
+
+    def test_executor_shutdown(self, execution_context):
+        event = threading.Event()
+        executor = execution_context.executor()
+        other_executor = execution_context.executor()
+
+        blocking_futures = [other_executor.submit(event.wait) for _ in range(2)]
+        future = executor.submit(lambda: "foo")
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        assert future.cancelled()
+        assert not any(blocking_future.cancelled() for blocking_future in blocking_futures)
+        assert execution_context.metrics.queue_depth == 0
+
+        event.set()
+        other_executor.shutdown()
+
+        assert [blocking_future.result() for blocking_future in blocking_futures] == [True, True]
+
+    def test_nested_submit_runs_inline(self):
+        execution_context = ExecutionContext(max_workers=1)
+
+        def outer():
+            with execution_context.executor() as executor:
+                return executor.submit(threading.current_thread).result()
+
+        with execution_context.executor() as executor:
+            thread = executor.submit(outer).result(timeout=5)
+
+        assert thread.name.startswith("griptape")
+        execution_context.shutdown()
+
+    def test_limit(self, execution_context):
+        event = threading.Event()
+        metrics = []
+
+        def fn():
+            with execution_context.limit("prompt"):
+                event.wait()
+
+        with execution_context.executor() as executor:
+            executor.submit(fn)
+            executor.submit(fn)
+
+            while execution_context.metrics.limits["prompt"].waiting < 1:
+                time.sleep(0.01)
+
+            metrics.append(execution_context.metrics)
+            event.set()
+
+        assert metrics[0].active == 2
+        assert metrics[0].utilization == 1.0
+        assert metrics[0].queue_depth == 1
+        assert metrics[0].limits["prompt"] == ExecutionContext.LimitMetrics(limit=1, active=1, waiting=1)
+        assert execution_context.metrics.limits["prompt"].active == 0
+
+    def test_current_limit(self, execution_context):
+        with ExecutionContext.current_limit("prompt"):
+            assert execution_context.metrics.limits["prompt"].active == 0
+
+        with execution_context.activate(), ExecutionContext.current_limit("prompt"):
+            assert execution_context.metrics.limits["prompt"].active == 1
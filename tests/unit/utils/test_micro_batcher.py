@@ -0,0 +1,67 @@
+import threading
+from concurrent import futures
+
+import pytest
+
+from griptape.utils import MicroBatcher
+
+
+class TestMicroBatcher:
+    def test_submit_batches_by_size(self):
+        batches = []
+        batcher = MicroBatcher(
+            process_batch_fn=lambda items: batches.append(items) or [item * 2 for item in items],
+            max_batch_size=2,
+            max_wait=1,
+        )
+
+        submitted_futures = [batcher.submit(item) for item in range(4)]
+
+        assert [future.result(timeout=5) for future in submitted_futures] == [0, 2, 4, 6]
+        assert batches == [[0, 1], [2, 3]]
+
+    def test_submit_batches_by_wait(self):
+        batches = []
+        batcher = MicroBatcher(
+            process_batch_fn=lambda items: batches.append(items) or items, max_batch_size=8, max_wait=0.01
+        )
+
+        assert batcher.submit("foo").result(timeout=5) == "foo"
+        assert batcher.submit("bar").result(timeout=5) == "bar"
+        assert batches == [["foo"], ["bar"]]
+
+    def test_submit_from_many_threads(self):
+        lock = threading.Lock()
+        batch_sizes = []
+
+        def process_batch(items):
+            with lock:
+                batch_sizes.append(len(items))
+
+            return items
+
+        batcher = MicroBatcher(process_batch_fn=process_batch, max_batch_size=4, max_wait=0.05)
+
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda item: batcher.submit(item).result(timeout=5), range(16)))
+
+        assert results == list(range(16))
+        assert sum(batch_sizes) == 16
+        assert max(batch_sizes) <= 4
+
+    def test_submit_shares_exceptions(self):
+        def process_batch(items):
+            raise ValueError("foo")
+
+        batcher = MicroBatcher(process_batch_fn=process_batch, max_batch_size=2, max_wait=1)
+        submitted_futures = [batcher.submit(item) for item in range(2)]
+
+        for future in submitted_futures:
+            with pytest.raises(ValueError, match="foo"):
+                future.result(timeout=5)
+
+    def test_submit_result_count_mismatch(self):
+        batcher = MicroBatcher(process_batch_fn=lambda items: [], max_batch_size=1)
+
+        with pytest.raises(ValueError, match="Expected 1 results, got 0."):
+            batcher.submit("foo").result(timeout=5)
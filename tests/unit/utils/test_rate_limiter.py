@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+from griptape.utils import RateLimiter
+
+
+class TestRateLimiter:
+    @pytest.fixture()
+    def clock(self):
+        return [0.0]
+
+    def test_acquire_requests(self, clock):
+        rate_limiter = RateLimiter(requests_per_minute=2, clock=lambda: clock[0])
+
+        assert rate_limiter.acquire("foo") == 0
+        assert rate_limiter.acquire("foo") == 0
+        assert rate_limiter._wait_time(rate_limiter._buckets["foo"], 0) == 30
+
+        clock[0] = 30
+        assert rate_limiter.acquire("foo") == 0
+
+    def test_acquire_tokens(self, clock):
+        rate_limiter = RateLimiter(tokens_per_minute=600, clock=lambda: clock[0])
+
+        assert rate_limiter.acquire("foo", 1000) == 600
+        assert rate_limiter._wait_time(rate_limiter._buckets["foo"], 100) == 10
+
+        clock[0] = 10
+        assert rate_limiter.acquire("foo", 100) == 100
+
+    def test_keys_are_independent(self, clock):
+        rate_limiter = RateLimiter(requests_per_minute=1, clock=lambda: clock[0])
+
+        rate_limiter.acquire("foo")
+        rate_limiter.acquire("bar")
+
+        assert rate_limiter._wait_time(rate_limiter._buckets["foo"], 0) == 60
+        assert rate_limiter._wait_time(rate_limiter._buckets["bar"], 0) == 60
+
+    def test_reconcile(self, clock):
+        rate_limiter = RateLimiter(tokens_per_minute=600, clock=lambda: clock[0])
+        bucket = rate_limiter._get_bucket("foo")
+
+        rate_limiter.reconcile("foo", rate_limiter.acquire("foo", 100), 400)
+        assert bucket.tokens == 200
+
+        rate_limiter.reconcile("foo", rate_limiter.acquire("foo", 200), 0)
+        assert bucket.tokens == 200
+
+        rate_limiter.reconcile("foo", 0, -1000)
+        assert bucket.tokens == 600
+
+    def test_acquire_blocks_in_order(self):
+        rate_limiter = RateLimiter(requests_per_minute=600)
+        order = []
+        start = time.monotonic()
+
+        for _ in range(600):
+            rate_limiter.acquire("foo")
+
+        def acquire(i):
+            rate_limiter.acquire("foo")
+            order.append(i)
+
+        threads = []
+        for i in range(3):
+            threads.append(threading.Thread(target=acquire, args=(i,)))
+            threads[-1].start()
+
+            while len(rate_limiter._buckets["foo"].waiters) <= i and not order:
+                time.sleep(0.001)
+
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert order == [0, 1, 2]
+        assert time.monotonic() - start >= 0.25
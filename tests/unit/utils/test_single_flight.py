@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+from concurrent import futures
+
+import pytest
+
+from griptape.utils import SingleFlight
+
+
+class TestSingleFlight:
+    @pytest.fixture()
+    def single_flight(self):
+        return SingleFlight()
+
+    def test_do(self, single_flight):
+        assert single_flight.do("foo", lambda: "bar") == ("bar", False)
+        assert single_flight.do("foo", lambda: "baz") == ("baz", False)
+
+    def test_do_coalesces_concurrent_calls(self, single_flight, mocker):
+        event = threading.Event()
+        calls = []
+        join = mocker.spy(SingleFlight, "_join")
+
+        def fn():
+            calls.append(1)
+            event.wait()
+
+            return "bar"
+
+        with futures.ThreadPoolExecutor() as executor:
+            leader = executor.submit(single_flight.do, "foo", fn)
+
+            while not calls:
+
+                time.sleep(0.01)
+
+            followers = [executor.submit(single_flight.do, "foo", fn) for _ in range(3)]
+            other = executor.submit(single_flight.do, "other", lambda: "baz")
+
+            assert other.result() == ("baz", False)
+
+            while len(join.spy_return_list) < 5:
+
+                time.sleep(0.01)
+            event.set()
+
+        assert leader.result() == ("bar", False)
+        assert [follower.result() for follower in followers] == [("bar", True)] * 3
+        assert len(calls) == 1
+
+    def test_do_shares_exceptions(self, single_flight, mocker):
+        event = threading.Event()
+        started = threading.Event()
+        join = mocker.spy(SingleFlight, "_join")
+
+        def fn():
+            started.set()
+            event.wait()
+
+            raise ValueError("foo")
+
+        with futures.ThreadPoolExecutor() as executor:
+            leader = executor.submit(single_flight.do, "foo", fn)
+            started.wait()
+            follower = executor.submit(single_flight.do, "foo", fn)
+
+            while len(join.spy_return_list) < 2:
+
+                time.sleep(0.01)
+            event.set()
+
+        with pytest.raises(ValueError, match="foo"):
+            leader.result()
+        with pytest.raises(ValueError, match="foo"):
+            follower.result()
+        assert single_flight.do("foo", lambda: "bar") == ("bar", False)
+
+    def test_ado(self, single_flight):
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+
+            return "bar"
+
+        async def run():
+            return await asyncio.gather(*(single_flight.ado("foo", fn) for _ in range(3)))
+
+        assert asyncio.run(run()) == [("bar", False), ("bar", True), ("bar", True)]
+        assert len(calls) == 1
@@ -0,0 +1,72 @@
+import pickle
+from concurrent import futures
+
+import pytest
+
+from griptape.utils import TokenCountCache
+
+
+class TestTokenCountCache:
+    def test_get_or_count(self):
+        cache = TokenCountCache()
+        calls = []
+
+        def count():
+            calls.append(1)
+
+            return 5
+
+        assert cache.get_or_count("foo", count) == 5
+        assert cache.get_or_count("foo", count) == 5
+        assert len(calls) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+    def test_get_or_count_evicts_least_recently_used(self):
+        cache = TokenCountCache(max_entries=2)
+
+        cache.get_or_count("foo", lambda: 1)
+        cache.get_or_count("bar", lambda: 2)
+        cache.get_or_count("foo", lambda: 1)
+        cache.get_or_count("baz", lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.get_or_count("foo", lambda: 0) == 1
+        assert cache.get_or_count("bar", lambda: 0) == 0
+
+    def test_get_or_count_from_many_threads(self):
+        cache = TokenCountCache(max_entries=8)
+
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: cache.get_or_count(str(i % 16), lambda: i % 16), range(256)))
+
+        assert results == [i % 16 for i in range(256)]
+        assert len(cache) == 8
+        assert cache.hits + cache.misses == 256
+
+    def test_clear(self):
+        cache = TokenCountCache()
+        cache.get_or_count("foo", lambda: 1)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 0
+        assert cache.misses == 0
+        assert cache.hit_rate == 0.0
+
+    def test_pickle(self):
+        cache = TokenCountCache(max_entries=2)
+        cache.get_or_count("foo", lambda: 1)
+
+        unpickled_cache = pickle.loads(pickle.dumps(cache))
+
+        assert unpickled_cache.max_entries == 2
+        assert unpickled_cache.misses == 1
+        assert unpickled_cache.get_or_count("foo", lambda: 0) == 1
+        assert unpickled_cache.get_or_count("bar", lambda: 2) == 2
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError, match="max_entries must be at least 1"):
+            TokenCountCache(max_entries=0)